@@ -3,7 +3,9 @@ from flask import Flask, jsonify, request
 from dotenv import load_dotenv
 from flask_cors import CORS
 
-from baseline.recommendation_service import recommend_crop
+# Only the lightweight engine handle is imported here; the ML stack
+# loads in the background (or on first use, ENGINE_WARMUP=lazy)
+from baseline.engine import ENGINE_WARMUP, engine
 
 
 # =====================================
@@ -18,9 +20,6 @@ load_dotenv(dotenv_path=ENV_PATH)
 
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
 
-print("Backend starting...")
-print("Weather API loaded:", WEATHER_API_KEY is not None)
-
 
 # =====================================
 # Create Flask App
@@ -29,14 +28,147 @@ print("Weather API loaded:", WEATHER_API_KEY is not None)
 app = Flask(__name__)
 CORS(app)
 
+if ENGINE_WARMUP == "background":
+    engine.start_warm_up()
+
 
 @app.route("/")
 def home():
-    return jsonify({
+
+    response = {
         "status": "Backend running",
         "weather_api_loaded": WEATHER_API_KEY is not None,
+        "engine_status": engine.status(),
         "engine": "Hybrid ML + Monte Carlo + Climate Intelligence v4"
-    })
+    }
+
+    # Stats only once the engine is loaded; / never triggers loading
+    if engine.loaded:
+        from baseline.weather_service import weather_cache_stats
+        from baseline.reference_data import reference_data
+
+        service = engine.service
+
+        response.update({
+            "weather_cache": weather_cache_stats(),
+            "recommendation_cache": service.recommendation_cache.stats(),
+            "inference_batching": service.inference_batcher.stats(),
+            "model": service.model_info(),
+            "reference_data": reference_data.stats()
+        })
+
+    return jsonify(response)
+
+
+# =====================================
+# HEALTH PROBES
+# =====================================
+
+@app.route("/healthz")
+def healthz():
+    """
+    Liveness: the process is up and serving requests.
+    """
+
+    return jsonify({"status": "alive"}), 200
+
+
+@app.route("/readyz")
+def readyz():
+    """
+    Readiness: model loaded and warm-up inference done. A failed
+    warm-up is retried from here.
+    """
+
+    engine.retry_warm_up()
+
+    status = engine.status()
+
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+# =====================================
+# RESPONSE BUILDER
+# =====================================
+
+def build_risk_response(result, selected_crop):
+    """
+    Shapes one engine result into the /risk-analysis response for the
+    selected crop.
+    """
+
+    all_scores = result.get("all_scores", [])
+    weather = result.get("weather", {})
+
+    # Sort scores descending
+    all_scores = sorted(
+        all_scores,
+        key=lambda x: x["confidence_percent"],
+        reverse=True
+    )
+
+    # Top 3 recommendations
+    top_3 = all_scores[:3]
+
+    # Worst recommendation
+    worst = all_scores[-1]
+
+    # Selected crop confidence
+    selected_confidence = 0.0
+    for item in all_scores:
+        if item["crop"].lower() == selected_crop:
+            selected_confidence = item["confidence_percent"]
+            break
+
+    # Risk classification
+    if selected_confidence >= 80:
+        risk_level = "Low"
+    elif selected_confidence >= 60:
+        risk_level = "Medium"
+    elif selected_confidence >= 40:
+        risk_level = "High"
+    else:
+        risk_level = "Critical"
+
+    response = {
+        "weather": {
+            "temperature": weather.get("weekly_avg_temperature"),
+            "humidity": weather.get("weekly_avg_humidity"),
+            "rainfall": weather.get("estimated_monthly_rainfall")
+        },
+
+        "selected_crop": {
+            "crop": selected_crop,
+            "confidence_percent": round(selected_confidence, 2),
+            "risk_level": risk_level
+        },
+
+        "model_recommendation": {
+            "recommended_crop": top_3[0]["crop"],
+            "confidence_percent": round(top_3[0]["confidence_percent"], 2)
+        },
+
+        "top_3_recommendations": [
+            {
+                "crop": item["crop"],
+                "confidence_percent": round(item["confidence_percent"], 2)
+            }
+            for item in top_3
+        ],
+
+        "worst_recommendation": {
+            "crop": worst["crop"],
+            "confidence_percent": round(worst["confidence_percent"], 2)
+        },
+
+        "agronomic_note": result.get("agronomic_note"),
+
+        "engine": result.get("engine"),
+
+        "cache": result.get("cache")
+    }
+
+    return response
 
 
 # =====================================
@@ -64,82 +196,115 @@ def risk_analysis():
         print("Selected Crop:", selected_crop)
 
         # Run Hybrid Recommendation Engine
-        result = recommend_crop(region)
+        result = engine.service.recommend_crop(region, include=[selected_crop])
 
-        all_scores = result.get("all_scores", [])
-        weather = result.get("weather", {})
-
-        if not all_scores:
+        if not result.get("all_scores"):
             return jsonify({"error": "No crop scores returned from engine"}), 500
 
-        # Sort scores descending
-        all_scores = sorted(
-            all_scores,
-            key=lambda x: x["confidence_percent"],
-            reverse=True
-        )
+        response = build_risk_response(result, selected_crop)
 
-        # Top 3 recommendations
-        top_3 = all_scores[:3]
-
-        # Worst recommendation
-        worst = all_scores[-1]
-
-        # Selected crop confidence
-        selected_confidence = 0.0
-        for item in all_scores:
-            if item["crop"].lower() == selected_crop:
-                selected_confidence = item["confidence_percent"]
-                break
-
-        # Risk classification
-        if selected_confidence >= 80:
-            risk_level = "Low"
-        elif selected_confidence >= 60:
-            risk_level = "Medium"
-        elif selected_confidence >= 40:
-            risk_level = "High"
-        else:
-            risk_level = "Critical"
-
-        response = {
-            "weather": {
-                "temperature": weather.get("weekly_avg_temperature"),
-                "humidity": weather.get("weekly_avg_humidity"),
-                "rainfall": weather.get("estimated_monthly_rainfall")
-            },
-
-            "selected_crop": {
-                "crop": selected_crop,
-                "confidence_percent": round(selected_confidence, 2),
-                "risk_level": risk_level
-            },
+        print("===== SUCCESS =====\n")
+        return jsonify(response), 200
+
+    except Exception as e:
+        print("\n===== FULL ERROR =====")
+        print(str(e))
+        print("===== FAILED =====\n")
 
-            "model_recommendation": {
-                "recommended_crop": top_3[0]["crop"],
-                "confidence_percent": round(top_3[0]["confidence_percent"], 2)
-            },
+        return jsonify({"error": str(e)}), 500
 
-            "top_3_recommendations": [
-                {
-                    "crop": item["crop"],
-                    "confidence_percent": round(item["confidence_percent"], 2)
-                }
-                for item in top_3
-            ],
 
-            "worst_recommendation": {
-                "crop": worst["crop"],
-                "confidence_percent": round(worst["confidence_percent"], 2)
-            },
+# =====================================
+# BATCH RISK ANALYSIS ENDPOINT
+# =====================================
 
-            "agronomic_note": result.get("agronomic_note"),
+MAX_BATCH_ITEMS = 200
 
-            "engine": result.get("engine")
-        }
 
-        print("===== SUCCESS =====\n")
-        return jsonify(response), 200
+@app.route("/risk-analysis/batch", methods=["POST"])
+def risk_analysis_batch():
+
+    try:
+        print("\n===== NEW BATCH REQUEST =====")
+
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "No JSON body provided"}), 400
+
+        if not isinstance(data, dict):
+            return jsonify({"error": "JSON body must be an object"}), 400
+
+        items = data.get("items")
+
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "Missing field: items"}), 400
+
+        if len(items) > MAX_BATCH_ITEMS:
+            return jsonify({
+                "error": f"At most {MAX_BATCH_ITEMS} items per batch"
+            }), 400
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or "region" not in item:
+                return jsonify({
+                    "error": f"Missing field: items[{index}].region"
+                }), 400
+
+            if not isinstance(item["region"], str):
+                return jsonify({
+                    "error": f"Invalid field: items[{index}].region must be a string"
+                }), 400
+
+            if not isinstance(item.get("crop", ""), str):
+                return jsonify({
+                    "error": f"Invalid field: items[{index}].crop must be a string"
+                }), 400
+
+        pairs = [
+            (item["region"].strip().lower(), item.get("crop", "").strip().lower())
+            for item in items
+        ]
+
+        print("Items:", len(pairs))
+
+        # One engine pass over the distinct regions
+        selected_by_region = {}
+
+        for region, selected_crop in pairs:
+            selected_by_region.setdefault(region, []).append(selected_crop)
+
+        results_by_region = engine.service.recommend_crops_batch(
+            [region for region, _ in pairs],
+            include=selected_by_region
+        )
+
+        print("Regions:", len(results_by_region))
+
+        responses = []
+
+        for region, selected_crop in pairs:
+            result = results_by_region[region]
+
+            if isinstance(result, BaseException):
+                error = str(result) or type(result).__name__
+            elif not result.get("all_scores"):
+                error = "No crop scores returned from engine"
+            else:
+                responses.append({
+                    "region": region,
+                    **build_risk_response(result, selected_crop)
+                })
+                continue
+
+            responses.append({
+                "region": region,
+                "crop": selected_crop,
+                "error": error
+            })
+
+        print("===== BATCH SUCCESS =====\n")
+        return jsonify({"results": responses}), 200
 
     except Exception as e:
         print("\n===== FULL ERROR =====")
@@ -154,4 +319,7 @@ def risk_analysis():
 # =====================================
 
 if __name__ == "__main__":
+    print("Backend starting...")
+    print("Weather API loaded:", WEATHER_API_KEY is not None)
+
     app.run(host="0.0.0.0", port=5000, debug=True)
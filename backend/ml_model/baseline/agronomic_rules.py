@@ -0,0 +1,217 @@
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from .crop_table import (
+    GROUP_KHARIF,
+    GROUP_RABI,
+    GROUP_TEMPERATE,
+    GROUP_TROPICAL,
+    GROUP_WATER_HEAVY
+)
+
+
+# =====================================
+# RULE CONTEXT
+# =====================================
+
+REGION_CLIMATE_MAP = {
+    "coimbatore": "tropical",
+    "chennai": "tropical",
+    "madurai": "tropical",
+    "delhi": "temperate"
+}
+
+DEFAULT_CLIMATE = "tropical"
+
+# Months (inclusive) of each sowing season window
+SEASON_MONTHS = {
+    "kharif": range(6, 10),
+    "rabi": (10, 11, 12, 1, 2, 3)
+}
+
+# Band edges: weekly temperature above HEAT_STRESS_TEMPERATURE is heat
+# stress, soil pH below ACIDIC_SOIL_PH is acidic
+HEAT_STRESS_TEMPERATURE = 38
+ACIDIC_SOIL_PH = 6
+
+
+def season_for_month(month):
+
+    for season, months in SEASON_MONTHS.items():
+        if month in months:
+            return season
+
+    return None
+
+
+def rule_context(region, soil, weather, month=None):
+    """
+    The discrete inputs the rules depend on:
+    (climate, season, heat stress, acidic soil).
+    """
+
+    return (
+        REGION_CLIMATE_MAP.get(region, DEFAULT_CLIMATE),
+        season_for_month(month or datetime.now().month),
+        weather["weekly_avg_temperature"] > HEAT_STRESS_TEMPERATURE,
+        soil["ph"] < ACIDIC_SOIL_PH
+    )
+
+
+# =====================================
+# RULES
+# =====================================
+
+def rainfall_multiplier(weather):
+    rainfall_factor = min(weather["estimated_monthly_rainfall"] / 120.0, 1.0)
+    return 0.8 + (0.5 * rainfall_factor)
+
+
+# Multipliers that vary continuously with the weather, by name
+WEATHER_FACTORS = {
+    "rainfall": rainfall_multiplier
+}
+
+# Each rule scales the score of the matching crops when every "when"
+# condition holds for the context. "crops" is a crop_table GROUP_*
+# bitmask or a list of crop names; "multiplier" is a number or the
+# name of a WEATHER_FACTORS entry.
+AGRONOMIC_RULES = [
+    {
+        "name": "temperate_crop_in_tropics",
+        "when": {"climate": "tropical"},
+        "crops": GROUP_TEMPERATE,
+        "multiplier": 0.6
+    },
+    {
+        "name": "tropical_crop_in_temperate_zone",
+        "when": {"climate": "temperate"},
+        "crops": GROUP_TROPICAL,
+        "multiplier": 0.6
+    },
+    {
+        "name": "water_heavy_rainfall",
+        "when": {},
+        "crops": GROUP_WATER_HEAVY,
+        "multiplier": "rainfall"
+    },
+    {
+        "name": "tropical_rice",
+        "when": {"climate": "tropical"},
+        "crops": ["rice"],
+        "multiplier": 1.2
+    },
+    {
+        "name": "kharif_season",
+        "when": {"season": "kharif"},
+        "crops": GROUP_KHARIF,
+        "multiplier": 1.1
+    },
+    {
+        "name": "rabi_season",
+        "when": {"season": "rabi"},
+        "crops": GROUP_RABI,
+        "multiplier": 1.1
+    },
+    {
+        "name": "heat_stress",
+        "when": {"heat": True},
+        "crops": ["wheat", "barley"],
+        "multiplier": 0.7
+    },
+    {
+        "name": "acidic_soil",
+        "when": {"acidic": True},
+        "crops": ["chickpea"],
+        "multiplier": 0.85
+    }
+]
+
+CONTEXT_FIELDS = ("climate", "season", "heat", "acidic")
+
+
+# =====================================
+# COMPILATION
+# =====================================
+
+def _crop_mask(table, crops):
+
+    if isinstance(crops, int):
+        return table.in_group(crops)
+
+    names = {crop.lower() for crop in crops}
+
+    return np.array([crop.lower() in names for crop in table.crops])
+
+
+def compile_rules(table, context, rules=AGRONOMIC_RULES):
+    """
+    Folds every rule that applies in context into one multiplier per
+    crop of a CropTable.
+
+    Returns (static, scaled): static is the product of the fixed
+    multipliers, scaled lists (mask, weather factor name) pairs still to
+    be evaluated per request.
+    """
+
+    values = dict(zip(CONTEXT_FIELDS, context))
+
+    static = np.ones(len(table))
+    scaled = []
+
+    for rule in rules:
+
+        if any(values[field] != expected for field, expected in rule["when"].items()):
+            continue
+
+        mask = _crop_mask(table, rule["crops"])
+
+        if not mask.any():
+            continue
+
+        if isinstance(rule["multiplier"], str):
+            scaled.append((mask, rule["multiplier"]))
+        else:
+            static[mask] *= rule["multiplier"]
+
+    static.setflags(write=False)
+
+    return static, tuple(scaled)
+
+
+_compiled_lock = threading.Lock()
+_compiled_rules = {}
+
+
+def rule_multipliers(table, region, soil, weather, month=None):
+    """
+    Per-crop score multipliers (CropTable order) for one request.
+    Compiled rule sets are cached per crop list and context.
+    """
+
+    key = (table.crops, rule_context(region, soil, weather, month))
+    compiled = _compiled_rules.get(key)
+
+    if compiled is None:
+        compiled = compile_rules(table, key[1])
+
+        with _compiled_lock:
+            _compiled_rules[key] = compiled
+
+    static, scaled = compiled
+
+    if not scaled:
+        return static
+
+    multipliers = static.copy()
+
+    for mask, factor in scaled:
+        multipliers[mask] *= WEATHER_FACTORS[factor](weather)
+
+    return multipliers
+
+
+def compiled_rule_stats():
+    return {"compiled_rule_sets": len(_compiled_rules)}
@@ -0,0 +1,248 @@
+import os
+import json
+
+import numpy as np
+
+from .crop_profiles import CROP_PROFILES
+from .reference_data import BACKEND_DIR, reference_data
+
+
+# =====================================
+# CROP KNOWLEDGE SOURCES
+# =====================================
+
+CONSTRAINTS_PATH = os.path.join(BACKEND_DIR, "data", "crop_constraints.json")
+
+CROPS_TABLE = "crops"
+SPOILAGE_TABLE = "crop_spoilage"
+
+# Crop groups used by the agronomic rules
+KHARIF_CROPS = ["rice", "maize"]
+RABI_CROPS = ["barley", "chickpea"]
+
+TEMPERATE_CROPS = ["apple", "pear", "plum"]
+TROPICAL_CROPS = ["banana", "coconut"]
+WATER_HEAVY_CROPS = ["rice", "banana", "sugarcane"]
+
+GROUP_KHARIF = 1
+GROUP_RABI = 2
+GROUP_TEMPERATE = 4
+GROUP_TROPICAL = 8
+GROUP_WATER_HEAVY = 16
+
+RULE_GROUPS = {
+    GROUP_KHARIF: KHARIF_CROPS,
+    GROUP_RABI: RABI_CROPS,
+    GROUP_TEMPERATE: TEMPERATE_CROPS,
+    GROUP_TROPICAL: TROPICAL_CROPS,
+    GROUP_WATER_HEAVY: WATER_HEAVY_CROPS
+}
+
+# Climate zone from crop_constraints.json
+CLIMATE_TROPICAL = 1
+CLIMATE_SUBTROPICAL = 2
+CLIMATE_TEMPERATE = 4
+
+CLIMATE_BITS = {
+    "tropical": CLIMATE_TROPICAL,
+    "subtropical": CLIMATE_SUBTROPICAL,
+    "temperate": CLIMATE_TEMPERATE
+}
+
+# Sowing season from crops.csv
+SEASON_KHARIF = 1
+SEASON_RABI = 2
+SEASON_ANNUAL = 4
+
+SEASON_BITS = {
+    "kharif": SEASON_KHARIF,
+    "rabi": SEASON_RABI,
+    "annual": SEASON_ANNUAL
+}
+
+
+# =====================================
+# COMPILED TABLE
+# =====================================
+
+class CropTable:
+    """
+    Crop facts as one read-only NumPy column per attribute, row i
+    describing crops[i] (normally model.classes_ order).
+
+    Columns:
+    - has_profile, rain_min/max, temp_min/max: CROP_PROFILES bounds
+    - rain_center/spread, temp_center/spread: Gaussian suitability kernel
+    - rule_groups: GROUP_* bitmask for the agronomic rules
+    - climate: CLIMATE_* bitmask, survival_temp_min/max (constraints JSON)
+    - season: SEASON_* bitmask, ph_min/max (crops.csv)
+    - shelf_life_days, storage_temp_min/max (crop_spoilage.csv)
+
+    Missing facts are NaN (floats) or 0 (masks).
+    """
+
+    def __init__(self, crops, columns):
+
+        self.crops = tuple(crops)
+        self.index = {crop: i for i, crop in enumerate(self.crops)}
+        self.columns = tuple(columns)
+
+        for name, values in columns.items():
+            values.setflags(write=False)
+            setattr(self, name, values)
+
+    def __len__(self):
+        return len(self.crops)
+
+    def in_group(self, group):
+        return (self.rule_groups & group) != 0
+
+    def rows(self, crops):
+        """
+        Row index of each crop, -1 for crops not in the table (matched
+        case-insensitively when the table itself is lower-case, as
+        profile_table is).
+        """
+
+        return np.array(
+            [self.index.get(crop, self.index.get(crop.lower(), -1)) for crop in crops],
+            dtype=np.intp
+        )
+
+    def kernel_columns(self, rows=None):
+        """
+        Kernel centers and spreads as column vectors, the layout
+        monte_carlo_service.suitability_columns broadcasts against.
+        rows selects a subset (see rows()) without compiling a new table.
+        """
+
+        select = slice(None) if rows is None else rows
+
+        return {
+            "rain_center": self.rain_center[select, None],
+            "rain_spread": self.rain_spread[select, None],
+            "temp_center": self.temp_center[select, None],
+            "temp_spread": self.temp_spread[select, None]
+        }
+
+    def profile(self, i):
+        """
+        Row i in CROP_PROFILES form, for the scalar viability functions.
+        """
+
+        return {
+            "rainfall_min": float(self.rain_min[i]),
+            "rainfall_max": float(self.rain_max[i]),
+            "temp_min": float(self.temp_min[i]),
+            "temp_max": float(self.temp_max[i])
+        }
+
+
+def _rows_by_crop(df, key):
+    """
+    Lower-cased crop name -> first row of a reference table.
+    """
+
+    rows = {}
+
+    for record in df.to_dict("records"):
+        rows.setdefault(str(record[key]).strip().lower(), record)
+
+    return rows
+
+
+def compile_crop_table(crops, crops_df, spoilage_df, constraints):
+
+    keys = [str(crop).strip().lower() for crop in crops]
+    n = len(keys)
+
+    def floats(values):
+        return np.array(values, dtype=np.float64)
+
+    profiles = [CROP_PROFILES.get(key) for key in keys]
+
+    rain_min = floats([p["rainfall_min"] if p else np.nan for p in profiles])
+    rain_max = floats([p["rainfall_max"] if p else np.nan for p in profiles])
+    temp_min = floats([p["temp_min"] if p else np.nan for p in profiles])
+    temp_max = floats([p["temp_max"] if p else np.nan for p in profiles])
+
+    rule_groups = np.zeros(n, dtype=np.uint8)
+
+    for group, members in RULE_GROUPS.items():
+        rule_groups[[key in members for key in keys]] |= group
+
+    agronomy = _rows_by_crop(crops_df, "crop")
+    spoilage = _rows_by_crop(spoilage_df, "crop_name")
+
+    climate = np.array([
+        CLIMATE_BITS.get(str(constraints.get(key, {}).get("climate", "")).lower(), 0)
+        for key in keys
+    ], dtype=np.uint8)
+
+    season = np.array([
+        SEASON_BITS.get(str(agronomy.get(key, {}).get("season", "")).lower(), 0)
+        for key in keys
+    ], dtype=np.uint8)
+
+    columns = {
+        "has_profile": np.array([p is not None for p in profiles]),
+        "rain_min": rain_min,
+        "rain_max": rain_max,
+        "temp_min": temp_min,
+        "temp_max": temp_max,
+        "rain_center": (rain_min + rain_max) / 2,
+        "rain_spread": (rain_max - rain_min) / 3.0,
+        "temp_center": (temp_min + temp_max) / 2,
+        "temp_spread": (temp_max - temp_min) / 3.0,
+        "rule_groups": rule_groups,
+        "climate": climate,
+        "survival_temp_min": floats([constraints.get(key, {}).get("min_temp", np.nan) for key in keys]),
+        "survival_temp_max": floats([constraints.get(key, {}).get("max_temp", np.nan) for key in keys]),
+        "season": season,
+        "ph_min": floats([agronomy.get(key, {}).get("min_ph", np.nan) for key in keys]),
+        "ph_max": floats([agronomy.get(key, {}).get("max_ph", np.nan) for key in keys]),
+        "shelf_life_days": floats([spoilage.get(key, {}).get("shelf_life_days", np.nan) for key in keys]),
+        "storage_temp_min": floats([spoilage.get(key, {}).get("temp_min", np.nan) for key in keys]),
+        "storage_temp_max": floats([spoilage.get(key, {}).get("temp_max", np.nan) for key in keys])
+    }
+
+    return CropTable(crops, columns)
+
+
+def load_constraints():
+
+    if not os.path.exists(CONSTRAINTS_PATH):
+        return {}
+
+    with open(CONSTRAINTS_PATH) as f:
+        return {key.lower(): value for key, value in json.load(f).items()}
+
+
+def crop_table(crops):
+    """
+    Compiled table for a crop list, cached until crops.csv or
+    crop_spoilage.csv changes.
+
+    Meant for fixed lists such as the model classes. For ad-hoc subsets
+    index an existing table (CropTable.rows) instead of compiling one.
+    """
+
+    crops = tuple(str(crop) for crop in crops)
+
+    return reference_data.view(
+        ("crop_table", crops),
+        lambda crops_df, spoilage_df: compile_crop_table(
+            crops, crops_df, spoilage_df, load_constraints()
+        ),
+        CROPS_TABLE,
+        SPOILAGE_TABLE
+    )
+
+
+def profile_table():
+    """
+    Table of every crop in CROP_PROFILES, lower-cased, for scoring
+    arbitrary crop subsets by row.
+    """
+
+    return crop_table(sorted(CROP_PROFILES))
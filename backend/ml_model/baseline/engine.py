@@ -0,0 +1,161 @@
+import os
+import time
+import threading
+import importlib
+
+
+# =====================================
+# ENGINE SETTINGS
+# =====================================
+
+# "background": load and warm up in a thread when the app starts
+# "lazy": load on the first request that needs the engine
+ENGINE_WARMUP = os.getenv("ENGINE_WARMUP", "background").strip().lower()
+
+# Monte Carlo samples for the warm-up pass
+WARMUP_SIMULATIONS = 500
+
+# Minimum gap before /readyz retries a failed warm-up
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", 10))
+
+
+class LazyEngine:
+    """
+    Defers importing the recommendation engine (NumPy, SciPy, pandas,
+    model artifacts, soil data) until it is first needed, so the web app
+    can answer health checks while it loads.
+
+    ready becomes True once warm_up has run one inference and one
+    Monte Carlo pass, or in lazy mode once the first load succeeds.
+    """
+
+    def __init__(self, module=".recommendation_service", warmup=ENGINE_WARMUP):
+        self.module = module
+        self.warmup = warmup
+
+        self._service = None
+        self._lock = threading.Lock()
+        self._warming = False
+        self._last_attempt = None
+
+        self.ready = False
+        self.error = None
+        self.load_seconds = None
+        self.warmup_seconds = None
+
+    @property
+    def loaded(self):
+        return self._service is not None
+
+    @property
+    def service(self):
+
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    start = time.perf_counter()
+                    self._service = importlib.import_module(self.module, __package__)
+                    self.load_seconds = round(time.perf_counter() - start, 3)
+
+                    # The request that loaded the engine is the warm-up
+                    if self.warmup == "lazy":
+                        self.ready = True
+
+        return self._service
+
+    def warm_up(self):
+        """
+        Loads the engine and runs one dummy inference and one Monte Carlo
+        pass so the first real request does not pay for lazy setup.
+        """
+
+        if self.ready:
+            return
+
+        self._last_attempt = time.monotonic()
+
+        try:
+            service = self.service
+
+            from .feature_compiler import raw_features
+            from .monte_carlo_service import monte_carlo_weather_viability
+            from .viability_grid import viability_grid_batch
+
+            start = time.perf_counter()
+
+            soil = {"N": 50.0, "P": 50.0, "K": 50.0, "ph": 6.5}
+            weather = {
+                "weekly_avg_temperature": 25.0,
+                "weekly_avg_humidity": 70.0,
+                "estimated_monthly_rainfall": 100.0
+            }
+
+            crops, probabilities = service.predict_raw(
+                [raw_features(soil, weather)]
+            )[0]
+
+            crops = [str(crop) for crop in crops]
+
+            monte_carlo_weather_viability(
+                crops[int(probabilities.argmax())],
+                base_rainfall_mm=100.0,
+                base_temperature_c=25.0,
+                simulations=WARMUP_SIMULATIONS
+            )
+            viability_grid_batch(crops, 100.0, 25.0)
+
+            self.warmup_seconds = round(time.perf_counter() - start, 3)
+            self.error = None
+            self.ready = True
+
+        except Exception as e:
+            self.error = str(e)
+            print(f"Engine warm-up failed: {e}")
+
+    def start_warm_up(self):
+        """
+        Runs warm_up in a thread unless the engine is ready or a
+        warm-up is already running. Returns True if one was started.
+        """
+
+        with self._lock:
+            if self.ready or self._warming:
+                return False
+            self._warming = True
+
+        def run():
+            try:
+                self.warm_up()
+            finally:
+                self._warming = False
+
+        threading.Thread(target=run, name="engine-warmup", daemon=True).start()
+
+        return True
+
+    def retry_warm_up(self):
+        """
+        Restarts warm-up after a failure, at most once per
+        WARMUP_RETRY_SECONDS. Called from the readiness probe.
+        """
+
+        if self.ready or self.error is None:
+            return False
+
+        if time.monotonic() - (self._last_attempt or 0.0) < WARMUP_RETRY_SECONDS:
+            return False
+
+        return self.start_warm_up()
+
+    def status(self):
+        return {
+            "loaded": self.loaded,
+            "ready": self.ready,
+            "warming": self._warming,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "error": self.error
+        }
+
+
+engine = LazyEngine()
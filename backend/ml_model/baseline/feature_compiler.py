@@ -0,0 +1,98 @@
+import numpy as np
+
+
+# =====================================
+# FEATURE DEFINITIONS
+# =====================================
+
+# Raw model inputs, in the column order of the training CSV
+RAW_FEATURES = (
+    "N", "P", "K",
+    "temperature",
+    "humidity",
+    "ph",
+    "rainfall"
+)
+
+# Engineered features. Each formula takes a mapping of raw column name
+# to array (NumPy columns or pandas Series) and returns the new column.
+DERIVED_FEATURES = {
+    "temperature_squared": lambda c: c["temperature"] ** 2,
+    "rainfall_log": lambda c: np.log(c["rainfall"] + 1),
+    "nutrient_total": lambda c: c["N"] + c["P"] + c["K"],
+    "np_ratio": lambda c: c["N"] / (c["P"] + 1),
+    "NPK_ratio": lambda c: (c["N"] + c["P"] + 1) / (c["K"] + 1),
+    "nutrient_balance": lambda c: (
+        abs(c["N"] - c["P"]) +
+        abs(c["P"] - c["K"]) +
+        abs(c["N"] - c["K"])
+    ),
+    "climate_index": lambda c: (c["temperature"] * c["humidity"]) / (c["rainfall"] + 1),
+}
+
+# Column order of a freshly trained model (saved as model_features.pkl)
+DEFAULT_FEATURE_ORDER = RAW_FEATURES + tuple(DERIVED_FEATURES)
+
+
+class FeatureCompiler:
+    """
+    Builds the model feature matrix from raw inputs.
+
+    Compiled once for a feature order (model_features.pkl); transform
+    maps an (n, 7) raw matrix in RAW_FEATURES order to the (n, k) matrix
+    in that order, writing each column straight into the output array.
+    """
+
+    def __init__(self, feature_order=DEFAULT_FEATURE_ORDER):
+
+        unknown = [
+            name for name in feature_order
+            if name not in RAW_FEATURES and name not in DERIVED_FEATURES
+        ]
+
+        if unknown:
+            raise ValueError(f"No formula for model features: {unknown}")
+
+        self.feature_order = tuple(feature_order)
+
+        self._raw_index = {name: i for i, name in enumerate(RAW_FEATURES)}
+        self._plan = [
+            (position, name, name in DERIVED_FEATURES)
+            for position, name in enumerate(self.feature_order)
+        ]
+
+    def transform(self, raw):
+
+        raw = np.asarray(raw, dtype=np.float64)
+
+        if raw.ndim == 1:
+            raw = raw[None, :]
+
+        if raw.shape[1] != len(RAW_FEATURES):
+            raise ValueError(
+                f"Expected {len(RAW_FEATURES)} raw columns {RAW_FEATURES}, got {raw.shape[1]}"
+            )
+
+        columns = {name: raw[:, i] for name, i in self._raw_index.items()}
+        output = np.empty((raw.shape[0], len(self._plan)), dtype=np.float64)
+
+        for position, name, derived in self._plan:
+            output[:, position] = DERIVED_FEATURES[name](columns) if derived else columns[name]
+
+        return output
+
+
+def raw_features(soil, weather):
+    """
+    One raw input row (RAW_FEATURES order) from soil and weather dicts.
+    """
+
+    return np.array([
+        float(soil["N"]),
+        float(soil["P"]),
+        float(soil["K"]),
+        float(weather["weekly_avg_temperature"]),
+        float(weather["weekly_avg_humidity"]),
+        float(soil["ph"]),
+        float(weather["estimated_monthly_rainfall"])
+    ])
@@ -0,0 +1,243 @@
+import struct
+import zipfile
+
+import numpy as np
+
+
+def mmap_npz(path):
+    """
+    Read-only memory maps of every array in an uncompressed .npz, so
+    processes loading the same file share its page-cache copy.
+    """
+
+    arrays = {}
+
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} is compressed and cannot be memory-mapped")
+
+            # Local file header: 30 bytes, then file name and extra field
+            f.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", f.read(30)[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+            key = info.filename[:-len(".npy")]
+
+            if shape == ():
+                arrays[key] = np.lib.format.read_array(archive.open(info))
+                continue
+
+            arrays[key] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=f.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C"
+            )
+
+    return arrays
+
+
+# Array names written by FlatForest.to_arrays
+FOREST_ARRAYS = (
+    "feature", "threshold", "left", "right", "roots",
+    "leaf_index", "leaf_values", "classes", "max_depth", "n_features"
+)
+
+
+class FlatForest:
+    """
+    A fitted RandomForestClassifier flattened into contiguous NumPy
+    arrays, evaluated for a whole batch of rows and all trees at once.
+
+    Nodes of every tree live in shared arrays addressed by global index.
+    Each traversal step is one gather over all (row, tree) pairs that
+    have not reached a leaf yet, so the Python loop runs max_depth times
+    at most regardless of batch size or tree count.
+
+    sklearn's compiled traversal still wins on large batches, so
+    ModelBundle sends those to the source model when it has one.
+    """
+
+    def __init__(
+        self, feature, threshold, left, right, roots,
+        leaf_index, leaf_values, classes, max_depth, n_features
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.roots = roots
+        self.leaf_index = leaf_index
+        self.leaf_values = leaf_values
+        self.classes_ = classes
+        self.max_depth = int(max_depth)
+        self.n_features_in_ = int(n_features)
+
+        self.is_leaf = leaf_index >= 0
+
+        # Derived per process, not stored: child of node i is
+        # children[2 * i + go_left], one gather instead of two and a select
+        self.children = np.stack([right, left], axis=1).ravel().astype(np.int32)
+
+        # Inputs are float32, and for a float32 x, x <= t exactly when x is
+        # <= the largest float32 not above t, so compare in float32
+        threshold32 = np.asarray(threshold, dtype=np.float32)
+        rounded_up = threshold32.astype(np.float64) > threshold
+        threshold32[rounded_up] = np.nextafter(threshold32[rounded_up], np.float32(-np.inf))
+        self.threshold32 = threshold32
+
+    @classmethod
+    def from_sklearn(cls, forest):
+
+        features, thresholds, lefts, rights = [], [], [], []
+        roots, leaf_indices, leaf_values = [], [], []
+
+        offset = 0
+        leaf_offset = 0
+        max_depth = 0
+
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left < 0
+
+            # Leaves loop back to themselves so lookups never go out of range
+            left = np.where(is_leaf, nodes, tree.children_left) + offset
+            right = np.where(is_leaf, nodes, tree.children_right) + offset
+
+            values = tree.value[is_leaf, 0, :].astype(np.float64)
+            values /= values.sum(axis=1, keepdims=True)
+
+            leaf_index = np.full(tree.node_count, -1, dtype=np.int32)
+            leaf_index[is_leaf] = np.arange(is_leaf.sum()) + leaf_offset
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            lefts.append(left)
+            rights.append(right)
+            roots.append(offset)
+            leaf_indices.append(leaf_index)
+            leaf_values.append(values)
+
+            offset += tree.node_count
+            leaf_offset += int(is_leaf.sum())
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            left=np.concatenate(lefts).astype(np.int32),
+            right=np.concatenate(rights).astype(np.int32),
+            roots=np.array(roots, dtype=np.int32),
+            leaf_index=np.concatenate(leaf_indices),
+            leaf_values=np.concatenate(leaf_values).astype(np.float32),
+            # Fixed-width strings so the arrays load without pickle
+            classes=np.asarray(forest.classes_, dtype=str),
+            max_depth=max_depth,
+            n_features=forest.n_features_in_
+        )
+
+    def apply(self, X):
+        """
+        Global leaf node reached by every row in every tree, shape
+        (n_rows, n_trees).
+        """
+
+        # sklearn compares float32 inputs against float64 thresholds
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_rows, n_features = X.shape
+
+        if n_features != self.n_features_in_:
+            raise ValueError(
+                f"X has {n_features} features, but FlatForest is expecting "
+                f"{self.n_features_in_} features as input"
+            )
+        n_trees = len(self.roots)
+
+        flat_x = X.ravel()
+
+        # Tree-major pairs: neighbours share a tree and its upper nodes
+        node = np.repeat(self.roots, n_rows)
+        row_offset = np.tile(np.arange(n_rows, dtype=np.int32) * n_features, n_trees)
+
+        pairs = np.arange(node.size)
+        current = node
+
+        # Leaves loop back to themselves, so pairs that finished early can
+        # ride along; the arrays are only compacted once half have stopped
+        while True:
+            go_left = flat_x[row_offset + self.feature[current]] <= self.threshold32[current]
+            current = self.children[2 * current + go_left]
+
+            moving = ~self.is_leaf[current]
+            n_moving = np.count_nonzero(moving)
+
+            if n_moving == 0:
+                node[pairs] = current
+                break
+
+            if n_moving < current.size // 2:
+                done = ~moving
+                node[pairs[done]] = current[done]
+
+                pairs = pairs[moving]
+                current = current[moving]
+                row_offset = row_offset[moving]
+
+        return node.reshape(n_trees, n_rows).T
+
+    def predict_proba(self, X):
+
+        leaves = self.leaf_index[self.apply(X)]
+
+        return self.leaf_values[leaves].mean(axis=1, dtype=np.float64)
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def to_arrays(self):
+        return {
+            "feature": self.feature,
+            "threshold": self.threshold,
+            "left": self.left,
+            "right": self.right,
+            "roots": self.roots,
+            "leaf_index": self.leaf_index,
+            "leaf_values": self.leaf_values,
+            "classes": self.classes_,
+            "max_depth": np.array(self.max_depth),
+            "n_features": np.array(self.n_features_in_)
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Builds a forest from a mapping holding (at least) the to_arrays keys.
+        """
+
+        return cls(**{key: arrays[key] for key in FOREST_ARRAYS})
+
+    def save(self, path):
+        np.savez(path, **self.to_arrays())
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Loads a saved forest. With mmap the node arrays stay in the page
+        cache and are shared by every process that maps the same file.
+        """
+
+        if mmap:
+            return cls.from_arrays(mmap_npz(path))
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls.from_arrays(data)
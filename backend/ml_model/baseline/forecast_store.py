@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+
+# =====================================
+# STORE SETTINGS
+# =====================================
+
+ML_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WEATHER_STORE_PATH = os.getenv(
+    "WEATHER_STORE_PATH",
+    os.path.join(ML_DIR, "weather_store.sqlite3")
+)
+
+# Rows older than this are deleted automatically
+WEATHER_STORE_RETENTION_DAYS = float(os.getenv("WEATHER_STORE_RETENTION_DAYS", 30))
+
+# Minimum gap between two cleanup passes (per process)
+CLEANUP_INTERVAL_SECONDS = 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    region TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    raw_json TEXT NOT NULL,
+    features_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_forecasts_region_time
+    ON forecasts (region, fetched_at DESC);
+"""
+
+
+class ForecastStore:
+    """
+    On-disk forecast history shared by every worker on the host.
+
+    Each fetch appends the raw API payload and the derived weather
+    features. SQLite WAL mode lets readers in other processes proceed
+    while one process writes.
+    """
+
+    def __init__(self, path, retention_days):
+        self.path = path
+        self.retention_seconds = retention_days * 86400
+
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._last_cleanup = 0.0
+
+        self.reads = 0
+        self.read_hits = 0
+        self.writes = 0
+        self.errors = 0
+
+    def _connect(self):
+
+        connection = sqlite3.connect(self.path, timeout=5)
+
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.executescript(SCHEMA)
+                    self._initialized = True
+
+        return connection
+
+    def latest(self, region):
+        """
+        Returns (weather_features, fetched_at) for the newest row of
+        region, or None.
+        """
+
+        self.reads += 1
+
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT features_json, fetched_at FROM forecasts "
+                    "WHERE region = ? ORDER BY fetched_at DESC LIMIT 1",
+                    (region,)
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"Forecast store read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        self.read_hits += 1
+        return json.loads(row[0]), row[1]
+
+    def save(self, region, raw_forecast, weather_features, fetched_at=None):
+
+        fetched_at = fetched_at or time.time()
+
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO forecasts VALUES (?, ?, ?, ?)",
+                        (
+                            region,
+                            fetched_at,
+                            json.dumps(raw_forecast),
+                            json.dumps(weather_features)
+                        )
+                    )
+                    self._cleanup(connection, fetched_at)
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"Forecast store write failed: {e}")
+            return
+
+        self.writes += 1
+
+    def _cleanup(self, connection, now):
+
+        if now - self._last_cleanup < CLEANUP_INTERVAL_SECONDS:
+            return
+
+        self._last_cleanup = now
+        connection.execute(
+            "DELETE FROM forecasts WHERE fetched_at < ?",
+            (now - self.retention_seconds,)
+        )
+
+    def history(self, region, limit=100):
+        """
+        Stored (fetched_at, weather_features) rows for region, newest first.
+        """
+
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT fetched_at, features_json FROM forecasts "
+                "WHERE region = ? ORDER BY fetched_at DESC LIMIT ?",
+                (region, limit)
+            ).fetchall()
+        finally:
+            connection.close()
+
+        return [(fetched_at, json.loads(features)) for fetched_at, features in rows]
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "reads": self.reads,
+            "read_hits": self.read_hits,
+            "writes": self.writes,
+            "errors": self.errors,
+            "retention_days": self.retention_seconds / 86400
+        }
+
+
+forecast_store = (
+    ForecastStore(WEATHER_STORE_PATH, WEATHER_STORE_RETENTION_DAYS)
+    if WEATHER_STORE_PATH else None
+)
@@ -0,0 +1,181 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future, InvalidStateError
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Collects single-row inference requests from concurrent callers and
+    runs them as one batched call.
+
+    A batch closes when max_batch_size rows are queued or max_wait_ms
+    has passed since its first row arrived, whichever comes first. When
+    the queue is empty and the previous batch was a single row (no
+    concurrent traffic), it closes at once, so a lone request does not
+    pay the batching delay.
+
+    predict waits at most timeout seconds for its row. The worker thread
+    is restarted if it ever dies.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=2.0, timeout=10.0):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.timeout = timeout
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        self.batches = 0
+        self.rows = 0
+        self.histogram = {}
+
+        self._last_batch_size = 1
+
+    def _ensure_worker(self):
+
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="inference-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def submit(self, row):
+        """
+        Queues one feature row (1-D array). Returns a Future for its
+        prediction row.
+        """
+
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((np.asarray(row), future))
+
+        return future
+
+    def predict(self, row, timeout=None):
+        """
+        Prediction row for one feature row. Raises TimeoutError when no
+        result arrives within timeout (default self.timeout) seconds.
+        """
+
+        future = self.submit(row)
+
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except TimeoutError:
+            # Not picked up yet: drop it so the worker skips it
+            future.cancel()
+            raise
+
+    def _collect(self):
+
+        batch = [self._queue.get()]
+
+        # Idle: nothing else queued and no recent concurrency to wait for
+        if self._queue.empty() and self._last_batch_size == 1:
+            return batch
+
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    @staticmethod
+    def _resolve(future, result=None, error=None):
+        """
+        Sets one future's outcome, skipping futures the caller has
+        already cancelled.
+        """
+
+        if future.cancelled():
+            return
+
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _run_batch(self, batch):
+
+        futures = [future for _, future in batch]
+
+        try:
+            outputs = list(self.predict_fn(np.vstack([row for row, _ in batch])))
+        except BaseException as e:
+            for future in futures:
+                self._resolve(future, error=e)
+            return
+
+        for future, output in zip(futures, outputs):
+            self._resolve(future, output)
+
+        if len(outputs) != len(futures):
+            error = RuntimeError(
+                f"predict_fn returned {len(outputs)} rows for a batch of {len(futures)}"
+            )
+
+            for future in futures[len(outputs):]:
+                self._resolve(future, error=error)
+
+    def _run(self):
+
+        while True:
+            batch = self._collect()
+            self._last_batch_size = len(batch)
+
+            try:
+                self._run_batch(batch)
+                self._record(len(batch))
+            except BaseException as e:
+                print(f"Inference batcher error: {e}")
+
+                for _, future in batch:
+                    self._resolve(future, error=e)
+
+    def _record(self, size):
+
+        # Power-of-two buckets: 1, 2, 4, 8, ... (upper bound of bucket)
+        bucket = 1 << max(size - 1, 0).bit_length()
+
+        with self._stats_lock:
+            self.batches += 1
+            self.rows += size
+            self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def stats(self):
+
+        with self._stats_lock:
+            return {
+                "batches": self.batches,
+                "rows": self.rows,
+                "mean_batch_size": round(self.rows / self.batches, 2) if self.batches else 0.0,
+                "batch_size_histogram": {
+                    f"<={bucket}": count
+                    for bucket, count in sorted(self.histogram.items())
+                },
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000
+            }
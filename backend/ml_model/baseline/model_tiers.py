@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import warnings
+import subprocess
+
+import joblib
+import numpy as np
+
+from .model_bundle import load_bundle
+
+
+# =====================================
+# TIER DEFINITIONS
+# =====================================
+
+# Forest size / depth per tier. "full" is the original model and keeps
+# the crop_model.pkl file name; the others trade accuracy for latency.
+MODEL_TIERS = {
+    "full": {"n_estimators": 500, "max_depth": None},
+    "trees_150": {"n_estimators": 150, "max_depth": None},
+    "trees_50": {"n_estimators": 50, "max_depth": None},
+    "trees_150_depth_16": {"n_estimators": 150, "max_depth": 16},
+    "trees_50_depth_12": {"n_estimators": 50, "max_depth": 12},
+}
+
+DEFAULT_MODEL_TIER = "full"
+
+TIERS_REPORT_NAME = "model_tiers.json"
+
+
+def validate_tier(tier):
+
+    if tier not in MODEL_TIERS:
+        raise ValueError(
+            f"Unknown model tier '{tier}', expected one of {sorted(MODEL_TIERS)}"
+        )
+
+    return tier
+
+
+def model_path(ml_dir, tier):
+
+    if validate_tier(tier) == "full":
+        return os.path.join(ml_dir, "crop_model.pkl")
+
+    return os.path.join(ml_dir, f"crop_model_{tier}.pkl")
+
+
+def bundle_path(ml_dir, tier):
+    """
+    Versioned serving bundle for a tier (see model_bundle.py).
+    """
+
+    if validate_tier(tier) == "full":
+        return os.path.join(ml_dir, "crop_model.bundle.npz")
+
+    return os.path.join(ml_dir, f"crop_model_{tier}.bundle.npz")
+
+
+# =====================================
+# LOADING
+# =====================================
+
+def load_model(ml_dir, tier=DEFAULT_MODEL_TIER):
+    """
+    Classifier for a tier with predict / predict_proba / classes_, on
+    scaled model features.
+
+    Prefers the memory-mapped forest from the tier's bundle, whose pages
+    are shared by all worker processes; falls back to unpickling the
+    sklearn model, which every process holds a private copy of.
+    """
+
+    path = bundle_path(ml_dir, tier)
+
+    if os.path.exists(path):
+        return load_bundle(path).forest
+
+    return joblib.load(model_path(ml_dir, tier))
+
+
+# =====================================
+# MEASUREMENTS
+# =====================================
+
+def single_row_latency_ms(predict_fn, rows, repeats=200):
+    """
+    Median milliseconds for predict_fn on one row, cycling through rows.
+    """
+
+    timings = []
+
+    # Serving passes bare arrays to a model fitted on a DataFrame
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+
+        predict_fn(rows[:1])
+
+        for i in range(repeats):
+            row = rows[i % len(rows)][None, :]
+
+            start = time.perf_counter()
+            predict_fn(row)
+            timings.append(time.perf_counter() - start)
+
+    return float(np.median(timings) * 1000)
+
+
+_RSS_SCRIPT = """
+import sys
+import joblib
+import sklearn.ensemble
+
+def rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+before = rss_kb()
+model = joblib.load(sys.argv[1])
+print(rss_kb() - before)
+"""
+
+
+def loaded_rss_mb(path):
+    """
+    Resident memory added by loading the pickle, measured in a fresh
+    interpreter with sklearn already imported.
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", _RSS_SCRIPT, path],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+
+    return int(output.strip().splitlines()[-1]) / 1024
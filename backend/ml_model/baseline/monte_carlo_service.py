@@ -1,6 +1,38 @@
-import random
 import math
+from functools import lru_cache
+
+import numpy as np
+from numpy.polynomial.legendre import leggauss
+from scipy.special import ndtr, ndtri
+from scipy.stats import qmc
+
 from .crop_profiles import CROP_PROFILES
+from .crop_table import profile_table
+
+
+# Shared generator so repeated calls do not reseed per request
+_rng = np.random.default_rng()
+
+# Combined scores below this are multiplied by WEAK_SCORE_FACTOR
+WEAK_SCORE_THRESHOLD = 0.4
+WEAK_SCORE_FACTOR = 0.7
+
+QUADRATURE_NODES = 128
+
+VIABILITY_MODES = ("sample", "adaptive", "analytic", "quadrature")
+
+# How the standard normal draws behind each simulation are generated
+SAMPLERS = ("random", "antithetic", "latin_hypercube", "sobol")
+
+# Probability cut-offs between High / Moderate / Low risk
+RISK_THRESHOLDS = (0.45, 0.70)
+
+# Adaptive mode: samples per block, minimum blocks, interval width (z)
+# for the whole run; each look uses a Bonferroni-widened z (see
+# _adaptive_z) so stopping at the first settled look keeps this level
+ADAPTIVE_BLOCK_SIZE = 250
+ADAPTIVE_MIN_BLOCKS = 2
+ADAPTIVE_Z = 1.96
 
 
 # =========================================================
@@ -28,10 +60,451 @@ def gaussian_suitability(value, min_val, max_val):
     return max(0.0, min(score, 1.0))
 
 
+def gaussian_suitability_array(values, min_val, max_val):
+    """
+    Vectorized gaussian_suitability over a NumPy array of values.
+    """
+
+    values = np.asarray(values, dtype=float)
+
+    center = (min_val + max_val) / 2
+    spread = (max_val - min_val) / 3.0
+
+    if spread <= 0:
+        return np.zeros_like(values)
+
+    distance = values - center
+
+    score = np.exp(-(distance ** 2) / (2 * (spread ** 2)))
+
+    return np.clip(score, 0.0, 1.0)
+
+
+def unpenalized_suitability(rain_samples, temp_samples, profile):
+    """
+    0.6 / 0.4 rain-temperature weighting without the weak-score penalty.
+    """
+
+    rain_score = gaussian_suitability_array(
+        rain_samples, profile["rainfall_min"], profile["rainfall_max"]
+    )
+    temp_score = gaussian_suitability_array(
+        temp_samples, profile["temp_min"], profile["temp_max"]
+    )
+
+    return (rain_score * 0.6) + (temp_score * 0.4)
+
+
+def combined_suitability(rain_samples, temp_samples, profile):
+    """
+    Applies the 0.6 / 0.4 rain-temperature weighting and the
+    weak-score penalty to arrays of simulated weather.
+    """
+
+    combined = unpenalized_suitability(rain_samples, temp_samples, profile)
+
+    # Penalize weak overall suitability
+    return np.where(
+        combined < WEAK_SCORE_THRESHOLD,
+        combined * WEAK_SCORE_FACTOR,
+        combined
+    )
+
+
+def profile_arrays(profiles):
+    """
+    Stacks crop profiles into column vectors of Gaussian centers and
+    spreads so a whole crop list can be scored with broadcasting.
+    """
+
+    rain_min = np.array([p["rainfall_min"] for p in profiles], dtype=float)
+    rain_max = np.array([p["rainfall_max"] for p in profiles], dtype=float)
+    temp_min = np.array([p["temp_min"] for p in profiles], dtype=float)
+    temp_max = np.array([p["temp_max"] for p in profiles], dtype=float)
+
+    return {
+        "rain_center": ((rain_min + rain_max) / 2)[:, None],
+        "rain_spread": ((rain_max - rain_min) / 3.0)[:, None],
+        "temp_center": ((temp_min + temp_max) / 2)[:, None],
+        "temp_spread": ((temp_max - temp_min) / 3.0)[:, None]
+    }
+
+
+def _kernel_matrix(values, center, spread):
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.exp(-((values - center) ** 2) / (2 * (spread ** 2)))
+
+    return np.where(spread > 0, np.clip(score, 0.0, 1.0), 0.0)
+
+
+def suitability_matrix(profiles, rain_samples, temp_samples):
+    """
+    Returns a crops x samples matrix of penalized combined scores,
+    evaluating every crop against the same weather draws.
+    """
+
+    return suitability_columns(profile_arrays(profiles), rain_samples, temp_samples)
+
+
+def suitability_columns(arrays, rain_samples, temp_samples):
+    """
+    suitability_matrix for kernel centers and spreads already stacked
+    as column vectors (profile_arrays or CropTable.kernel_columns).
+    """
+
+    rain_score = _kernel_matrix(
+        rain_samples[None, :], arrays["rain_center"], arrays["rain_spread"]
+    )
+    temp_score = _kernel_matrix(
+        temp_samples[None, :], arrays["temp_center"], arrays["temp_spread"]
+    )
+
+    combined = (rain_score * 0.6) + (temp_score * 0.4)
+
+    return np.where(
+        combined < WEAK_SCORE_THRESHOLD,
+        combined * WEAK_SCORE_FACTOR,
+        combined
+    )
+
+
+def classify_viability(probability):
+    moderate, low = RISK_THRESHOLDS
+
+    if probability >= low:
+        return "Low"
+    elif probability >= moderate:
+        return "Moderate"
+    else:
+        return "High"
+
+
+def default_weather_std(base_rainfall_mm, rainfall_std=None, temperature_std=None):
+
+    if rainfall_std is None:
+        rainfall_std = max(base_rainfall_mm * 0.15, 5)
+
+    if temperature_std is None:
+        temperature_std = 1.8
+
+    return rainfall_std, temperature_std
+
+
+# =========================================================
+# SAMPLING-FREE VIABILITY (ANALYTIC / QUADRATURE)
+# =========================================================
+
+def _normal_cdf(x):
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def _normal_pdf(x):
+    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+def _kernel_moment(mean, std, center, spread, clip_at_zero=False):
+    """
+    Closed-form E[exp(-(X - center)^2 / (2 spread^2))] for X ~ N(mean, std^2).
+
+    With clip_at_zero the mass below zero is scored at zero, matching
+    the max(0, rain) clip used by the sampler.
+    """
+
+    if spread <= 0:
+        return 0.0
+
+    total_var = spread ** 2 + std ** 2
+    scale = spread / math.sqrt(total_var)
+    moment = scale * math.exp(-((mean - center) ** 2) / (2 * total_var))
+
+    if not clip_at_zero or std <= 0:
+        return moment
+
+    # Gaussian product: restrict the kernel integral to X > 0
+    post_mean = (mean * spread ** 2 + center * std ** 2) / total_var
+    post_std = spread * std / math.sqrt(total_var)
+
+    positive_part = moment * _normal_cdf(post_mean / post_std)
+    clipped_part = (
+        math.exp(-(center ** 2) / (2 * spread ** 2))
+        * _normal_cdf(-mean / std)
+    )
+
+    return positive_part + clipped_part
+
+
+def _profile_kernels(profile):
+
+    rain_center = (profile["rainfall_min"] + profile["rainfall_max"]) / 2
+    rain_spread = (profile["rainfall_max"] - profile["rainfall_min"]) / 3.0
+    temp_center = (profile["temp_min"] + profile["temp_max"]) / 2
+    temp_spread = (profile["temp_max"] - profile["temp_min"]) / 3.0
+
+    return rain_center, rain_spread, temp_center, temp_spread
+
+
+def unpenalized_expectation(profile, rain_mean, rain_std, temp_mean, temp_std):
+    """
+    Exact mean of unpenalized_suitability under the simulated weather.
+    Used as the control variate for sampled estimates.
+    """
+
+    rain_center, rain_spread, temp_center, temp_spread = _profile_kernels(profile)
+
+    return (
+        0.6 * _kernel_moment(rain_mean, rain_std, rain_center, rain_spread, True)
+        + 0.4 * _kernel_moment(temp_mean, temp_std, temp_center, temp_spread)
+    )
+
+
+def _analytic_viability(profile, rain_mean, rain_std, temp_mean, temp_std):
+    """
+    Closed-form expected score.
+
+    The rain and temperature kernels have exact means and second
+    moments. The weak-score penalty is applied by treating the combined
+    score as normal with those moments.
+    """
+
+    rain_center, rain_spread, temp_center, temp_spread = _profile_kernels(profile)
+
+    # exp(-d^2 / 2s^2) squared is the same kernel with spread s / sqrt(2)
+    rain_m1 = _kernel_moment(rain_mean, rain_std, rain_center, rain_spread, True)
+    rain_m2 = _kernel_moment(
+        rain_mean, rain_std, rain_center, rain_spread / math.sqrt(2), True
+    )
+    temp_m1 = _kernel_moment(temp_mean, temp_std, temp_center, temp_spread)
+    temp_m2 = _kernel_moment(
+        temp_mean, temp_std, temp_center, temp_spread / math.sqrt(2)
+    )
+
+    mean = 0.6 * rain_m1 + 0.4 * temp_m1
+    variance = (
+        0.36 * max(rain_m2 - rain_m1 ** 2, 0.0)
+        + 0.16 * max(temp_m2 - temp_m1 ** 2, 0.0)
+    )
+
+    if variance <= 1e-12:
+        if mean < WEAK_SCORE_THRESHOLD:
+            return mean * WEAK_SCORE_FACTOR
+        return mean
+
+    std = math.sqrt(variance)
+    z = (WEAK_SCORE_THRESHOLD - mean) / std
+
+    # E[S ; S < threshold] for S ~ N(mean, std^2)
+    weak_part = mean * _normal_cdf(z) - std * _normal_pdf(z)
+
+    return mean - (1.0 - WEAK_SCORE_FACTOR) * weak_part
+
+
+@lru_cache(maxsize=8)
+def _probability_rule(nodes):
+    """
+    Gauss-Legendre nodes on the standard normal probability scale,
+    returned as (z-values, weights summing to one).
+    """
+
+    points, weights = leggauss(nodes)
+    return ndtri((points + 1.0) / 2.0), weights / 2.0
+
+
+def _rain_interval_moments(lower, upper, mean, std, center, spread):
+    """
+    Returns (P(lower < X < upper), E[kernel(X) ; lower < X < upper])
+    for X ~ N(mean, std^2) and the rain suitability kernel.
+    """
+
+    upper = np.maximum(upper, lower)
+
+    mass = ndtr((upper - mean) / std) - ndtr((lower - mean) / std)
+
+    total_var = spread ** 2 + std ** 2
+    scale = spread / math.sqrt(total_var)
+    peak = scale * math.exp(-((mean - center) ** 2) / (2 * total_var))
+
+    post_mean = (mean * spread ** 2 + center * std ** 2) / total_var
+    post_std = spread * std / math.sqrt(total_var)
+
+    kernel_mass = peak * (
+        ndtr((upper - post_mean) / post_std)
+        - ndtr((lower - post_mean) / post_std)
+    )
+
+    return mass, kernel_mass
+
+
+def _quadrature_viability(
+    profile, rain_mean, rain_std, temp_mean, temp_std,
+    nodes=QUADRATURE_NODES
+):
+
+    return float(quadrature_viability_curve(
+        profile, rain_mean, rain_std, [temp_mean], temp_std, nodes
+    )[0])
+
+
+def quadrature_viability_curve(
+    profile, rain_mean, rain_std, temp_means, temp_std,
+    nodes=QUADRATURE_NODES
+):
+    """
+    Expected penalized score by quadrature over temperature, for one
+    rainfall mean and an array of temperature means.
+
+    For each temperature node the rain integral is exact: the clip at
+    zero is a point mass and the weak-score penalty applies outside a
+    closed-form interval around the rain center. Nodes sit on the
+    probability scale because the penalty makes the integrand jump.
+    """
+
+    points, weights = _probability_rule(nodes)
+
+    temp = np.asarray(temp_means, dtype=float)[:, None] + temp_std * points
+
+    temp_scores = gaussian_suitability_array(
+        temp, profile["temp_min"], profile["temp_max"]
+    )
+
+    rain_center, rain_spread, _, _ = _profile_kernels(profile)
+
+    if rain_spread <= 0 or rain_std <= 0:
+        rain = np.full_like(temp, max(rain_mean, 0.0))
+        return combined_suitability(rain, temp, profile) @ weights
+
+    temp_part = 0.4 * temp_scores
+
+    # Point mass of rain clipped to zero
+    clipped_mass = ndtr(-rain_mean / rain_std)
+    clipped_score = (
+        0.6 * math.exp(-(rain_center ** 2) / (2 * rain_spread ** 2))
+        + temp_part
+    )
+    clipped_score = np.where(
+        clipped_score < WEAK_SCORE_THRESHOLD,
+        clipped_score * WEAK_SCORE_FACTOR,
+        clipped_score
+    )
+
+    positive_mass, positive_kernel = _rain_interval_moments(
+        0.0, np.inf, rain_mean, rain_std, rain_center, rain_spread
+    )
+
+    expected = (
+        clipped_mass * clipped_score
+        + 0.6 * positive_kernel
+        + temp_part * positive_mass
+    )
+
+    # Rain kernel level below which the combined score is weak
+    level = (WEAK_SCORE_THRESHOLD - temp_part) / 0.6
+    half_width = rain_spread * np.sqrt(
+        -2.0 * np.log(np.clip(level, 1e-300, 1.0))
+    )
+
+    low_mass, low_kernel = _rain_interval_moments(
+        0.0, rain_center - half_width,
+        rain_mean, rain_std, rain_center, rain_spread
+    )
+    high_mass, high_kernel = _rain_interval_moments(
+        np.maximum(rain_center + half_width, 0.0), np.inf,
+        rain_mean, rain_std, rain_center, rain_spread
+    )
+
+    weak_part = (
+        0.6 * (low_kernel + high_kernel)
+        + temp_part * (low_mass + high_mass)
+    )
+
+    expected -= np.where(
+        level > 0, (1.0 - WEAK_SCORE_FACTOR) * weak_part, 0.0
+    )
+
+    return expected @ weights
+
+
+def expected_viability(
+    profile, rain_mean, rain_std, temp_mean, temp_std, mode="analytic"
+):
+    if mode == "analytic":
+        return _analytic_viability(
+            profile, rain_mean, rain_std, temp_mean, temp_std
+        )
+
+    if mode == "quadrature":
+        return _quadrature_viability(
+            profile, rain_mean, rain_std, temp_mean, temp_std
+        )
+
+    raise ValueError(f"Unsupported viability mode: {mode}")
+
+
+# =========================================================
+# SAMPLERS
+# =========================================================
+
+def standard_normal_draws(simulations, sampler="random"):
+    """
+    Returns a (2, simulations) array of standard normal draws for
+    rainfall and temperature.
+
+    - "random": independent pseudo-random draws
+    - "antithetic": each draw is paired with its mirror image
+    - "latin_hypercube": one draw per probability stratum and dimension
+    - "sobol": scrambled Sobol low-discrepancy points
+    """
+
+    if sampler == "random":
+        return _rng.standard_normal((2, simulations))
+
+    if sampler == "antithetic":
+        half = _rng.standard_normal((2, (simulations + 1) // 2))
+        return np.concatenate([half, -half], axis=1)[:, :simulations]
+
+    if sampler == "latin_hypercube":
+        strata = np.arange(simulations) + _rng.random((2, simulations))
+        return ndtri(_rng.permuted(strata / simulations, axis=1))
+
+    if sampler == "sobol":
+        engine = qmc.Sobol(d=2, scramble=True, seed=_rng)
+        points = engine.random_base2(max(math.ceil(math.log2(simulations)), 0))
+        return ndtri(points[:simulations].T)
+
+    raise ValueError(f"Unsupported sampler: {sampler}")
+
+
+def _control_variate_mean(scores, control, control_mean):
+    """
+    Control-variate estimate of the mean of scores, using a control
+    with a known expectation.
+    """
+
+    control_var = float(np.var(control))
+
+    if control_var <= 1e-15:
+        return float(scores.mean())
+
+    beta = float(np.mean((scores - scores.mean()) * (control - control.mean())))
+    beta /= control_var
+
+    return float(scores.mean() - beta * (control.mean() - control_mean))
+
+
 # =========================================================
 # MONTE CARLO WEATHER VIABILITY
 # =========================================================
 
+def _check_simulations(simulations, mode):
+    """
+    Sampling modes need at least one draw; analytic and quadrature
+    ignore simulations.
+    """
+
+    if mode in ("sample", "adaptive") and simulations < 1:
+        raise ValueError(f"simulations must be at least 1 for mode={mode}, got {simulations}")
+
+
 def monte_carlo_weather_viability(
     crop_name: str,
     base_rainfall_mm: float,
@@ -39,7 +512,10 @@ def monte_carlo_weather_viability(
     simulations: int = 2500,
     rainfall_std: float = None,
     temperature_std: float = None,
-    distribution: str = "normal"
+    distribution: str = "normal",
+    mode: str = "sample",
+    sampler: str = "random",
+    control_variate: bool = False
 ):
     """
     Refined 2D Monte Carlo weather viability simulation.
@@ -48,8 +524,27 @@ def monte_carlo_weather_viability(
     - Sharper Gaussian decay
     - Slight penalty for weak combined scores
     - Better crop separation
+    - All samples drawn and scored as NumPy arrays
+
+    mode:
+    - "sample": Monte Carlo draws (default)
+    - "adaptive": draws in blocks until the confidence interval clears
+      every risk threshold, with simulations as the upper limit
+    - "analytic": closed-form expectation, no sampling
+    - "quadrature": numerical integration, no sampling
+
+    sampler and control_variate are variance-reduction options for
+    mode="sample"; see standard_normal_draws and _control_variate_mean.
     """
 
+    if mode not in VIABILITY_MODES:
+        raise ValueError(f"Unsupported viability mode: {mode}")
+
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unsupported sampler: {sampler}")
+
+    _check_simulations(simulations, mode)
+
     crop_key = crop_name.lower()
 
     if crop_key not in CROP_PROFILES:
@@ -62,11 +557,6 @@ def monte_carlo_weather_viability(
 
     profile = CROP_PROFILES[crop_key]
 
-    rain_min = profile["rainfall_min"]
-    rain_max = profile["rainfall_max"]
-    temp_min = profile["temp_min"]
-    temp_max = profile["temp_max"]
-
     if base_rainfall_mm <= 0:
         return {
             "crop": crop_name,
@@ -76,46 +566,295 @@ def monte_carlo_weather_viability(
         }
 
     # Default variability
-    if rainfall_std is None:
-        rainfall_std = max(base_rainfall_mm * 0.15, 5)
+    rainfall_std, temperature_std = default_weather_std(
+        base_rainfall_mm, rainfall_std, temperature_std
+    )
 
-    if temperature_std is None:
-        temperature_std = 1.8
+    if mode == "adaptive":
+        return _adaptive_viability(
+            crop_name,
+            profile,
+            base_rainfall_mm,
+            rainfall_std,
+            base_temperature_c,
+            temperature_std,
+            max_simulations=simulations
+        )
 
-    total_score = 0.0
+    if mode in ("analytic", "quadrature"):
+        probability = round(expected_viability(
+            profile,
+            base_rainfall_mm,
+            rainfall_std,
+            base_temperature_c,
+            temperature_std,
+            mode=mode
+        ), 3)
 
-    for _ in range(simulations):
+        return {
+            "crop": crop_name,
+            "probability": probability,
+            "risk_level": classify_viability(probability),
+            "simulations": 0,
+            "mode": mode
+        }
 
-        # Rainfall simulation
-        simulated_rain = random.gauss(base_rainfall_mm, rainfall_std)
-        simulated_rain = max(0, simulated_rain)
+    estimate = estimate_viability(
+        profile,
+        base_rainfall_mm,
+        rainfall_std,
+        base_temperature_c,
+        temperature_std,
+        simulations,
+        sampler=sampler,
+        control_variate=control_variate
+    )
 
-        # Temperature simulation
-        simulated_temp = random.gauss(base_temperature_c, temperature_std)
+    probability = round(min(max(estimate, 0.0), 1.0), 3)
 
-        rain_score = gaussian_suitability(simulated_rain, rain_min, rain_max)
-        temp_score = gaussian_suitability(simulated_temp, temp_min, temp_max)
+    return {
+        "crop": crop_name,
+        "probability": probability,
+        "risk_level": classify_viability(probability),
+        "simulations": simulations
+    }
+
+
+def estimate_viability(
+    profile, rain_mean, rain_std, temp_mean, temp_std, simulations,
+    sampler="random", control_variate=False
+):
+    """
+    Unrounded sampled estimate of the expected penalized score.
+    """
 
-        combined_score = (rain_score * 0.6) + (temp_score * 0.4)
+    simulated_rain, simulated_temp = _simulate_weather(
+        rain_mean, rain_std, temp_mean, temp_std, simulations, sampler
+    )
 
-        # Penalize weak overall suitability
-        if combined_score < 0.4:
-            combined_score *= 0.7
+    if not control_variate:
+        scores = combined_suitability(simulated_rain, simulated_temp, profile)
+        return float(scores.mean())
 
-        total_score += combined_score
+    control = unpenalized_suitability(simulated_rain, simulated_temp, profile)
+    scores = np.where(
+        control < WEAK_SCORE_THRESHOLD,
+        control * WEAK_SCORE_FACTOR,
+        control
+    )
 
-    probability = round(total_score / simulations, 3)
+    return _control_variate_mean(
+        scores,
+        control,
+        unpenalized_expectation(
+            profile, rain_mean, rain_std, temp_mean, temp_std
+        )
+    )
 
-    if probability >= 0.70:
-        risk_level = "Low"
-    elif probability >= 0.45:
-        risk_level = "Moderate"
-    else:
-        risk_level = "High"
+
+def _simulate_weather(
+    rain_mean, rain_std, temp_mean, temp_std, simulations, sampler="random"
+):
+
+    rain_draws, temp_draws = standard_normal_draws(simulations, sampler)
+
+    # Rainfall simulation
+    simulated_rain = np.maximum(rain_mean + rain_std * rain_draws, 0.0)
+
+    # Temperature simulation
+    simulated_temp = temp_mean + temp_std * temp_draws
+
+    return simulated_rain, simulated_temp
+
+
+def _simulate_scores(
+    profile, rain_mean, rain_std, temp_mean, temp_std, simulations
+):
+
+    simulated_rain, simulated_temp = _simulate_weather(
+        rain_mean, rain_std, temp_mean, temp_std, simulations
+    )
+
+    return combined_suitability(simulated_rain, simulated_temp, profile)
+
+
+def _adaptive_z(max_simulations):
+    """
+    Per-look z for up to ceil(max_simulations / ADAPTIVE_BLOCK_SIZE)
+    interval checks, splitting ADAPTIVE_Z's two-sided error among them.
+    """
+
+    looks = max(math.ceil(max_simulations / ADAPTIVE_BLOCK_SIZE) - ADAPTIVE_MIN_BLOCKS + 1, 1)
+    tail = (1.0 - float(ndtr(ADAPTIVE_Z))) / looks
+
+    return float(ndtri(1.0 - tail))
+
+
+def _adaptive_viability(
+    crop_name, profile, rain_mean, rain_std, temp_mean, temp_std,
+    max_simulations
+):
+    """
+    Simulates in blocks and stops once the standard-error interval
+    no longer straddles a risk threshold, or max_simulations is hit.
+    """
+
+    z = _adaptive_z(max_simulations)
+
+    used = 0
+    total = 0.0
+    total_sq = 0.0
+    blocks = 0
+
+    while used < max_simulations:
+
+        block = min(ADAPTIVE_BLOCK_SIZE, max_simulations - used)
+
+        scores = _simulate_scores(
+            profile, rain_mean, rain_std, temp_mean, temp_std, block
+        )
+
+        used += block
+        total += float(scores.sum())
+        total_sq += float(np.dot(scores, scores))
+        blocks += 1
+
+        mean = total / used
+        variance = max(total_sq / used - mean ** 2, 0.0)
+        half_width = z * math.sqrt(variance / used)
+
+        lower = mean - half_width
+        upper = mean + half_width
+
+        settled = all(
+            not (lower < threshold <= upper)
+            for threshold in RISK_THRESHOLDS
+        )
+
+        if settled and blocks >= ADAPTIVE_MIN_BLOCKS:
+            break
+
+    probability = round(mean, 3)
 
     return {
         "crop": crop_name,
         "probability": probability,
-        "risk_level": risk_level,
-        "simulations": simulations
+        "risk_level": classify_viability(probability),
+        "simulations": used,
+        "mode": "adaptive",
+        "confidence_interval": [
+            round(max(lower, 0.0), 4),
+            round(min(upper, 1.0), 4)
+        ]
     }
+
+
+# =========================================================
+# BATCHED MONTE CARLO (COMMON RANDOM NUMBERS)
+# =========================================================
+
+def monte_carlo_weather_viability_batch(
+    crop_names,
+    base_rainfall_mm: float,
+    base_temperature_c: float,
+    simulations: int = 2500,
+    rainfall_std: float = None,
+    temperature_std: float = None,
+    mode: str = "sample",
+    sampler: str = "random"
+):
+    """
+    Scores a list of crops in one Monte Carlo pass.
+
+    Weather is drawn once and shared by every crop (common random
+    numbers), so crop rankings are not disturbed by sampling noise.
+    With mode="analytic" or "quadrature" no weather is drawn at all;
+    mode="adaptive" sizes each crop's simulation separately.
+
+    Returns:
+        dict: crop name -> same result dict as monte_carlo_weather_viability
+    """
+
+    results = {
+        crop: {
+            "crop": crop,
+            "probability": 0.0,
+            "risk_level": "High",
+            "simulations": simulations
+        }
+        for crop in crop_names
+    }
+
+    if mode not in VIABILITY_MODES:
+        raise ValueError(f"Unsupported viability mode: {mode}")
+
+    _check_simulations(simulations, mode)
+
+    known = [crop for crop in crop_names if crop.lower() in CROP_PROFILES]
+
+    if not known or base_rainfall_mm <= 0:
+        return results
+
+    rainfall_std, temperature_std = default_weather_std(
+        base_rainfall_mm, rainfall_std, temperature_std
+    )
+
+    if mode == "adaptive":
+        for crop in known:
+            results[crop] = monte_carlo_weather_viability(
+                crop,
+                base_rainfall_mm,
+                base_temperature_c,
+                simulations=simulations,
+                rainfall_std=rainfall_std,
+                temperature_std=temperature_std,
+                mode=mode
+            )
+
+        return results
+
+    if mode != "sample":
+        for crop in known:
+            probability = round(expected_viability(
+                CROP_PROFILES[crop.lower()],
+                base_rainfall_mm,
+                rainfall_std,
+                base_temperature_c,
+                temperature_std,
+                mode=mode
+            ), 3)
+            results[crop].update({
+                "probability": probability,
+                "risk_level": classify_viability(probability),
+                "simulations": 0,
+                "mode": mode
+            })
+
+        return results
+
+    simulated_rain, simulated_temp = _simulate_weather(
+        base_rainfall_mm,
+        rainfall_std,
+        base_temperature_c,
+        temperature_std,
+        simulations,
+        sampler
+    )
+
+    # Rows of one shared table; two-stage shortlists differ per request
+    table = profile_table()
+
+    matrix = suitability_columns(
+        table.kernel_columns(table.rows(known)),
+        simulated_rain,
+        simulated_temp
+    )
+
+    probabilities = np.round(matrix.mean(axis=1), 3)
+
+    for crop, probability in zip(known, probabilities):
+        probability = float(probability)
+        results[crop]["probability"] = probability
+        results[crop]["risk_level"] = classify_viability(probability)
+
+    return results
@@ -0,0 +1,163 @@
+import os
+import json
+
+import numpy as np
+
+
+# =====================================
+# ONNX SETTINGS
+# =====================================
+
+# Threads per onnxruntime session; requests already run in parallel
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", 1))
+
+ONNX_OPSET = {"": 17, "ai.onnx.ml": 3}
+
+# Oldest IR version for these opsets, so older onnxruntime builds load it
+ONNX_IR_VERSION = 8
+
+INPUT_NAME = "features"
+OUTPUT_NAME = "probabilities"
+
+
+def _round_down_to_float32(values):
+    """
+    float32 thresholds t with (x <= t) == (x <= value) for every float32 x.
+
+    sklearn compares float32 inputs against float64 thresholds, while the
+    ONNX tree operator compares in float32, so thresholds are rounded down
+    instead of to nearest.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    rounded = values.astype(np.float32)
+
+    above = rounded.astype(np.float64) > values
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+
+    return rounded
+
+
+# =====================================
+# EXPORT
+# =====================================
+
+def build_onnx(model, scaler):
+    """
+    One ONNX graph computing class probabilities from unscaled
+    model features (model_features.pkl order, float64):
+
+        features -> StandardScaler (float64) -> float32 -> forest
+
+    which mirrors what sklearn does, so probabilities match predict_proba
+    up to float32 accumulation.
+    """
+
+    import onnx
+    from onnx import TensorProto, helper
+    from skl2onnx import to_onnx
+    from skl2onnx.common.data_types import DoubleTensorType, FloatTensorType
+
+    n_features = len(scaler.mean_)
+
+    scaler_graph = to_onnx(
+        scaler,
+        initial_types=[(INPUT_NAME, DoubleTensorType([None, n_features]))],
+        target_opset=ONNX_OPSET
+    ).graph
+
+    forest_graph = to_onnx(
+        model,
+        initial_types=[("scaled", FloatTensorType([None, n_features]))],
+        options={id(model): {"zipmap": False}},
+        target_opset=ONNX_OPSET
+    ).graph
+
+    for node in forest_graph.node:
+        if node.op_type != "TreeEnsembleClassifier":
+            continue
+
+        for attribute in node.attribute:
+            if attribute.name == "nodes_values":
+                thresholds = _round_down_to_float32(attribute.floats)
+                del attribute.floats[:]
+                attribute.floats.extend(thresholds.tolist())
+
+    cast = helper.make_node(
+        "Cast",
+        [scaler_graph.output[0].name],
+        ["scaled"],
+        to=TensorProto.FLOAT
+    )
+
+    graph = helper.make_graph(
+        list(scaler_graph.node) + [cast] + list(forest_graph.node),
+        "crop_model",
+        [helper.make_tensor_value_info(INPUT_NAME, TensorProto.DOUBLE, [None, n_features])],
+        [output for output in forest_graph.output if output.name == OUTPUT_NAME],
+        initializer=list(scaler_graph.initializer) + list(forest_graph.initializer)
+    )
+
+    onnx_model = helper.make_model(
+        graph,
+        opset_imports=[
+            helper.make_opsetid(domain, version)
+            for domain, version in ONNX_OPSET.items()
+        ],
+        ir_version=ONNX_IR_VERSION
+    )
+
+    helper.set_model_props(
+        onnx_model,
+        {"classes": json.dumps([str(label) for label in model.classes_])}
+    )
+
+    onnx.checker.check_model(onnx_model)
+
+    return onnx_model.SerializeToString()
+
+
+def export_onnx(model, scaler, path):
+
+    tmp_path = path + ".tmp"
+
+    with open(tmp_path, "wb") as f:
+        f.write(build_onnx(model, scaler))
+
+    os.replace(tmp_path, path)
+
+
+# =====================================
+# INFERENCE
+# =====================================
+
+class OnnxForest:
+    """
+    onnxruntime session for a graph from build_onnx (file path or the
+    serialized bytes). Takes unscaled feature rows and returns
+    probabilities in classes_ order.
+    """
+
+    def __init__(self, source, threads=ONNX_INTRA_OP_THREADS):
+
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = threads
+
+        self.session = onnxruntime.InferenceSession(
+            source, options, providers=["CPUExecutionProvider"]
+        )
+
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.classes_ = np.array(json.loads(metadata["classes"]))
+
+    def predict_proba(self, rows):
+
+        rows = np.ascontiguousarray(rows, dtype=np.float64)
+
+        probabilities = self.session.run(
+            [OUTPUT_NAME], {INPUT_NAME: rows}
+        )[0]
+
+        return probabilities.astype(np.float64)
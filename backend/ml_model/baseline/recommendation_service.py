@@ -1,28 +1,38 @@
 import os
-import math
-import joblib
-import pandas as pd
 from datetime import datetime
 import numpy as np
 
-from .weather_service import get_weather
+from .weather_service import get_weather, get_weather_batch
 from .soil_service import get_soil_data
-from .monte_carlo_service import monte_carlo_weather_viability
-
+from .viability_grid import viability_grid_vector
+from .monte_carlo_service import VIABILITY_MODES, monte_carlo_weather_viability_batch
+from .crop_table import crop_table
+from .agronomic_rules import rule_multipliers
+from .ttl_cache import TTLCache
+from .inference_batcher import MicroBatcher
+from .model_tiers import DEFAULT_MODEL_TIER, bundle_path
+from .model_bundle import BundleWatcher, load_bundle
+from .feature_compiler import RAW_FEATURES, raw_features
+
+
+# Result cache: weather is bucketed so near-identical forecasts share
+# an entry; the month is part of the key for the seasonal rules
+RECOMMENDATION_CACHE_TTL = float(os.getenv("RECOMMENDATION_CACHE_TTL", 900))
+RECOMMENDATION_CACHE_MAX_ENTRIES = int(
+    os.getenv("RECOMMENDATION_CACHE_MAX_ENTRIES", 512)
+)
 
-REGION_CLIMATE_MAP = {
-    "coimbatore": "tropical",
-    "chennai": "tropical",
-    "madurai": "tropical",
-    "delhi": "temperate"
+WEATHER_BUCKETS = {
+    "weekly_avg_temperature": 0.5,
+    "weekly_avg_humidity": 2.0,
+    "estimated_monthly_rainfall": 5.0
 }
 
-KHARIF_CROPS = ["rice", "maize"]
-RABI_CROPS = ["barley", "chickpea"]
-
-TEMPERATE_CROPS = ["apple", "pear", "plum"]
-TROPICAL_CROPS = ["banana", "coconut"]
-WATER_HEAVY_CROPS = ["rice", "banana", "sugarcane"]
+recommendation_cache = TTLCache(
+    ttl=RECOMMENDATION_CACHE_TTL,
+    max_stale=RECOMMENDATION_CACHE_TTL,
+    max_entries=RECOMMENDATION_CACHE_MAX_ENTRIES
+)
 
 
 BASE_DIR = os.path.abspath(
@@ -31,92 +41,142 @@ BASE_DIR = os.path.abspath(
 
 ML_DIR = os.path.join(BASE_DIR, "ml_model")
 
-MODEL_PATH = os.path.join(ML_DIR, "crop_model.pkl")
-FEATURES_PATH = os.path.join(ML_DIR, "model_features.pkl")
-SCALER_PATH = os.path.join(ML_DIR, "scaler.pkl")
-
-model = joblib.load(MODEL_PATH)
-feature_order = joblib.load(FEATURES_PATH)
-scaler = joblib.load(SCALER_PATH)
-
-
-def build_features(soil, weather):
-
-    N = float(soil["N"])
-    P = float(soil["P"])
-    K = float(soil["K"])
-    ph = float(soil["ph"])
-
-    temperature = float(weather["weekly_avg_temperature"])
-    humidity = float(weather["weekly_avg_humidity"])
-    rainfall = float(weather["estimated_monthly_rainfall"])
-
-    features = {
-        "N": N,
-        "P": P,
-        "K": K,
-        "temperature": temperature,
-        "humidity": humidity,
-        "ph": ph,
-        "rainfall": rainfall,
-        "temperature_squared": temperature ** 2,
-        "rainfall_log": math.log(rainfall + 1),
-        "nutrient_total": N + P + K,
-        "np_ratio": N / (P + 1),
-        "NPK_ratio": (N + P + 1) / (K + 1),
-        "nutrient_balance": abs(N - P) + abs(P - K) + abs(N - K),
-        "climate_index": (temperature * humidity) / (rainfall + 1)
+# Forest size served, one of model_tiers.MODEL_TIERS (built by train.py)
+MODEL_TIER = os.getenv("MODEL_TIER", DEFAULT_MODEL_TIER)
+
+BUNDLE_PATH = bundle_path(ML_DIR, MODEL_TIER)
+
+# "forest" (memory-mapped flat forest) or "onnx" (onnxruntime, needs a
+# bundle trained with skl2onnx installed)
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "forest").strip().lower()
+
+# Seconds between checks for a retrained bundle (0 disables hot reload)
+MODEL_RELOAD_INTERVAL = float(os.getenv("MODEL_RELOAD_INTERVAL", 30))
+
+
+def load_serving_bundle(path):
+    """
+    Loads a bundle and runs one prediction before it can take traffic.
+    """
+
+    if INFERENCE_BACKEND not in ("forest", "onnx"):
+        raise ValueError(f"Unknown inference backend: {INFERENCE_BACKEND}")
+
+    bundle = load_bundle(path, onnx=INFERENCE_BACKEND == "onnx")
+    bundle.predict_proba(np.zeros(len(RAW_FEATURES)))
+
+    # Load the large-batch model now rather than on the first big request
+    if bundle.onnx is None:
+        bundle.sklearn_model()
+
+    return bundle
+
+
+active_bundle = load_serving_bundle(BUNDLE_PATH)
+
+
+def swap_bundle(bundle):
+    """
+    Makes a newly loaded bundle active. Calls already running keep the
+    bundle they started with.
+    """
+
+    global active_bundle
+
+    previous = active_bundle
+    active_bundle = bundle
+
+    # Keys carry the version, so this only frees the old entries
+    recommendation_cache.clear()
+
+    print(f"Model bundle swapped: {previous.version} -> {bundle.version}")
+
+
+bundle_watcher = BundleWatcher(
+    BUNDLE_PATH,
+    load_serving_bundle,
+    swap_bundle,
+    MODEL_RELOAD_INTERVAL
+)
+bundle_watcher.start()
+
+
+def model_info():
+    bundle = active_bundle
+
+    return {
+        "tier": MODEL_TIER,
+        "backend": INFERENCE_BACKEND,
+        "ranking": RANKING_MODE,
+        **bundle.info(),
+        "mmap": isinstance(bundle.forest.feature, np.memmap),
+        "hot_reload": bundle_watcher.stats()
     }
 
-    df = pd.DataFrame([features])
-    df = df[feature_order]
 
-    return df
+def predict_raw(rows):
+    """
+    (classes, probabilities) for each raw input row (RAW_FEATURES order).
 
+    The whole call uses one bundle, so a swap in the middle cannot pair
+    probabilities with another model's classes.
+    """
 
-def apply_agronomic_rules(scores, soil, weather, region):
+    bundle = active_bundle
+    probabilities = bundle.predict_proba(rows)
+
+    return [(bundle.classes_, row) for row in probabilities]
 
-    rainfall = weather["estimated_monthly_rainfall"]
-    temperature = weather["weekly_avg_temperature"]
-    ph = soil["ph"]
 
-    climate = REGION_CLIMATE_MAP.get(region, "tropical")
-    current_month = datetime.now().month
+# Concurrent single-region requests share predict_proba calls
+INFERENCE_MAX_BATCH = int(os.getenv("INFERENCE_MAX_BATCH", 32))
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", 2))
 
-    adjusted = scores.copy()
+# Longest a request waits for its batched prediction
+INFERENCE_TIMEOUT = float(os.getenv("INFERENCE_TIMEOUT", 10))
 
-    rainfall_factor = min(rainfall / 120.0, 1.0)
-    rainfall_multiplier = 0.8 + (0.5 * rainfall_factor)
+inference_batcher = MicroBatcher(
+    predict_raw,
+    max_batch_size=INFERENCE_MAX_BATCH,
+    max_wait_ms=INFERENCE_MAX_WAIT_MS,
+    timeout=INFERENCE_TIMEOUT
+)
 
-    for crop in adjusted:
 
-        crop_lower = crop.lower()
+# "full": viability, explanations and normalization for every crop
+# "two_stage": rank every crop by ML probability, rules and the
+# viability grid, then compute precise viability, explanations and
+# normalization only for the top TWO_STAGE_TOP_K, the bottom
+# TWO_STAGE_BOTTOM_K and any crops the caller names
+RANKING_MODE = os.getenv("RANKING_MODE", "full").strip().lower()
+TWO_STAGE_TOP_K = int(os.getenv("TWO_STAGE_TOP_K", 6))
 
-        if climate == "tropical" and crop_lower in TEMPERATE_CROPS:
-            adjusted[crop] *= 0.6
+# Bottom crops kept for worst_crop; zero-probability crops often land
+# within rounding of each other, so one is not enough
+TWO_STAGE_BOTTOM_K = int(os.getenv("TWO_STAGE_BOTTOM_K", 2))
 
-        if climate == "temperate" and crop_lower in TROPICAL_CROPS:
-            adjusted[crop] *= 0.6
+# Viability mode for the crops that reach the second stage
+TWO_STAGE_VIABILITY_MODE = os.getenv("TWO_STAGE_VIABILITY_MODE", "quadrature")
 
-        if crop_lower in WATER_HEAVY_CROPS:
-            adjusted[crop] *= rainfall_multiplier
+if RANKING_MODE not in ("full", "two_stage"):
+    raise ValueError(f"Unknown ranking mode: {RANKING_MODE}")
 
-        if climate == "tropical" and crop_lower == "rice":
-            adjusted[crop] *= 1.2
+if TWO_STAGE_VIABILITY_MODE not in VIABILITY_MODES:
+    raise ValueError(f"Unknown viability mode: {TWO_STAGE_VIABILITY_MODE}")
 
-        if 6 <= current_month <= 9 and crop_lower in KHARIF_CROPS:
-            adjusted[crop] *= 1.1
 
-        if (current_month >= 10 or current_month <= 3) and crop_lower in RABI_CROPS:
-            adjusted[crop] *= 1.1
+def apply_agronomic_rules(scores, soil, weather, region):
+    """
+    Applies the agronomic rules (agronomic_rules.AGRONOMIC_RULES) to a
+    crop -> score dict.
+    """
 
-        if temperature > 38 and crop_lower in ["wheat", "barley"]:
-            adjusted[crop] *= 0.7
+    table = crop_table(list(scores))
 
-        if ph < 6 and crop_lower == "chickpea":
-            adjusted[crop] *= 0.85
+    adjusted = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    adjusted *= rule_multipliers(table, region, soil, weather)
 
-    return adjusted
+    return dict(zip(scores, adjusted.tolist()))
 
 
 def interpret_confidence(score):
@@ -160,45 +220,211 @@ def generate_explanation(crop, soil, weather, mc_score):
     return reasons
 
 
-def recommend_crop(region: str):
+def normalize_include(include):
+    return tuple(sorted({crop.lower().strip() for crop in include or () if crop}))
+
+
+def recommendation_cache_key(region, weather, month=None, include=()):
+
+    buckets = tuple(
+        round(float(weather[field]) / step)
+        for field, step in WEATHER_BUCKETS.items()
+    )
+
+    # Named crops only change the result when not every crop is scored
+    include = include if RANKING_MODE == "two_stage" else ()
+
+    return active_bundle.version, region, buckets, month or datetime.now().month, include
+
+
+def recommend_crop(region: str, include=()):
+    """
+    Cached hybrid recommendation for a region. The result carries
+    "cache": "hit" or "miss".
+
+    include names crops that must be fully scored in two-stage ranking
+    (e.g. the crop the user selected).
+    """
 
     region = region.lower().strip()
+    include = normalize_include(include)
 
-    soil = get_soil_data(region)
     weather = get_weather(region)
 
-    features = build_features(soil, weather)
-    features_scaled = scaler.transform(features)
+    key = recommendation_cache_key(region, weather, include=include)
+    cached = recommendation_cache.lookup(key)
+
+    if cached is not None:
+        return {**cached[0], "cache": "hit"}
+
+    soil = get_soil_data(region)
 
-    ml_probabilities = model.predict_proba(features_scaled)[0]
-    crop_classes = model.classes_
+    result = build_recommendation(region, soil, weather, include)
+    recommendation_cache.store(key, result)
 
-    combined_scores = {}
-    mc_scores = {}
+    return {**result, "cache": "miss"}
 
-    for crop, ml_prob in zip(crop_classes, ml_probabilities):
 
-        mc = monte_carlo_weather_viability(
-            crop_name=crop,
-            base_rainfall_mm=weather["estimated_monthly_rainfall"],
-            base_temperature_c=weather["weekly_avg_temperature"]
+def recommend_crops_batch(regions, include=None):
+    """
+    Recommendations for many regions in one pass.
+
+    Weather is fetched concurrently, cached results are reused, and the
+    remaining regions share a single stacked predict_proba call.
+    include optionally maps a region to crops that must be fully scored
+    (see recommend_crop).
+
+    Returns:
+        dict: normalized region -> result dict (as recommend_crop), or
+        the exception raised for that region
+    """
+
+    keys = list(dict.fromkeys(region.lower().strip() for region in regions))
+
+    include_by_region = {
+        region.lower().strip(): normalize_include(crops)
+        for region, crops in (include or {}).items()
+    }
+
+    weather_by_region = get_weather_batch(keys)
+
+    results = {}
+    pending = []
+
+    for region in keys:
+        weather = weather_by_region[region]
+
+        if isinstance(weather, BaseException):
+            results[region] = weather
+            continue
+
+        cached = recommendation_cache.lookup(
+            recommendation_cache_key(
+                region, weather, include=include_by_region.get(region, ())
+            )
         )
 
-        mc_score = mc["probability"]
-        mc_scores[crop] = mc_score
+        if cached is not None:
+            results[region] = {**cached[0], "cache": "hit"}
+            continue
+
+        try:
+            soil = get_soil_data(region)
+            pending.append((region, soil, weather, raw_features(soil, weather)))
+        except Exception as e:
+            results[region] = e
+
+    if pending:
+        predictions = predict_raw(np.vstack([row[3] for row in pending]))
+
+        for (region, soil, weather, _), (crop_classes, ml_probabilities) in zip(
+            pending, predictions
+        ):
+            region_include = include_by_region.get(region, ())
+
+            result = score_recommendation(
+                region, soil, weather, ml_probabilities, crop_classes,
+                include=region_include
+            )
+            recommendation_cache.store(
+                recommendation_cache_key(region, weather, include=region_include),
+                result
+            )
+            results[region] = {**result, "cache": "miss"}
+
+    return results
+
+
+def build_recommendation(region, soil, weather, include=()):
+
+    crop_classes, ml_probabilities = inference_batcher.predict(
+        raw_features(soil, weather)
+    )
+
+    return score_recommendation(
+        region, soil, weather, ml_probabilities, crop_classes, include=include
+    )
+
+
+def two_stage_candidates(prescores, crops, top_k, include=()):
+    """
+    Crop rows (ascending) that reach the second stage: the top_k
+    highest and TWO_STAGE_BOTTOM_K lowest prescores plus the named crops.
+    """
 
-        ml_component = math.log(ml_prob + 1e-6) + 6
-        risk_modifier = 0.7 + 0.6 * mc_score
+    top_k = min(top_k, len(prescores))
+    bottom_k = min(TWO_STAGE_BOTTOM_K, len(prescores))
 
-        final_score = ml_component * risk_modifier
+    candidates = set(np.argpartition(-prescores, top_k - 1)[:top_k].tolist())
+    candidates.update(np.argpartition(prescores, bottom_k - 1)[:bottom_k].tolist())
+    candidates.update(crops.index[crop] for crop in include if crop in crops.index)
 
-        combined_scores[crop] = final_score
+    return np.array(sorted(candidates), dtype=np.intp)
 
-    adjusted_scores = apply_agronomic_rules(
-        combined_scores, soil, weather, region
+
+def score_recommendation(
+    region, soil, weather, ml_probabilities, crop_classes,
+    include=(), ranking=None, top_k=None, viability_mode=None
+):
+    """
+    Combines model probabilities (in crop_classes order) with climate
+    viability and agronomic rules into the ranked recommendation.
+
+    ranking, top_k and viability_mode default to RANKING_MODE,
+    TWO_STAGE_TOP_K and the grid ("full") or TWO_STAGE_VIABILITY_MODE
+    ("two_stage"). In two-stage ranking all_scores only lists the crops
+    that reached the second stage, normalized among themselves.
+    """
+
+    ranking = ranking or RANKING_MODE
+    rainfall = weather["estimated_monthly_rainfall"]
+    temperature = weather["weekly_avg_temperature"]
+
+    crops = crop_table(crop_classes)
+
+    ml_component = np.log(np.asarray(ml_probabilities, dtype=np.float64) + 1e-6) + 6
+
+    # Compiled rule multipliers for this context, one per crop
+    multipliers = rule_multipliers(crops, region, soil, weather)
+
+    viability_mode = viability_mode or (
+        "grid" if ranking == "full" else TWO_STAGE_VIABILITY_MODE
     )
 
-    values = np.array(list(adjusted_scores.values()))
+    names = list(crops.crops)
+
+    if ranking == "two_stage":
+        # Stage one: every crop, with interpolated viability
+        prescores = (
+            ml_component
+            * (0.7 + 0.6 * viability_grid_vector(crops, rainfall, temperature))
+            * multipliers
+        )
+        rows = two_stage_candidates(
+            prescores, crops, top_k or TWO_STAGE_TOP_K, include
+        )
+        names = [names[i] for i in rows]
+
+        ml_component = ml_component[rows]
+        multipliers = multipliers[rows]
+
+    if viability_mode == "grid":
+        # Precomputed viability table, interpolated for every crop at once
+        mc_vector = viability_grid_vector(crops, rainfall, temperature)
+
+        if ranking == "two_stage":
+            mc_vector = mc_vector[rows]
+    else:
+        mc_results = monte_carlo_weather_viability_batch(
+            names, rainfall, temperature, mode=viability_mode
+        )
+        mc_vector = np.array([mc_results[crop]["probability"] for crop in names])
+
+    risk_modifier = 0.7 + 0.6 * mc_vector
+
+    mc_scores = dict(zip(names, mc_vector.tolist()))
+
+    values = ml_component * risk_modifier * multipliers
 
     min_val = np.min(values)
     max_val = np.max(values)
@@ -210,7 +436,7 @@ def recommend_crop(region: str):
 
     scaled_scores = {
         crop: round(5 + norm * 90, 2)
-        for crop, norm in zip(adjusted_scores.keys(), normalized)
+        for crop, norm in zip(names, normalized)
     }
 
     sorted_scores = sorted(
@@ -222,7 +448,7 @@ def recommend_crop(region: str):
     top_3 = sorted_scores[:3]
     worst_crop = sorted_scores[-1][0]
 
-    return {
+    result = {
         "region": region,
         "weather": weather,
         "all_scores": [
@@ -251,3 +477,13 @@ def recommend_crop(region: str):
         "agronomic_note": "Hybrid ML probability, climate risk simulation, and agronomic rules applied.",
         "engine": "Hybrid ML + Monte Carlo + Explainable Calibration vHackathon"
     }
+
+    if ranking == "two_stage":
+        result["ranking"] = {
+            "mode": "two_stage",
+            "viability_mode": viability_mode,
+            "evaluated": len(names),
+            "screened_out": len(crops) - len(names)
+        }
+
+    return result
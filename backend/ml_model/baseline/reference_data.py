@@ -0,0 +1,270 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+# =====================================
+# REFERENCE DATA SETTINGS
+# =====================================
+
+BACKEND_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+
+DATA_DIR = os.path.join(BACKEND_DIR, "data", "raw")
+
+# Parsed tables, one .npz per table and content hash
+REFERENCE_CACHE_DIR = os.getenv(
+    "REFERENCE_CACHE_DIR",
+    os.path.join(BACKEND_DIR, "data", "cache")
+)
+
+# Seconds between mtime checks of a source CSV (0 checks on every access)
+REFERENCE_RELOAD_INTERVAL = float(os.getenv("REFERENCE_RELOAD_INTERVAL", 5))
+
+# Derived views kept per process, least recently used dropped first
+REFERENCE_MAX_VIEWS = int(os.getenv("REFERENCE_MAX_VIEWS", 64))
+
+CACHE_FORMAT_VERSION = 1
+
+
+# =====================================
+# BINARY TABLE CACHE
+# =====================================
+
+def _content_hash(path):
+
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_table_cache(path, df):
+    """
+    Stores a parsed table as an uncompressed .npz: one typed array per
+    column, string columns as fixed-width unicode with a null mask, and
+    the column names and pandas dtypes as JSON. No pickles.
+    """
+
+    arrays = {}
+    kinds = []
+
+    for i, column in enumerate(df.columns):
+        values = df[column]
+
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            nulls = values.isna().to_numpy()
+            arrays[f"c{i}"] = np.where(nulls, "", values.astype(str)).astype(str)
+            arrays[f"m{i}"] = nulls
+            kinds.append("str")
+        else:
+            arrays[f"c{i}"] = values.to_numpy()
+            kinds.append("num")
+
+    arrays["metadata"] = np.array(json.dumps({
+        "format": CACHE_FORMAT_VERSION,
+        "columns": [str(column) for column in df.columns],
+        "kinds": kinds,
+        "dtypes": [str(dtype) for dtype in df.dtypes]
+    }))
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+
+    os.replace(tmp_path, path)
+
+
+def read_table_cache(path):
+
+    with np.load(path, allow_pickle=False) as data:
+        metadata = json.loads(str(data["metadata"]))
+
+        if metadata["format"] != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported reference cache format in {path}")
+
+        columns = {}
+
+        for i, column in enumerate(metadata["columns"]):
+            values = data[f"c{i}"]
+
+            if metadata["kinds"][i] == "str":
+                values = values.astype(object)
+                values[data[f"m{i}"]] = np.nan
+                values = pd.Series(values, dtype=metadata["dtypes"][i])
+
+            columns[column] = values
+
+    return pd.DataFrame(columns, columns=metadata["columns"])
+
+
+# =====================================
+# STORE
+# =====================================
+
+class _Table:
+
+    def __init__(self, signature, digest, frame):
+        self.signature = signature
+        self.digest = digest
+        self.frame = frame
+        self.checked_at = time.monotonic()
+
+
+class ReferenceDataStore:
+    """
+    Parses each reference CSV once per process and shares the frame.
+
+    A table is read from the binary cache when one exists for the file's
+    content hash, otherwise parsed with pandas and cached. Source files
+    are re-checked at most every check_interval seconds; a changed mtime
+    or size reloads the table and rebuilds the views built on it.
+
+    Frames and views are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        data_dir=DATA_DIR,
+        cache_dir=REFERENCE_CACHE_DIR,
+        check_interval=REFERENCE_RELOAD_INTERVAL,
+        max_views=REFERENCE_MAX_VIEWS
+    ):
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir
+        self.check_interval = check_interval
+        self.max_views = max_views
+
+        self._tables = {}
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.parses = 0
+        self.cache_loads = 0
+        self.reloads = 0
+
+    def path(self, name):
+        return os.path.join(self.data_dir, f"{name}.csv")
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def _signature(self, name):
+        stat = os.stat(self.path(name))
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, name, signature):
+
+        path = self.path(name)
+        digest = _content_hash(path)
+        cache_path = os.path.join(self.cache_dir, f"{name}.{digest[:16]}.npz")
+
+        try:
+            frame = read_table_cache(cache_path)
+            self.cache_loads += 1
+        except (OSError, ValueError, KeyError):
+            frame = pd.read_csv(path)
+            self.parses += 1
+
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                write_table_cache(cache_path, frame)
+                self._remove_stale_caches(name, cache_path)
+            except OSError as e:
+                print(f"Could not cache reference table {name}: {e}")
+
+        return _Table(signature, digest, frame)
+
+    def _remove_stale_caches(self, name, current_path):
+
+        for filename in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, filename)
+
+            if filename.startswith(f"{name}.") and filename.endswith(".npz") and path != current_path:
+                os.remove(path)
+
+    def _current(self, name):
+
+        table = self._tables.get(name)
+
+        if table is not None and time.monotonic() - table.checked_at < self.check_interval:
+            return table
+
+        with self._lock:
+            table = self._tables.get(name)
+            signature = self._signature(name)
+
+            if table is None or table.signature != signature:
+                if table is not None:
+                    self.reloads += 1
+                    print(f"Reference table {name} changed, reloading")
+
+                table = self._load(name, signature)
+                self._tables[name] = table
+            else:
+                table.checked_at = time.monotonic()
+
+        return table
+
+    def table(self, name):
+        """
+        The parsed DataFrame for data/raw/<name>.csv.
+        """
+
+        return self._current(name).frame
+
+    def version(self, name):
+        """
+        Content hash of the table currently loaded.
+        """
+
+        return self._current(name).digest
+
+    def view(self, key, build, *names):
+        """
+        build(*frames) for the named tables, cached until any of them is
+        reloaded. Use for indexes derived from the raw tables; at most
+        max_views are kept, so keys should come from a small fixed set.
+        """
+
+        tables = [self._current(name) for name in names]
+        versions = tuple(table.digest for table in tables)
+
+        with self._lock:
+            cached = self._views.get(key)
+
+            if cached is not None and cached[0] == versions:
+                self._views.move_to_end(key)
+                return cached[1]
+
+        view = build(*(table.frame for table in tables))
+
+        with self._lock:
+            self._views[key] = (versions, view)
+            self._views.move_to_end(key)
+
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+
+        return view
+
+    def stats(self):
+        return {
+            "tables": {
+                name: table.digest[:16] for name, table in self._tables.items()
+            },
+            "views": len(self._views),
+            "parses": self.parses,
+            "cache_loads": self.cache_loads,
+            "reloads": self.reloads
+        }
+
+
+reference_data = ReferenceDataStore()
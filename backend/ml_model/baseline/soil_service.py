@@ -1,50 +1,26 @@
-import os
-import pandas as pd
+from .reference_data import reference_data
 
 
 # =====================================
-# PATH SETUP
+# TABLES
 # =====================================
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-BACKEND_DIR = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
-DATA_DIR = os.path.join(BACKEND_DIR, "data", "raw")
+SOIL_TYPES_TABLE = "soil_types"
+SOIL_NUTRIENTS_TABLE = "soil_nutrients"
 
-SOIL_TYPES_PATH = os.path.join(DATA_DIR, "soil_types.csv")
-SOIL_NUTRIENTS_PATH = os.path.join(DATA_DIR, "soil_nutrients.csv")
+SOIL_TYPES_COLUMNS = {"region", "soil_type", "ph"}
+SOIL_NUTRIENTS_COLUMNS = {"soil_type", "n", "p", "k"}
 
 
-# =====================================
-# SAFE LOAD FUNCTION
-# =====================================
-def safe_load_csv(path, required_columns):
-    if not os.path.exists(path):
-        print(f"Warning: Missing file at {path}")
-        return None
-
-    df = pd.read_csv(path)
-    df.columns = df.columns.str.strip().str.lower()
+def prepare_table(df, name, required_columns):
+    df = df.rename(columns=lambda column: column.strip().lower())
 
     if not required_columns.issubset(set(df.columns)):
-        print(f"Warning: File {path} missing required columns {required_columns}")
+        print(f"Warning: Table {name} missing required columns {required_columns}")
         return None
 
     return df
 
 
-# =====================================
-# LOAD DATA SAFELY
-# =====================================
-soil_types_df = safe_load_csv(
-    SOIL_TYPES_PATH,
-    {"region", "soil_type", "ph"}
-)
-
-soil_nutrients_df = safe_load_csv(
-    SOIL_NUTRIENTS_PATH,
-    {"soil_type", "n", "p", "k"}
-)
-
-
 # =====================================
 # HELPERS
 # =====================================
@@ -52,23 +28,137 @@ def normalize(text):
     return str(text).strip().lower()
 
 
-def extract_base_soil_type(soil_type_name):
-    if soil_nutrients_df is None:
-        return None
+def extract_base_soil_type(soil_type_name, base_types):
+    """
+    First nutrient-table soil type whose name appears in soil_type_name
+    (so "Red Loam" maps to "Red Loam", "Coastal Alluvial" to "Alluvial").
+    """
 
     soil_type_name = normalize(soil_type_name)
 
-    for base_type in soil_nutrients_df["soil_type"].unique():
+    for base_type in base_types:
         if normalize(base_type) in soil_type_name:
             return base_type
 
     return None
 
 
+# =====================================
+# SOIL INDEX
+# =====================================
+def build_soil_index(types_df, nutrients_df):
+    """
+    Compiles the soil tables into normalized region -> soil record, with
+    the base soil type and nutrients resolved up front.
+
+    Base types are matched once per distinct soil type rather than once
+    per region, so building stays linear in the number of regions. The
+    first row wins for duplicated regions and soil types, as the
+    per-request lookup did.
+    """
+
+    base_types = list(nutrients_df["soil_type"].unique())
+
+    nutrients = {}
+
+    for soil_type, n, p, k in zip(
+        nutrients_df["soil_type"], nutrients_df["n"], nutrients_df["p"], nutrients_df["k"]
+    ):
+        nutrients.setdefault(normalize(soil_type), (float(n), float(p), float(k)))
+
+    base_by_soil_type = {}
+    index = {}
+
+    for region, soil_type, ph in zip(
+        types_df["region"], types_df["soil_type"], types_df["ph"]
+    ):
+        key = normalize(region)
+
+        if key in index:
+            continue
+
+        if soil_type not in base_by_soil_type:
+            base_by_soil_type[soil_type] = extract_base_soil_type(soil_type, base_types)
+
+        base_soil_type = base_by_soil_type[soil_type]
+        ph = float(ph)
+
+        if base_soil_type is None:
+            record = {
+                "region": region,
+                "soil_type": soil_type,
+                "base_soil_type": "Generic",
+                "N": 55.0,
+                "P": 30.0,
+                "K": 40.0,
+                "ph": ph
+            }
+
+        elif normalize(base_soil_type) not in nutrients:
+            record = {
+                "region": region,
+                "soil_type": soil_type,
+                "base_soil_type": base_soil_type,
+                "N": 55.0,
+                "P": 30.0,
+                "K": 40.0,
+                "ph": ph
+            }
+
+        else:
+            n, p, k = nutrients[normalize(base_soil_type)]
+
+            record = {
+                "region": region,
+                "soil_type": soil_type,
+                "base_soil_type": base_soil_type,
+                "N": n,
+                "P": p,
+                "K": k,
+                "ph": ph
+            }
+
+        index[key] = record
+
+    return index
+
+
+def compile_soil_index(types_df, nutrients_df):
+
+    types_df = prepare_table(types_df, SOIL_TYPES_TABLE, SOIL_TYPES_COLUMNS)
+    nutrients_df = prepare_table(nutrients_df, SOIL_NUTRIENTS_TABLE, SOIL_NUTRIENTS_COLUMNS)
+
+    if types_df is None or nutrients_df is None:
+        return None
+
+    return build_soil_index(types_df, nutrients_df)
+
+
+def current_soil_index():
+    """
+    The soil index for the current soil tables, rebuilt by the reference
+    data store when either CSV changes. None when a table is unusable.
+    """
+
+    try:
+        return reference_data.view(
+            "soil_index", compile_soil_index, SOIL_TYPES_TABLE, SOIL_NUTRIENTS_TABLE
+        )
+    except FileNotFoundError as e:
+        print(f"Warning: Missing file at {e.filename}")
+        return None
+
+
 # =====================================
 # MAIN FUNCTION
 # =====================================
 def get_soil_data(region):
+    """
+    Soil record for a region: one dict lookup in the soil index.
+
+    Indexed regions return the shared record, which callers must treat
+    as read-only.
+    """
 
     if not region:
         raise ValueError("Region is required")
@@ -76,7 +166,9 @@ def get_soil_data(region):
     # ---------------------------------
     # If files missing → fallback
     # ---------------------------------
-    if soil_types_df is None or soil_nutrients_df is None:
+    soil_index = current_soil_index()
+
+    if soil_index is None:
         print("Soil files missing. Using intelligent fallback soil values.")
         return {
             "region": region,
@@ -88,16 +180,12 @@ def get_soil_data(region):
             "ph": 6.5
         }
 
-    region_normalized = normalize(region)
-
-    region_rows = soil_types_df[
-        soil_types_df["region"].str.lower() == region_normalized
-    ]
+    record = soil_index.get(normalize(region))
 
     # ---------------------------------
     # If region not found → fallback
     # ---------------------------------
-    if region_rows.empty:
+    if record is None:
         print(f"Region '{region}' not found in soil data. Using fallback.")
         return {
             "region": region,
@@ -109,49 +197,4 @@ def get_soil_data(region):
             "ph": 6.8
         }
 
-    region_row = region_rows.iloc[0]
-    soil_type_full = region_row["soil_type"]
-    ph = float(region_row["ph"])
-
-    base_soil_type = extract_base_soil_type(soil_type_full)
-
-    if base_soil_type is None:
-        print("Base soil type not mapped. Using fallback nutrients.")
-        return {
-            "region": region,
-            "soil_type": soil_type_full,
-            "base_soil_type": "Generic",
-            "N": 55.0,
-            "P": 30.0,
-            "K": 40.0,
-            "ph": ph
-        }
-
-    nutrient_rows = soil_nutrients_df[
-        soil_nutrients_df["soil_type"].str.lower()
-        == normalize(base_soil_type)
-    ]
-
-    if nutrient_rows.empty:
-        print("Nutrient row missing. Using fallback values.")
-        return {
-            "region": region,
-            "soil_type": soil_type_full,
-            "base_soil_type": base_soil_type,
-            "N": 55.0,
-            "P": 30.0,
-            "K": 40.0,
-            "ph": ph
-        }
-
-    nutrient_row = nutrient_rows.iloc[0]
-
-    return {
-        "region": region_row["region"],
-        "soil_type": soil_type_full,
-        "base_soil_type": base_soil_type,
-        "N": float(nutrient_row["n"]),
-        "P": float(nutrient_row["p"]),
-        "K": float(nutrient_row["k"]),
-        "ph": ph
-    }
+    return record
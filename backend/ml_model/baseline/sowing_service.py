@@ -1,30 +1,23 @@
-import os
-import pandas as pd
+from .reference_data import reference_data
 
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_PATH = os.path.join(BASE_DIR, "data", "raw")
+SOIL_TYPES_TABLE = "soil_types"
+SOIL_NUTRIENTS_TABLE = "soil_nutrients"
 
-soil_types_path = os.path.join(DATA_PATH, "soil_types.csv")
-soil_nutrients_path = os.path.join(DATA_PATH, "soil_nutrients.csv")
-
-print("Looking for soil_types.csv at:", soil_types_path)
-print("Looking for soil_nutrients.csv at:", soil_nutrients_path)
-
-if not os.path.exists(soil_types_path):
-    raise FileNotFoundError(f"soil_types.csv not found at {soil_types_path}")
-
-if not os.path.exists(soil_nutrients_path):
-    raise FileNotFoundError(f"soil_nutrients.csv not found at {soil_nutrients_path}")
-
-soil_types_df = pd.read_csv(soil_types_path)
-soil_nutrients_df = pd.read_csv(soil_nutrients_path)
+for table in (SOIL_TYPES_TABLE, SOIL_NUTRIENTS_TABLE):
+    if not reference_data.exists(table):
+        raise FileNotFoundError(
+            f"{table}.csv not found at {reference_data.path(table)}"
+        )
 
 
 def get_soil_data(region: str):
 
     region = region.strip()
 
+    soil_types_df = reference_data.table(SOIL_TYPES_TABLE)
+    soil_nutrients_df = reference_data.table(SOIL_NUTRIENTS_TABLE)
+
     region_row = soil_types_df[
         soil_types_df["region"].str.lower() == region.lower()
     ]
@@ -0,0 +1,104 @@
+import time
+import threading
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    In-process LRU cache with a TTL.
+
+    Entries older than ttl are still served (stale-while-revalidate)
+    until max_stale; callers can coordinate one background refresh per
+    key with start_refresh / finish_refresh. With max_stale equal to
+    ttl it is a plain TTL cache.
+    """
+
+    def __init__(self, ttl, max_stale, max_entries):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    def lookup(self, key):
+        """
+        Returns (value, age_seconds) or None, counting the outcome.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                value, fetched_at = entry
+                age = time.time() - fetched_at
+
+                if age <= self.max_stale:
+                    self._entries.move_to_end(key)
+
+                    if age <= self.ttl:
+                        self.hits += 1
+                    else:
+                        self.stale_hits += 1
+
+                    return value, age
+
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def store(self, key, value, fetched_at=None):
+
+        with self._lock:
+            self._entries[key] = (value, fetched_at or time.time())
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def start_refresh(self, key):
+        """
+        Claims the background refresh for key. False if one is running.
+        """
+
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def finish_refresh(self, key, failed=False):
+
+        with self._lock:
+            self._refreshing.discard(key)
+            if failed:
+                self.refresh_errors += 1
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refresh_errors": self.refresh_errors,
+                "hit_rate": round(
+                    (self.hits + self.stale_hits) / lookups, 4
+                ) if lookups else 0.0,
+                "ttl_seconds": self.ttl,
+                "max_entries": self.max_entries
+            }
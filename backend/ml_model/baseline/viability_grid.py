@@ -0,0 +1,356 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+import numpy as np
+
+from .crop_profiles import CROP_PROFILES
+from .monte_carlo_service import (
+    QUADRATURE_NODES,
+    classify_viability,
+    default_weather_std,
+    expected_viability,
+    quadrature_viability_curve
+)
+
+
+# =========================================================
+# GRID SETTINGS
+# =========================================================
+
+ML_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GRID_PATH = os.path.join(ML_DIR, "viability_grid.npy")
+GRID_META_PATH = os.path.join(ML_DIR, "viability_grid.json")
+
+RAIN_AXIS = (0.0, 1000.0, 2.5)      # start, stop, step (mm / month)
+TEMP_AXIS = (0.0, 45.0, 0.5)        # start, stop, step (deg C)
+
+# Largest allowed |grid - quadrature| at off-grid check points
+GRID_ERROR_BOUND = 0.01
+GRID_CHECK_POINTS = 300
+
+_grid_lock = threading.Lock()
+_grid_cache = None
+
+
+def _axis(spec):
+    start, stop, step = spec
+    return np.linspace(start, stop, int(round((stop - start) / step)) + 1)
+
+
+def profiles_hash():
+    """
+    Fingerprint of everything the grid depends on. A change to
+    CROP_PROFILES or the grid settings triggers a rebuild.
+    """
+
+    payload = json.dumps(
+        {
+            "profiles": CROP_PROFILES,
+            "rain_axis": RAIN_AXIS,
+            "temp_axis": TEMP_AXIS,
+            "nodes": QUADRATURE_NODES
+        },
+        sort_keys=True
+    )
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# =========================================================
+# BUILD
+# =========================================================
+
+def _expected_grid(crops, rain_axis, temp_axis):
+
+    grid = np.empty((len(crops), len(rain_axis), len(temp_axis)), dtype=np.float32)
+
+    for c, crop in enumerate(crops):
+        profile = CROP_PROFILES[crop]
+
+        for r, rain in enumerate(rain_axis):
+            rain_std, temp_std = default_weather_std(rain)
+            grid[c, r] = quadrature_viability_curve(
+                profile, rain, rain_std, temp_axis, temp_std
+            )
+
+    return grid
+
+
+def _interpolate(grid, rain_axis, temp_axis, rainfall, temperature):
+    """
+    Bilinear interpolation of every crop at one (rainfall, temperature).
+    Returns None when the point is outside the grid.
+    """
+
+    rain_step = rain_axis[1] - rain_axis[0]
+    temp_step = temp_axis[1] - temp_axis[0]
+
+    r = (rainfall - rain_axis[0]) / rain_step
+    t = (temperature - temp_axis[0]) / temp_step
+
+    if not (0 <= r <= len(rain_axis) - 1 and 0 <= t <= len(temp_axis) - 1):
+        return None
+
+    r0 = min(int(r), len(rain_axis) - 2)
+    t0 = min(int(t), len(temp_axis) - 2)
+    dr = r - r0
+    dt = t - t0
+
+    cell = np.asarray(grid[:, r0:r0 + 2, t0:t0 + 2], dtype=float)
+
+    return (
+        cell[:, 0, 0] * (1 - dr) * (1 - dt)
+        + cell[:, 1, 0] * dr * (1 - dt)
+        + cell[:, 0, 1] * (1 - dr) * dt
+        + cell[:, 1, 1] * dr * dt
+    )
+
+
+def check_interpolation_error(grid, crops, rain_axis, temp_axis, points=GRID_CHECK_POINTS, seed=0):
+    """
+    Max absolute error of the interpolated grid against direct
+    quadrature at random off-grid points.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    rains = rng.uniform(rain_axis[0], rain_axis[-1], points)
+    temps = rng.uniform(temp_axis[0], temp_axis[-1], points)
+
+    worst = 0.0
+
+    for rain, temp in zip(rains, temps):
+        interpolated = _interpolate(grid, rain_axis, temp_axis, rain, temp)
+        rain_std, temp_std = default_weather_std(rain)
+
+        for c, crop in enumerate(crops):
+            exact = expected_viability(
+                CROP_PROFILES[crop], rain, rain_std, temp, temp_std,
+                mode="quadrature"
+            )
+            worst = max(worst, abs(interpolated[c] - exact))
+
+    return float(worst)
+
+
+def build_viability_grid(save=True):
+    """
+    Evaluates viability for every crop over the rainfall x temperature
+    grid, checks the interpolation error and writes the table.
+    """
+
+    crops = sorted(CROP_PROFILES)
+    rain_axis = _axis(RAIN_AXIS)
+    temp_axis = _axis(TEMP_AXIS)
+
+    start = time.perf_counter()
+    grid = _expected_grid(crops, rain_axis, temp_axis)
+    build_seconds = time.perf_counter() - start
+
+    max_error = check_interpolation_error(grid, crops, rain_axis, temp_axis)
+
+    if max_error > GRID_ERROR_BOUND:
+        raise ValueError(
+            f"Viability grid interpolation error {max_error:.4f} "
+            f"exceeds bound {GRID_ERROR_BOUND}"
+        )
+
+    meta = {
+        "profiles_hash": profiles_hash(),
+        "crops": crops,
+        "rain_axis": list(RAIN_AXIS),
+        "temp_axis": list(TEMP_AXIS),
+        "max_interpolation_error": round(max_error, 6),
+        "error_bound": GRID_ERROR_BOUND,
+        "build_seconds": round(build_seconds, 2)
+    }
+
+    if save:
+        try:
+            tmp_grid = GRID_PATH + ".tmp.npy"
+            tmp_meta = GRID_META_PATH + ".tmp"
+
+            np.save(tmp_grid, grid)
+            with open(tmp_meta, "w") as f:
+                json.dump(meta, f, indent=2)
+
+            os.replace(tmp_grid, GRID_PATH)
+            os.replace(tmp_meta, GRID_META_PATH)
+        except OSError as e:
+            print(f"Could not save viability grid: {e}")
+
+    return grid, meta
+
+
+# =========================================================
+# LOAD
+# =========================================================
+
+def _read_saved_grid():
+
+    if not (os.path.exists(GRID_PATH) and os.path.exists(GRID_META_PATH)):
+        return None
+
+    with open(GRID_META_PATH) as f:
+        meta = json.load(f)
+
+    if meta.get("profiles_hash") != profiles_hash():
+        print("Crop profiles changed. Rebuilding viability grid.")
+        return None
+
+    return np.load(GRID_PATH, mmap_mode="r"), meta
+
+
+def load_viability_grid():
+    """
+    Returns the grid with its metadata, crop index and axes, building
+    it when it is missing or stale.
+    """
+
+    global _grid_cache
+
+    if _grid_cache is not None:
+        return _grid_cache
+
+    with _grid_lock:
+
+        if _grid_cache is None:
+            saved = _read_saved_grid()
+            grid, meta = saved if saved is not None else build_viability_grid()
+
+            _grid_cache = {
+                "grid": grid,
+                "meta": meta,
+                "crop_index": {crop: i for i, crop in enumerate(meta["crops"])},
+                "rain_axis": _axis(meta["rain_axis"]),
+                "temp_axis": _axis(meta["temp_axis"]),
+                "rows": {}
+            }
+
+    return _grid_cache
+
+
+# =========================================================
+# SERVING LOOKUP
+# =========================================================
+
+def viability_grid_batch(crop_names, base_rainfall_mm, base_temperature_c):
+    """
+    Grid-interpolated counterpart of monte_carlo_weather_viability_batch.
+    Points outside the grid fall back to direct quadrature.
+    """
+
+    results = {
+        crop: {
+            "crop": crop,
+            "probability": 0.0,
+            "risk_level": "High",
+            "simulations": 0,
+            "mode": "grid"
+        }
+        for crop in crop_names
+    }
+
+    known = [crop for crop in crop_names if crop.lower() in CROP_PROFILES]
+
+    if not known or base_rainfall_mm <= 0:
+        return results
+
+    table = load_viability_grid()
+    crop_index = table["crop_index"]
+
+    interpolated = _interpolate(
+        table["grid"],
+        table["rain_axis"],
+        table["temp_axis"],
+        base_rainfall_mm,
+        base_temperature_c
+    )
+
+    rain_std, temp_std = default_weather_std(base_rainfall_mm)
+
+    for crop in known:
+
+        if interpolated is not None:
+            value = float(interpolated[crop_index[crop.lower()]])
+        else:
+            results[crop]["mode"] = "quadrature"
+            value = expected_viability(
+                CROP_PROFILES[crop.lower()],
+                base_rainfall_mm,
+                rain_std,
+                base_temperature_c,
+                temp_std,
+                mode="quadrature"
+            )
+
+        probability = round(value, 3)
+        results[crop]["probability"] = probability
+        results[crop]["risk_level"] = classify_viability(probability)
+
+    return results
+
+
+def _grid_rows(table, crop_table):
+    """
+    Grid row of each crop in a CropTable (-1 for crops without a
+    profile), computed once per table.
+    """
+
+    rows = table["rows"].get(crop_table.crops)
+
+    if rows is None:
+        crop_index = table["crop_index"]
+        rows = np.array(
+            [crop_index.get(crop.lower(), -1) for crop in crop_table.crops],
+            dtype=np.intp
+        )
+        table["rows"][crop_table.crops] = rows
+
+    return rows
+
+
+def viability_grid_vector(crop_table, base_rainfall_mm, base_temperature_c):
+    """
+    viability_grid_batch probabilities as an array aligned with a
+    CropTable, without building per-crop result dicts. Crops without a
+    profile score 0.0.
+    """
+
+    probabilities = np.zeros(len(crop_table))
+
+    if base_rainfall_mm <= 0 or not crop_table.has_profile.any():
+        return probabilities
+
+    table = load_viability_grid()
+    rows = _grid_rows(table, crop_table)
+    known = rows >= 0
+
+    interpolated = _interpolate(
+        table["grid"],
+        table["rain_axis"],
+        table["temp_axis"],
+        base_rainfall_mm,
+        base_temperature_c
+    )
+
+    if interpolated is not None:
+        probabilities[known] = interpolated[rows[known]]
+    else:
+        rain_std, temp_std = default_weather_std(base_rainfall_mm)
+
+        for i in np.flatnonzero(known):
+            probabilities[i] = expected_viability(
+                crop_table.profile(i),
+                base_rainfall_mm,
+                rain_std,
+                base_temperature_c,
+                temp_std,
+                mode="quadrature"
+            )
+
+    return np.round(probabilities, 3)
@@ -0,0 +1,226 @@
+import os
+import re
+import json
+import zlib
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# =====================================
+# PROVIDER SETTINGS
+# =====================================
+
+ML_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "live", "replay" or "synthetic"
+WEATHER_PROVIDER = os.getenv("WEATHER_PROVIDER", "live")
+
+WEATHER_FIXTURES_DIR = os.getenv(
+    "WEATHER_FIXTURES_DIR",
+    os.path.join(ML_DIR, "data", "weather_fixtures")
+)
+
+# When set, live responses are also written here as replay fixtures
+WEATHER_RECORD_DIR = os.getenv("WEATHER_RECORD_DIR")
+
+WEATHER_SYNTHETIC_SEED = int(os.getenv("WEATHER_SYNTHETIC_SEED", 42))
+
+WEATHER_HTTP_TIMEOUT = float(os.getenv("WEATHER_HTTP_TIMEOUT", 10))
+WEATHER_HTTP_POOL_SIZE = int(os.getenv("WEATHER_HTTP_POOL_SIZE", 40))
+
+
+def _fixture_path(directory, region):
+    """
+    <directory>/<slug>.json, where the slug keeps only [a-z0-9_-] so a
+    region from a request cannot point outside the directory. A path
+    that still resolves outside it (a symlinked fixture) is refused.
+    """
+
+    slug = re.sub(r"[^a-z0-9_-]", "_", str(region).strip().lower())
+    path = os.path.join(directory, f"{slug}.json")
+
+    root = os.path.realpath(directory)
+
+    if os.path.commonpath([root, os.path.realpath(path)]) != root:
+        raise ValueError(f"Fixture for region '{region}' resolves outside {directory}")
+
+    return path
+
+
+# =====================================
+# LIVE API
+# =====================================
+
+def _build_session():
+    """
+    Shared session so TCP/TLS connections to the API are reused.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=WEATHER_HTTP_POOL_SIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+class LiveWeatherProvider:
+    """
+    7-day forecasts from weatherapi.com over a pooled session.
+    """
+
+    name = "live"
+
+    # Only real forecasts are kept in the on-disk forecast store
+    persistent = True
+
+    def __init__(self, record_dir=None):
+        self.session = _build_session()
+        self.record_dir = record_dir
+
+    def forecast(self, region):
+
+        print("SMART WEATHER SERVICE ACTIVE")
+
+        if not region:
+            raise ValueError("Region is required")
+
+        api_key = os.getenv("WEATHER_API_KEY")
+
+        if not api_key:
+            raise ValueError("Weather API key missing")
+
+        query_location = f"{region},IN"
+
+        weather_url = (
+            "http://api.weatherapi.com/v1/forecast.json"
+            f"?key={api_key}"
+            f"&q={query_location}"
+            f"&days=7"
+            f"&aqi=no"
+            f"&alerts=no"
+        )
+
+        try:
+            response = self.session.get(weather_url, timeout=WEATHER_HTTP_TIMEOUT)
+            response.raise_for_status()
+            weather_data = response.json()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Weather API request failed: {str(e)}")
+
+        if "error" in weather_data:
+            raise Exception(f"Weather API error: {weather_data['error']}")
+
+        if self.record_dir:
+            os.makedirs(self.record_dir, exist_ok=True)
+            with open(_fixture_path(self.record_dir, region), "w") as f:
+                json.dump(weather_data, f)
+
+        return weather_data
+
+
+# =====================================
+# RECORDED FIXTURES
+# =====================================
+
+class ReplayWeatherProvider:
+    """
+    Replays forecast payloads recorded from the live API, one
+    <region>.json file per region.
+    """
+
+    name = "replay"
+    persistent = False
+
+    def __init__(self, fixtures_dir):
+        self.fixtures_dir = fixtures_dir
+
+    def forecast(self, region):
+
+        path = _fixture_path(self.fixtures_dir, region)
+
+        if not os.path.exists(path):
+            raise ValueError(f"No recorded forecast for region '{region}' at {path}")
+
+        with open(path) as f:
+            return json.load(f)
+
+
+# =====================================
+# SYNTHETIC GENERATOR
+# =====================================
+
+class SyntheticWeatherProvider:
+    """
+    Deterministic forecasts in the weatherapi.com payload format.
+    Each region gets its own climate, and the same seed always
+    produces the same forecast.
+    """
+
+    name = "synthetic"
+    persistent = False
+
+    def __init__(self, seed=WEATHER_SYNTHETIC_SEED, days=7):
+        self.seed = seed
+        self.days = days
+
+    def forecast(self, region):
+
+        rng = random.Random(self.seed * 1_000_003 + zlib.crc32(region.encode("utf-8")))
+
+        base_temp = rng.uniform(16, 34)
+        base_humidity = rng.uniform(45, 90)
+        wet_chance = rng.uniform(0.1, 0.8)
+        rain_scale = rng.uniform(2, 15)
+
+        forecast_days = []
+
+        for _ in range(self.days):
+            avg_temp = base_temp + rng.gauss(0, 1.5)
+            spread = rng.uniform(4, 10)
+            rain = rng.expovariate(1 / rain_scale) if rng.random() < wet_chance else 0.0
+
+            forecast_days.append({
+                "day": {
+                    "maxtemp_c": round(avg_temp + spread / 2, 1),
+                    "mintemp_c": round(avg_temp - spread / 2, 1),
+                    "avgtemp_c": round(avg_temp, 1),
+                    "avghumidity": round(min(max(base_humidity + rng.gauss(0, 5), 5), 100)),
+                    "totalprecip_mm": round(rain, 2)
+                }
+            })
+
+        return {
+            "location": {"name": region},
+            "current": {
+                "temp_c": forecast_days[0]["day"]["avgtemp_c"],
+                "humidity": forecast_days[0]["day"]["avghumidity"],
+                "precip_mm": round(forecast_days[0]["day"]["totalprecip_mm"] / 24, 2)
+            },
+            "forecast": {"forecastday": forecast_days}
+        }
+
+
+# =====================================
+# SELECTION
+# =====================================
+
+def build_weather_provider(name=WEATHER_PROVIDER):
+
+    name = name.strip().lower()
+
+    if name == "live":
+        return LiveWeatherProvider(record_dir=WEATHER_RECORD_DIR)
+
+    if name == "replay":
+        return ReplayWeatherProvider(WEATHER_FIXTURES_DIR)
+
+    if name == "synthetic":
+        return SyntheticWeatherProvider()
+
+    raise ValueError(f"Unknown weather provider: {name}")
@@ -1,10 +1,39 @@
 import os
-import requests
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 
+from .forecast_store import forecast_store
+from .ttl_cache import TTLCache
+from .weather_providers import build_weather_provider
+
 load_dotenv()
 
 
+# Forecast cache settings (seconds / entries)
+WEATHER_CACHE_TTL = float(os.getenv("WEATHER_CACHE_TTL", 3600))
+WEATHER_CACHE_MAX_STALE = float(os.getenv("WEATHER_CACHE_MAX_STALE", 6 * 3600))
+WEATHER_CACHE_MAX_ENTRIES = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", 256))
+
+# Batch fetch settings
+WEATHER_BATCH_CONCURRENCY = int(os.getenv("WEATHER_BATCH_CONCURRENCY", 40))
+WEATHER_BATCH_DEADLINE = float(os.getenv("WEATHER_BATCH_DEADLINE", 15))
+
+
+# Forecast source, chosen by WEATHER_PROVIDER (live / replay / synthetic)
+weather_provider = build_weather_provider()
+
+# Dedicated threads for batch fetches; the asyncio default executor
+# is capped by CPU count, which would serialize network waits
+_batch_executor = ThreadPoolExecutor(
+    max_workers=WEATHER_BATCH_CONCURRENCY,
+    thread_name_prefix="weather"
+)
+
+
 def safe_float(value, default=0.0):
     try:
         return float(value)
@@ -21,38 +50,176 @@ REGION_RAINFALL_BASELINE = {
 }
 
 
-def get_weather(region):
+def normalize_region(region):
+    return str(region).strip().lower()
+
+
+weather_cache = TTLCache(
+    ttl=WEATHER_CACHE_TTL,
+    max_stale=WEATHER_CACHE_MAX_STALE,
+    max_entries=WEATHER_CACHE_MAX_ENTRIES
+)
+
+
+def set_weather_provider(provider):
+    """
+    Swaps the forecast source and drops cached forecasts from the old one.
+    """
+
+    global weather_provider
+
+    weather_provider = provider
+    weather_cache.clear()
+
+
+def _store_enabled():
+    return forecast_store is not None and weather_provider.persistent
+
+
+def weather_cache_stats():
+    stats = weather_cache.stats()
+    stats["provider"] = weather_provider.name
+
+    if forecast_store is not None:
+        stats["store"] = forecast_store.stats()
+
+    return stats
+
+
+def _fetch_and_store(key):
+    """
+    Calls the API, persists raw and derived data, and fills the cache.
+    """
+
+    weather_data = request_forecast(key)
+    weather_features = derive_weather_features(key, weather_data)
+    fetched_at = time.time()
+
+    if _store_enabled():
+        forecast_store.save(key, weather_data, weather_features, fetched_at)
+
+    weather_cache.store(key, weather_features, fetched_at)
+
+    return weather_features
+
+
+def _refresh_in_background(key):
 
-    print("SMART WEATHER SERVICE ACTIVE")
+    def refresh():
+        try:
+            _fetch_and_store(key)
+            weather_cache.finish_refresh(key)
+        except Exception as e:
+            print(f"Background weather refresh failed for '{key}': {e}")
+            weather_cache.finish_refresh(key, failed=True)
+
+    if weather_cache.start_refresh(key):
+        threading.Thread(target=refresh, daemon=True).start()
+
+
+def get_weather(region):
+    """
+    Weather features for a region, served from the forecast cache.
+    Stale entries are returned immediately and refreshed in the
+    background. In-process misses check the on-disk forecast store
+    (shared by all workers) before calling the API.
+    """
 
     if not region:
         raise ValueError("Region is required")
 
-    api_key = os.getenv("WEATHER_API_KEY")
+    key = normalize_region(region)
+
+    cached = weather_cache.lookup(key)
+
+    if cached is None and _store_enabled():
+        stored = forecast_store.latest(key)
+
+        if stored is not None:
+            value, fetched_at = stored
+            age = time.time() - fetched_at
+
+            if age <= weather_cache.max_stale:
+                weather_cache.store(key, value, fetched_at)
+                cached = value, age
+
+    if cached is not None:
+        value, age = cached
+
+        if age > weather_cache.ttl:
+            _refresh_in_background(key)
+
+        return dict(value)
+
+    return dict(_fetch_and_store(key))
+
+
+async def get_weather_many(
+    regions,
+    concurrency=WEATHER_BATCH_CONCURRENCY,
+    deadline=WEATHER_BATCH_DEADLINE
+):
+    """
+    Fetches weather for many regions concurrently.
+
+    Each region goes through get_weather (cache, store, then API) on a
+    worker thread sharing the pooled session. At most `concurrency`
+    run at once (capped by WEATHER_BATCH_CONCURRENCY threads) and each
+    call is abandoned after `deadline` seconds.
 
-    if not api_key:
-        raise ValueError("Weather API key missing")
+    Returns:
+        dict: normalized region -> weather features, or the exception
+        raised for that region
+    """
 
-    query_location = f"{region},IN"
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
 
-    weather_url = (
-        "http://api.weatherapi.com/v1/forecast.json"
-        f"?key={api_key}"
-        f"&q={query_location}"
-        f"&days=7"
-        f"&aqi=no"
-        f"&alerts=no"
+    async def fetch_one(region):
+        async with semaphore:
+            return await asyncio.wait_for(
+                loop.run_in_executor(_batch_executor, get_weather, region),
+                timeout=deadline
+            )
+
+    keys = list(dict.fromkeys(normalize_region(region) for region in regions))
+
+    results = await asyncio.gather(
+        *(fetch_one(key) for key in keys),
+        return_exceptions=True
     )
 
-    try:
-        response = requests.get(weather_url, timeout=10)
-        response.raise_for_status()
-        weather_data = response.json()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Weather API request failed: {str(e)}")
-
-    if "error" in weather_data:
-        raise Exception(f"Weather API error: {weather_data['error']}")
+    return dict(zip(keys, results))
+
+
+def get_weather_batch(regions, **kwargs):
+    """
+    Blocking wrapper around get_weather_many for synchronous callers.
+    """
+
+    return asyncio.run(get_weather_many(regions, **kwargs))
+
+
+def fetch_weather(region):
+    """
+    Uncached provider fetch returning processed weather features.
+    """
+
+    return derive_weather_features(region, request_forecast(region))
+
+
+def request_forecast(region):
+    """
+    Raw 7-day forecast payload from the active provider.
+    """
+
+    return weather_provider.forecast(region)
+
+
+def derive_weather_features(region, weather_data):
+    """
+    Weekly weather features from a raw forecast payload.
+    """
 
     current_block = weather_data.get("current", {})
     forecast_days = weather_data.get("forecast", {}).get("forecastday", [])
@@ -0,0 +1,110 @@
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from feature_engineering import add_features
+from baseline.flat_forest import FlatForest
+
+
+# =====================================
+# Benchmark Settings
+# =====================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DATA_PATH = os.path.join(
+    BASE_DIR, "..", "data", "raw", "crop_recommendation_noisy.csv"
+)
+
+MODEL_PATH = os.path.join(BASE_DIR, "crop_model.pkl")
+FEATURES_PATH = os.path.join(BASE_DIR, "model_features.pkl")
+SCALER_PATH = os.path.join(BASE_DIR, "scaler.pkl")
+
+# The crossover with sklearn sets FLAT_FOREST_MAX_ROWS (model_bundle.py)
+BATCH_SIZES = (1, 32, 128, 512, 1024)
+TARGET_SECONDS = 1.0
+
+PROBABILITY_TOLERANCE = 1e-6
+
+
+def time_call(fn, rows):
+    """
+    Mean seconds per call, repeating until TARGET_SECONDS has passed.
+    """
+
+    fn(rows)
+
+    calls = 0
+    start = time.perf_counter()
+
+    while time.perf_counter() - start < TARGET_SECONDS:
+        fn(rows)
+        calls += 1
+
+    return (time.perf_counter() - start) / calls
+
+
+# =====================================
+# Load Model and Data
+# =====================================
+
+model = joblib.load(MODEL_PATH)
+feature_order = joblib.load(FEATURES_PATH)
+scaler = joblib.load(SCALER_PATH)
+
+flat = FlatForest.from_sklearn(model)
+
+data = add_features(pd.read_csv(DATA_PATH).dropna())
+X = scaler.transform(data[feature_order])
+
+rng = np.random.default_rng(7)
+rows = X[rng.choice(len(X), size=max(BATCH_SIZES), replace=True)]
+
+
+# =====================================
+# Parity
+# =====================================
+
+print("\n=====================================")
+print("FLAT FOREST PARITY")
+print("=====================================")
+
+sklearn_proba = model.predict_proba(X)
+flat_proba = flat.predict_proba(X)
+
+max_error = float(np.abs(sklearn_proba - flat_proba).max())
+label_match = float(np.mean(model.predict(X) == flat.predict(X)))
+
+print("Rows checked:", len(X))
+print("Max probability difference:", max_error)
+print("Label agreement:", label_match)
+
+assert max_error <= PROBABILITY_TOLERANCE
+assert label_match == 1.0
+assert list(flat.classes_) == list(model.classes_)
+
+
+# =====================================
+# Latency
+# =====================================
+
+print("\n=====================================")
+print("FLAT FOREST LATENCY")
+print("=====================================")
+
+print(f"Trees: {len(flat.roots)}  Nodes: {len(flat.feature)}  Max depth: {flat.max_depth}")
+print(f"{'batch':>6} {'sklearn ms':>12} {'flat ms':>10} {'speedup':>8}")
+
+for size in BATCH_SIZES:
+    batch = rows[:size]
+
+    sklearn_seconds = time_call(model.predict_proba, batch)
+    flat_seconds = time_call(flat.predict_proba, batch)
+
+    print(
+        f"{size:>6} {sklearn_seconds * 1000:>12.2f} "
+        f"{flat_seconds * 1000:>10.2f} {sklearn_seconds / flat_seconds:>7.1f}x"
+    )
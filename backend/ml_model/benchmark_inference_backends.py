@@ -0,0 +1,88 @@
+import os
+import time
+import tempfile
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from feature_engineering import add_features
+from baseline.flat_forest import FlatForest
+from baseline.onnx_backend import OnnxForest, export_onnx
+
+
+# =====================================
+# Benchmark Settings
+# =====================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "..", "data", "raw", "crop_recommendation_noisy.csv")
+
+BATCH_SIZES = (1, 32, 1024)
+TARGET_SECONDS = 1.0
+
+
+def time_call(fn, rows):
+
+    fn(rows)
+
+    calls = 0
+    start = time.perf_counter()
+
+    while time.perf_counter() - start < TARGET_SECONDS:
+        fn(rows)
+        calls += 1
+
+    return (time.perf_counter() - start) / calls
+
+
+# =====================================
+# Backends (all take unscaled features)
+# =====================================
+
+model = joblib.load(os.path.join(BASE_DIR, "crop_model.pkl"))
+scaler = joblib.load(os.path.join(BASE_DIR, "scaler.pkl"))
+feature_order = joblib.load(os.path.join(BASE_DIR, "model_features.pkl"))
+
+flat = FlatForest.from_sklearn(model)
+
+tmp_dir = tempfile.TemporaryDirectory()
+onnx_path = os.path.join(tmp_dir.name, "crop_model.onnx")
+export_onnx(model, scaler, onnx_path)
+onnx_model = OnnxForest(onnx_path)
+
+
+def scale(rows):
+    return (rows - scaler.mean_) / scaler.scale_
+
+
+backends = {
+    "sklearn": lambda rows: model.predict_proba(scale(rows)),
+    "flat": lambda rows: flat.predict_proba(scale(rows)),
+    "onnx": onnx_model.predict_proba
+}
+
+data = add_features(pd.read_csv(DATA_PATH).dropna())[feature_order]
+rng = np.random.default_rng(7)
+rows = data.to_numpy(dtype=np.float64)[rng.integers(0, len(data), max(BATCH_SIZES))]
+
+
+# =====================================
+# Latency
+# =====================================
+
+print("\n=====================================")
+print("INFERENCE BACKEND LATENCY (ms per call)")
+print("=====================================")
+
+print(f"{'batch':>6}" + "".join(f"{name:>10}" for name in backends))
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", UserWarning)
+
+    for size in BATCH_SIZES:
+        timings = [time_call(fn, rows[:size]) * 1000 for fn in backends.values()]
+        print(f"{size:>6}" + "".join(f"{ms:>10.2f}" for ms in timings))
+
+tmp_dir.cleanup()
@@ -0,0 +1,125 @@
+import random
+import time
+
+import numpy as np
+
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import (
+    SAMPLERS,
+    default_weather_std,
+    estimate_viability,
+    gaussian_suitability
+)
+
+
+# =====================================
+# Benchmark Settings
+# =====================================
+
+BASE_RAINFALL_MM = 150.0
+BASE_TEMPERATURE_C = 28.0
+
+SIMULATIONS = 500
+REPEATS = 200
+
+
+# =====================================
+# Reference: original random.gauss loop
+# =====================================
+
+def random_gauss_estimate(profile, rain_mean, rain_std, temp_mean, temp_std, simulations):
+
+    total_score = 0.0
+
+    for _ in range(simulations):
+
+        simulated_rain = max(0, random.gauss(rain_mean, rain_std))
+        simulated_temp = random.gauss(temp_mean, temp_std)
+
+        rain_score = gaussian_suitability(
+            simulated_rain, profile["rainfall_min"], profile["rainfall_max"]
+        )
+        temp_score = gaussian_suitability(
+            simulated_temp, profile["temp_min"], profile["temp_max"]
+        )
+
+        combined_score = (rain_score * 0.6) + (temp_score * 0.4)
+
+        if combined_score < 0.4:
+            combined_score *= 0.7
+
+        total_score += combined_score
+
+    return total_score / simulations
+
+
+def run_option(estimator, repeats):
+
+    start = time.perf_counter()
+    estimates = [estimator() for _ in range(repeats)]
+    elapsed = time.perf_counter() - start
+
+    return np.mean(estimates), np.var(estimates, ddof=1), elapsed / repeats
+
+
+# =====================================
+# Run Benchmark
+# =====================================
+
+rain_std, temp_std = default_weather_std(BASE_RAINFALL_MM)
+
+weather = (BASE_RAINFALL_MM, rain_std, BASE_TEMPERATURE_C, temp_std)
+
+options = [("random.gauss", None, False)]
+options += [(sampler, sampler, False) for sampler in SAMPLERS]
+options += [(f"{sampler}+cv", sampler, True) for sampler in SAMPLERS]
+
+print(
+    f"Rainfall {BASE_RAINFALL_MM} mm, temperature {BASE_TEMPERATURE_C} C, "
+    f"{SIMULATIONS} simulations x {REPEATS} repeats\n"
+)
+
+summary = {name: {"ratio": [], "ms": []} for name, _, _ in options}
+
+for crop, profile in CROP_PROFILES.items():
+
+    print(f"--- {crop}")
+    print(f"{'option':<22}{'mean':>10}{'variance':>14}{'var ratio':>12}{'ms/call':>10}")
+
+    baseline_variance = None
+
+    for name, sampler, control_variate in options:
+
+        if sampler is None:
+            estimator = lambda: random_gauss_estimate(profile, *weather, SIMULATIONS)
+        else:
+            estimator = lambda: estimate_viability(
+                profile, *weather, SIMULATIONS,
+                sampler=sampler, control_variate=control_variate
+            )
+
+        mean, variance, seconds = run_option(estimator, REPEATS)
+
+        if baseline_variance is None:
+            baseline_variance = variance
+
+        ratio = variance / baseline_variance if baseline_variance > 0 else float("nan")
+
+        summary[name]["ratio"].append(ratio)
+        summary[name]["ms"].append(seconds * 1000)
+
+        print(
+            f"{name:<22}{mean:>10.4f}{variance:>14.3e}"
+            f"{ratio:>12.4f}{seconds * 1000:>10.3f}"
+        )
+
+    print()
+
+print("=== Median across crops")
+print(f"{'option':<22}{'var ratio':>12}{'ms/call':>10}")
+
+for name, stats in summary.items():
+    print(
+        f"{name:<22}{np.nanmedian(stats['ratio']):>12.4f}"
+        f"{np.median(stats['ms']):>10.3f}"
+    )
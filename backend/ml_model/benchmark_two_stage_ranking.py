@@ -0,0 +1,97 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from baseline import recommendation_service as service
+from baseline.feature_compiler import RAW_FEATURES
+
+
+# =====================================
+# Benchmark Settings
+# =====================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "..", "data", "raw", "crop_recommendation_noisy.csv")
+
+SAMPLES = 500
+TOP_KS = (3, 4, 6, 8, 12)
+REGIONS = ("chennai", "delhi", "madurai", "unknown")
+
+
+# =====================================
+# Inputs: dataset rows with shuffled weather
+# =====================================
+
+rng = np.random.default_rng(0)
+
+data = pd.read_csv(DATA_PATH)
+rows = data.sample(SAMPLES, random_state=0)
+
+raw = rows[list(RAW_FEATURES)].to_numpy(dtype=float)
+
+# Pair each soil with another row's weather so inputs are not all
+# textbook cases for one crop
+raw[:, [3, 4, 6]] = raw[rng.permutation(SAMPLES)][:, [3, 4, 6]]
+
+inputs = []
+
+for i, (row, (crop_classes, probabilities)) in enumerate(
+    zip(raw, service.predict_raw(raw))
+):
+    soil = {"N": row[0], "P": row[1], "K": row[2], "ph": row[5]}
+    weather = {
+        "weekly_avg_temperature": row[3],
+        "weekly_avg_humidity": row[4],
+        "estimated_monthly_rainfall": row[6]
+    }
+
+    inputs.append((REGIONS[i % len(REGIONS)], soil, weather, probabilities, crop_classes))
+
+
+def run(**options):
+
+    results = []
+    start = time.perf_counter()
+
+    for region, soil, weather, probabilities, crop_classes in inputs:
+        results.append(service.score_recommendation(
+            region, soil, weather, probabilities, crop_classes, **options
+        ))
+
+    return results, (time.perf_counter() - start) / len(inputs) * 1e6
+
+
+def top_3(result):
+    return [item["crop"] for item in result["top_3"]]
+
+
+# =====================================
+# Parity against full evaluation
+# =====================================
+
+# Reference: every crop scored with quadrature viability
+reference, reference_us = run(ranking="full", viability_mode="quadrature")
+
+print(f"Full evaluation, quadrature viability for all crops: {reference_us:8.1f} µs per recommendation")
+print()
+print(f"{'ranking':<22}{'µs/rec':>9}{'evaluated':>11}{'top-1 diff':>12}{'top-3 order':>13}{'top-3 set':>11}{'worst diff':>12}")
+
+configurations = [("full (grid)", {"ranking": "full"})] + [
+    (f"two_stage k={k}", {"ranking": "two_stage", "top_k": k}) for k in TOP_KS
+]
+
+for label, options in configurations:
+    results, micros = run(**options)
+
+    top1 = np.mean([top_3(r)[0] != top_3(ref)[0] for r, ref in zip(results, reference)])
+    order = np.mean([top_3(r) != top_3(ref) for r, ref in zip(results, reference)])
+    as_set = np.mean([set(top_3(r)) != set(top_3(ref)) for r, ref in zip(results, reference)])
+    worst = np.mean([r["worst_crop"] != ref["worst_crop"] for r, ref in zip(results, reference)])
+    evaluated = np.mean([len(r["all_scores"]) for r in results])
+
+    print(
+        f"{label:<22}{micros:9.1f}{evaluated:11.1f}"
+        f"{top1:12.1%}{order:13.1%}{as_set:11.1%}{worst:12.1%}"
+    )
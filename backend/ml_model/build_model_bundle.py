@@ -0,0 +1,65 @@
+import os
+import importlib.util
+
+import joblib
+
+from baseline.model_bundle import file_sha256, load_bundle, write_bundle
+from baseline.model_tiers import DEFAULT_MODEL_TIER, bundle_path, model_path
+from baseline.onnx_backend import build_onnx
+
+
+# =====================================
+# Build Serving Bundle From Saved Model
+# =====================================
+
+# Packs an existing crop_model*.pkl, scaler.pkl and model_features.pkl
+# into a serving bundle without retraining. Running servers pick it up
+# on their next reload check.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BASE_DIR)
+
+DATA_PATH = os.path.join(BACKEND_DIR, "data", "raw", "crop_recommendation_noisy.csv")
+FEATURES_PATH = os.path.join(BASE_DIR, "model_features.pkl")
+SCALER_PATH = os.path.join(BASE_DIR, "scaler.pkl")
+
+MODEL_TIER = os.getenv("MODEL_TIER", DEFAULT_MODEL_TIER)
+
+print("\n=====================================")
+print("BUILDING MODEL BUNDLE")
+print("=====================================")
+
+MODEL_PATH = model_path(BASE_DIR, MODEL_TIER)
+
+model = joblib.load(MODEL_PATH)
+scaler = joblib.load(SCALER_PATH)
+feature_order = joblib.load(FEATURES_PATH)
+
+onnx_bytes = None
+
+if all(importlib.util.find_spec(p) is not None for p in ("skl2onnx", "onnxruntime")):
+    onnx_bytes = build_onnx(model, scaler)
+
+path = bundle_path(BASE_DIR, MODEL_TIER)
+
+version = write_bundle(
+    path,
+    model,
+    scaler,
+    feature_order,
+    data_hash=file_sha256(DATA_PATH),
+    metrics={"tier": MODEL_TIER},
+    onnx_bytes=onnx_bytes,
+    sklearn_path=MODEL_PATH
+)
+
+bundle = load_bundle(path)
+
+print("Tier:", MODEL_TIER)
+print("Version:", version)
+print("Trees:", len(bundle.forest.roots))
+print("ONNX graph included:", onnx_bytes is not None)
+print("Large batches use:", os.path.basename(MODEL_PATH))
+print("File size (MB):", round(os.path.getsize(path) / 1e6, 2))
+
+print("\nBundle path:", path)
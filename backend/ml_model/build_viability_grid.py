@@ -0,0 +1,27 @@
+from baseline.viability_grid import (
+    GRID_META_PATH,
+    GRID_PATH,
+    build_viability_grid
+)
+
+
+# =====================================
+# Build Viability Lookup Grid
+# =====================================
+
+print("\n=====================================")
+print("BUILDING VIABILITY GRID")
+print("=====================================")
+
+grid, meta = build_viability_grid()
+
+print("Crops:", len(meta["crops"]))
+print("Grid shape:", grid.shape)
+print("Build time (s):", meta["build_seconds"])
+print(
+    "Max interpolation error:", meta["max_interpolation_error"],
+    "(bound", meta["error_bound"], ")"
+)
+
+print("\nGrid path:", GRID_PATH)
+print("Metadata path:", GRID_META_PATH)
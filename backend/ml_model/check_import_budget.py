@@ -0,0 +1,72 @@
+import os
+import sys
+import subprocess
+
+
+# =====================================
+# Budget Settings
+# =====================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative `import app` time, best of RUNS (measured ~0.2 s, mostly Flask)
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", 400))
+RUNS = 3
+
+# Must stay behind the lazy engine
+DEFERRED_MODULES = ("numpy", "pandas", "scipy", "sklearn", "joblib")
+
+
+def import_times():
+    """
+    (self_us, cumulative_us, module) rows from python -X importtime.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BASE_DIR,
+        env={**os.environ, "ENGINE_WARMUP": "lazy"},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    rows = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+
+    return rows
+
+
+runs = [import_times() for _ in range(RUNS)]
+
+best = min(runs, key=lambda rows: dict((m, c) for _, c, m in rows)["app"])
+app_ms = dict((module, cumulative) for _, cumulative, module in best)["app"] / 1000
+
+imported = {module for _, _, module in best}
+leaked = sorted(
+    module for module in imported
+    if module.split(".")[0] in DEFERRED_MODULES
+)
+
+print("\n=====================================")
+print("IMPORT TIME BUDGET")
+print("=====================================")
+
+print(f"import app: {app_ms:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+
+print("\nSlowest imports (cumulative ms):")
+for _, cumulative, module in sorted(best, key=lambda row: row[1], reverse=True)[:10]:
+    print(f"  {cumulative / 1000:>8.1f}  {module}")
+
+assert not leaked, f"Heavy modules imported eagerly: {leaked[:10]}"
+assert app_ms <= IMPORT_BUDGET_MS, (
+    f"import app took {app_ms:.1f} ms, over the {IMPORT_BUDGET_MS:.0f} ms budget"
+)
+
+print("\nImport budget OK")
@@ -1,20 +1,18 @@
 import os
-import pickle
-import pandas as pd
+from baseline.model_tiers import load_model
+from baseline.reference_data import reference_data
 from baseline.monte_carlo_service import monte_carlo_weather_viability
 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 MODEL_PATH = os.path.join(BASE_DIR, "ml_model", "crop_model.pkl")
-REQ_PATH = os.path.join(BASE_DIR, "data", "raw", "crop_requirements.csv")
 
-# Load model once
-with open(MODEL_PATH, "rb") as f:
-    model = pickle.load(f)
+# Load model once (memory-mapped flat forest when exported)
+model = load_model(os.path.dirname(MODEL_PATH))
 
-# Load crop requirements
-requirements = pd.read_csv(REQ_PATH)
+# Crop requirements (shared reference table)
+REQUIREMENTS_TABLE = "crop_requirements"
 
 
 def classify_rainfall(rainfall_mm):
@@ -44,6 +42,7 @@ def recommend_crop(
     predicted_crop = model.predict(input_features)[0]
 
     # ---- Monte Carlo Risk ----
+    requirements = reference_data.table(REQUIREMENTS_TABLE)
     crop_row = requirements[requirements["crop_name"] == predicted_crop]
 
     if crop_row.empty:
@@ -1,13 +1,7 @@
-import os
-import pandas as pd
+from baseline.reference_data import reference_data
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-REQ_PATH = os.path.join(BASE_DIR, "data", "raw", "crop_requirements.csv")
-SOIL_PATH = os.path.join(BASE_DIR, "data", "raw", "soil_types.csv")
-
-requirements = pd.read_csv(REQ_PATH)
-soils = pd.read_csv(SOIL_PATH)
+requirements = reference_data.table("crop_requirements")
+soils = reference_data.table("soil_types")
 
 print("\nCROP REQUIREMENTS")
 print(requirements.head())
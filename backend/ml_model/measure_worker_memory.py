@@ -0,0 +1,111 @@
+import os
+import sys
+import json
+import subprocess
+
+import numpy as np
+
+
+# =====================================
+# Settings
+# =====================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+WORKERS = int(os.getenv("MEMORY_WORKERS", 8))
+TOUCH_ROWS = 1024
+
+# Each worker loads the model, scores rows so every node page is
+# touched, reports its memory and then waits until all workers are up
+WORKER_SCRIPT = """
+import sys
+import json
+import warnings
+import numpy as np
+import sklearn.ensemble
+
+sys.path.insert(0, sys.argv[1])
+warnings.simplefilter("ignore")
+
+def memory_mb():
+    stats = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                stats[parts[0][:-1]] = int(parts[1]) / 1024
+    return stats
+
+before = memory_mb()
+
+if sys.argv[2] == "pickle":
+    import joblib
+    model = joblib.load(sys.argv[1] + "/crop_model.pkl")
+else:
+    from baseline.model_tiers import load_model
+    model = load_model(sys.argv[1])
+
+rows = np.random.default_rng(0).normal(size=(%d, model.n_features_in_))
+model.predict_proba(rows)
+
+after = memory_mb()
+
+print(json.dumps({
+    "rss": after["Rss"] - before["Rss"],
+    "pss": after["Pss"] - before["Pss"],
+    "private": (
+        after["Private_Clean"] + after["Private_Dirty"]
+        - before["Private_Clean"] - before["Private_Dirty"]
+    )
+}), flush=True)
+
+sys.stdin.read()
+""" % TOUCH_ROWS
+
+
+def measure(mode):
+
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER_SCRIPT, BASE_DIR, mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        for _ in range(WORKERS)
+    ]
+
+    reports = [json.loads(worker.stdout.readline()) for worker in workers]
+
+    for worker in workers:
+        worker.stdin.close()
+        worker.wait()
+
+    return {
+        key: float(np.mean([report[key] for report in reports]))
+        for key in reports[0]
+    }
+
+
+# =====================================
+# Report
+# =====================================
+
+if not os.path.exists("/proc/self/smaps_rollup"):
+    raise SystemExit("Needs Linux /proc/<pid>/smaps_rollup")
+
+print("\n=====================================")
+print(f"MODEL MEMORY PER WORKER ({WORKERS} workers, MB added by the model)")
+print("=====================================")
+
+print(f"{'loading':>16} {'RSS':>8} {'PSS':>8} {'private':>8} {'total PSS':>10}")
+
+for mode, label in (("pickle", "joblib pickle"), ("flat", "mmap flat")):
+    result = measure(mode)
+    print(
+        f"{label:>16} {result['rss']:>8.1f} {result['pss']:>8.1f} "
+        f"{result['private']:>8.1f} {result['pss'] * WORKERS:>10.1f}"
+    )
+
+print("\nPSS splits shared pages across the processes mapping them, so")
+print("total PSS is the real host memory used by the model in all workers.")
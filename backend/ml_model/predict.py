@@ -1,9 +1,10 @@
 import os
-import joblib
 import numpy as np
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
+from baseline.model_tiers import load_model
+
 # --------------------------------------------------
 # App Configuration
 # --------------------------------------------------
@@ -21,7 +22,8 @@ MODEL_PATH = os.path.join(BASE_DIR, "crop_model.pkl")
 if not os.path.exists(MODEL_PATH):
     raise FileNotFoundError(f"Model file not found at {MODEL_PATH}")
 
-model = joblib.load(MODEL_PATH)
+# Memory-mapped flat forest when exported, shared across workers
+model = load_model(BASE_DIR)
 
 # --------------------------------------------------
 # Health Check Route
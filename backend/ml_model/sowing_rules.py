@@ -1,21 +1,11 @@
-import os
-import pandas as pd
+from baseline.reference_data import reference_data
 
 # -------------------------------
-# File paths
+# Reference tables (shared, reloaded when the CSVs change)
 # -------------------------------
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-REQ_PATH = os.path.join(BASE_DIR, "data", "raw", "crop_requirements.csv")
-SOIL_PATH = os.path.join(BASE_DIR, "data", "raw", "soil_types.csv")
-
-# -------------------------------
-# Load data once
-# -------------------------------
-
-requirements = pd.read_csv(REQ_PATH)
-soils = pd.read_csv(SOIL_PATH)
+REQUIREMENTS_TABLE = "crop_requirements"
+SOILS_TABLE = "soil_types"
 
 # -------------------------------
 # Core sowing rule engine
@@ -36,6 +26,9 @@ def check_sowing_risk(
     }
     """
 
+    requirements = reference_data.table(REQUIREMENTS_TABLE)
+    soils = reference_data.table(SOILS_TABLE)
+
     # 1. Check crop exists
     crop_row = requirements[requirements["crop_name"] == crop_name]
 
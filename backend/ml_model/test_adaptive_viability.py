@@ -0,0 +1,129 @@
+import numpy as np
+
+from baseline import monte_carlo_service
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import (
+    ADAPTIVE_BLOCK_SIZE,
+    ADAPTIVE_MIN_BLOCKS,
+    RISK_THRESHOLDS,
+    default_weather_std,
+    expected_viability,
+    monte_carlo_weather_viability,
+    monte_carlo_weather_viability_batch
+)
+
+
+MAX_SIMULATIONS = 5000
+
+# Fixed draws so the stopping point is reproducible
+monte_carlo_service._rng = np.random.default_rng(2024)
+
+
+def reference(crop, rainfall, temperature):
+    rainfall_std, temperature_std = default_weather_std(rainfall)
+    return expected_viability(
+        CROP_PROFILES[crop], rainfall, rainfall_std, temperature, temperature_std,
+        mode="quadrature"
+    )
+
+
+def adaptive(crop, rainfall, temperature, simulations=MAX_SIMULATIONS):
+    return monte_carlo_weather_viability(
+        crop, rainfall, temperature, simulations=simulations, mode="adaptive"
+    )
+
+
+def check_result(result, crop, rainfall, temperature):
+
+    lower, upper = result["confidence_interval"]
+    expected = reference(crop, rainfall, temperature)
+
+    assert result["mode"] == "adaptive"
+    # probability is rounded to 3 places, the interval to 4
+    assert 0.0 <= lower <= upper <= 1.0, result
+    assert lower - 0.0005 <= result["probability"] <= upper + 0.0005, result
+
+    # A 95% interval misses now and then; 3 half-widths does not
+    assert abs(result["probability"] - expected) <= 1.5 * (upper - lower) + 0.002, (expected, result)
+    assert result["simulations"] % ADAPTIVE_BLOCK_SIZE == 0 or \
+        result["simulations"] == MAX_SIMULATIONS
+
+    return lower, upper
+
+
+# =====================================
+# EARLY STOP FAR FROM A THRESHOLD
+# =====================================
+
+# (crop, rainfall mm, temperature C), true p ~0.94 and ~0.00
+for crop, rainfall, temperature in [("chickpea", 50, 22), ("apple", 300, 34)]:
+    result = adaptive(crop, rainfall, temperature)
+    lower, upper = check_result(result, crop, rainfall, temperature)
+
+    assert result["simulations"] == ADAPTIVE_MIN_BLOCKS * ADAPTIVE_BLOCK_SIZE, result
+    assert not any(lower < threshold <= upper for threshold in RISK_THRESHOLDS)
+
+    print(f"{crop} p={result['probability']}: stopped after {result['simulations']} samples")
+
+
+# =====================================
+# RUNS TO THE CAP NEAR A THRESHOLD
+# =====================================
+
+# True p within 0.002 of 0.45 and 0.70; a run may still settle early
+# when its interval lands just off the threshold
+RUNS = 10
+
+for crop, rainfall, temperature in [("rice", 70, 28), ("chickpea", 50, 30)]:
+    at_cap = 0
+
+    for _ in range(RUNS):
+        result = adaptive(crop, rainfall, temperature)
+        lower, upper = check_result(result, crop, rainfall, temperature)
+
+        if result["simulations"] == MAX_SIMULATIONS:
+            at_cap += 1
+            assert upper - lower < 0.01, result["confidence_interval"]
+        else:
+            assert not any(
+                lower + 1e-4 < threshold <= upper - 1e-4 for threshold in RISK_THRESHOLDS
+            ), result
+
+    assert at_cap >= RUNS // 2, at_cap
+
+    print(
+        f"{crop} p={result['probability']}: {at_cap}/{RUNS} runs went to the cap "
+        f"of {MAX_SIMULATIONS}, interval {result['confidence_interval']}"
+    )
+
+# A cap that is not a multiple of the block size is used exactly
+assert adaptive("rice", 70, 28, simulations=300)["simulations"] == 300
+
+
+# =====================================
+# BATCH AND INVALID SIMULATION COUNTS
+# =====================================
+
+batch = monte_carlo_weather_viability_batch(
+    ["chickpea", "unknown-crop"], 50, 22, simulations=MAX_SIMULATIONS, mode="adaptive"
+)
+
+assert batch["chickpea"]["simulations"] == ADAPTIVE_MIN_BLOCKS * ADAPTIVE_BLOCK_SIZE
+assert batch["unknown-crop"]["probability"] == 0.0
+
+for mode in ("adaptive", "sample"):
+    for call in (
+        lambda: monte_carlo_weather_viability("rice", 70, 28, simulations=0, mode=mode),
+        lambda: monte_carlo_weather_viability_batch(["rice"], 70, 28, simulations=0, mode=mode)
+    ):
+        try:
+            call()
+            raise AssertionError(f"simulations=0 accepted in mode={mode}")
+        except ValueError as e:
+            assert "simulations must be at least 1" in str(e)
+
+assert monte_carlo_weather_viability("rice", 70, 28, simulations=0, mode="quadrature")["simulations"] == 0
+
+print("simulations < 1 rejected for sampling modes")
+
+print("Adaptive viability checks passed")
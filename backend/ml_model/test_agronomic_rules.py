@@ -0,0 +1,153 @@
+import timeit
+
+import numpy as np
+
+from baseline.agronomic_rules import (
+    AGRONOMIC_RULES,
+    REGION_CLIMATE_MAP,
+    compile_rules,
+    compiled_rule_stats,
+    rule_context,
+    rule_multipliers
+)
+from baseline.crop_table import (
+    KHARIF_CROPS,
+    RABI_CROPS,
+    TEMPERATE_CROPS,
+    TROPICAL_CROPS,
+    WATER_HEAVY_CROPS,
+    crop_table
+)
+from baseline.model_bundle import load_bundle
+from baseline.model_tiers import bundle_path
+
+
+def loop_rules(scores, soil, weather, region, current_month):
+    """
+    Reference: the per-crop rule loop the compiled rules replaced.
+    """
+
+    rainfall = weather["estimated_monthly_rainfall"]
+    temperature = weather["weekly_avg_temperature"]
+    ph = soil["ph"]
+
+    climate = REGION_CLIMATE_MAP.get(region, "tropical")
+
+    adjusted = scores.copy()
+
+    rainfall_factor = min(rainfall / 120.0, 1.0)
+    rainfall_multiplier = 0.8 + (0.5 * rainfall_factor)
+
+    for crop in adjusted:
+
+        crop_lower = crop.lower()
+
+        if climate == "tropical" and crop_lower in TEMPERATE_CROPS:
+            adjusted[crop] *= 0.6
+
+        if climate == "temperate" and crop_lower in TROPICAL_CROPS:
+            adjusted[crop] *= 0.6
+
+        if crop_lower in WATER_HEAVY_CROPS:
+            adjusted[crop] *= rainfall_multiplier
+
+        if climate == "tropical" and crop_lower == "rice":
+            adjusted[crop] *= 1.2
+
+        if 6 <= current_month <= 9 and crop_lower in KHARIF_CROPS:
+            adjusted[crop] *= 1.1
+
+        if (current_month >= 10 or current_month <= 3) and crop_lower in RABI_CROPS:
+            adjusted[crop] *= 1.1
+
+        if temperature > 38 and crop_lower in ["wheat", "barley"]:
+            adjusted[crop] *= 0.7
+
+        if ph < 6 and crop_lower == "chickpea":
+            adjusted[crop] *= 0.85
+
+    return adjusted
+
+
+classes = [str(crop) for crop in load_bundle(bundle_path(".", "full")).classes_]
+
+# Crops the rules name that the model does not predict
+crops = classes + ["wheat", "barley", "sugarcane"]
+table = crop_table(crops)
+
+rng = np.random.default_rng(5)
+regions = ["chennai", "delhi", "madurai", "unknown"]
+
+
+# =====================================
+# PARITY WITH THE RULE LOOP
+# =====================================
+
+for i in range(2000):
+    region = regions[i % len(regions)]
+    month = int(rng.integers(1, 13))
+    soil = {"ph": float(rng.uniform(4, 9))}
+    weather = {
+        "weekly_avg_temperature": float(rng.uniform(10, 45)),
+        "estimated_monthly_rainfall": float(rng.uniform(0, 300))
+    }
+
+    scores = dict(zip(crops, rng.uniform(0.1, 6.0, len(crops)).tolist()))
+
+    expected = loop_rules(scores, soil, weather, region, month)
+    compiled = np.array(list(scores.values())) * rule_multipliers(
+        table, region, soil, weather, month
+    )
+
+    assert np.allclose(compiled, list(expected.values()), rtol=1e-12, atol=0), (region, month)
+
+stats = compiled_rule_stats()
+assert stats["compiled_rule_sets"] <= 3 * 3 * 2 * 2
+
+print(f"Compiled rules match the rule loop on 2000 contexts ({stats['compiled_rule_sets']} rule sets compiled)")
+
+
+# =====================================
+# ADDING A RULE
+# =====================================
+
+extra_rule = {
+    "name": "cold_snap",
+    "when": {"climate": "temperate"},
+    "crops": ["mango"],
+    "multiplier": 0.5
+}
+
+context = ("temperate", None, False, False)
+static, _ = compile_rules(table, context)
+extended, _ = compile_rules(table, context, AGRONOMIC_RULES + [extra_rule])
+
+mango = table.index["mango"]
+assert extended[mango] == static[mango] * 0.5
+assert np.array_equal(np.delete(extended, mango), np.delete(static, mango))
+
+print("Extra rule compiled without touching the apply path")
+
+
+# =====================================
+# COST
+# =====================================
+
+soil = {"ph": 5.5}
+weather = {"weekly_avg_temperature": 30.0, "estimated_monthly_rainfall": 90.0}
+scores = dict(zip(classes, rng.uniform(0.1, 6.0, len(classes)).tolist()))
+class_table = crop_table(classes)
+
+number = 5000
+loop_us = timeit.timeit(
+    lambda: loop_rules(scores, soil, weather, "chennai", 10), number=number
+) / number * 1e6
+compiled_us = timeit.timeit(
+    lambda: rule_multipliers(class_table, "chennai", soil, weather, 10), number=number
+) / number * 1e6
+
+print(f"Rules for {len(classes)} crops: loop {loop_us:.1f} µs, compiled {compiled_us:.1f} µs")
+
+assert rule_context("delhi", soil, weather, 7) == ("temperate", "kharif", False, True)
+
+print("Agronomic rule checks passed")
@@ -0,0 +1,124 @@
+import numpy as np
+
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.crop_table import (
+    GROUP_KHARIF,
+    GROUP_WATER_HEAVY,
+    SEASON_KHARIF,
+    KHARIF_CROPS,
+    WATER_HEAVY_CROPS,
+    crop_table,
+    profile_table
+)
+from baseline.monte_carlo_service import (
+    monte_carlo_weather_viability_batch,
+    profile_arrays,
+    suitability_columns
+)
+from baseline.model_bundle import load_bundle
+from baseline.reference_data import ReferenceDataStore, reference_data
+from baseline.model_tiers import bundle_path
+from baseline.viability_grid import viability_grid_batch, viability_grid_vector
+
+
+classes = [str(crop) for crop in load_bundle(bundle_path(".", "full")).classes_]
+table = crop_table(classes)
+
+
+# =====================================
+# ALIGNMENT
+# =====================================
+
+assert table.crops == tuple(classes)
+assert crop_table(classes) is table
+
+for i, crop in enumerate(classes):
+    profile = CROP_PROFILES.get(crop)
+
+    assert table.has_profile[i] == (profile is not None), crop
+
+    if profile is not None:
+        assert table.profile(i) == {key: float(value) for key, value in profile.items()}, crop
+        assert table.rain_center[i] == (profile["rainfall_min"] + profile["rainfall_max"]) / 2
+
+    assert table.in_group(GROUP_KHARIF)[i] == (crop in KHARIF_CROPS), crop
+    assert table.in_group(GROUP_WATER_HEAVY)[i] == (crop in WATER_HEAVY_CROPS), crop
+
+rice = table.index["rice"]
+assert table.season[rice] == SEASON_KHARIF
+assert table.shelf_life_days[rice] == 7
+assert np.isnan(table.shelf_life_days[table.index["apple"]])
+
+try:
+    table.rain_min[0] = 0
+    raise AssertionError("crop table columns must be read-only")
+except ValueError:
+    pass
+
+print(f"Crop table aligned with {len(classes)} model classes, {len(table.columns)} columns")
+
+
+# =====================================
+# VIABILITY VECTOR PARITY
+# =====================================
+
+rng = np.random.default_rng(11)
+
+for rainfall, temperature in zip(
+    np.append(rng.uniform(-50, 1200, 200), [0.0, 1500.0]),
+    np.append(rng.uniform(-5, 50, 200), [25.0, 60.0])
+):
+    batch = viability_grid_batch(classes, rainfall, temperature)
+    vector = viability_grid_vector(table, rainfall, temperature)
+
+    for i, crop in enumerate(classes):
+        assert vector[i] == batch[crop]["probability"], (crop, rainfall, temperature)
+
+print("viability_grid_vector matches viability_grid_batch, including off-grid weather")
+
+
+
+# =====================================
+# AD-HOC SUBSETS
+# =====================================
+
+profiled = profile_table()
+rain_samples = rng.normal(150, 40, 256)
+temp_samples = rng.normal(26, 4, 256)
+
+for _ in range(50):
+    subset = list(rng.choice(sorted(CROP_PROFILES), size=int(rng.integers(1, 8)), replace=False))
+
+    indexed = suitability_columns(
+        profiled.kernel_columns(profiled.rows([crop.title() for crop in subset])),
+        rain_samples,
+        temp_samples
+    )
+    stacked = suitability_columns(
+        profile_arrays([CROP_PROFILES[crop] for crop in subset]),
+        rain_samples,
+        temp_samples
+    )
+
+    assert np.array_equal(indexed, stacked), subset
+
+views = reference_data.stats()["views"]
+
+for _ in range(500):
+    subset = list(rng.choice(classes, size=6, replace=False))
+    monte_carlo_weather_viability_batch(subset, 120.0, 27.0, simulations=200)
+
+assert reference_data.stats()["views"] == views, "subsets must not compile new views"
+
+# The view cache itself stays bounded
+store = ReferenceDataStore(max_views=4)
+
+for i in range(10):
+    store.view(("crop_table", i), lambda crops_df: i, "crops")
+
+assert store.stats()["views"] == 4
+assert store.view(("crop_table", 9), lambda crops_df: None, "crops") == 9
+
+print(f"500 random crop subsets scored from one table; views stay at {views}")
+
+print("Crop table checks passed")
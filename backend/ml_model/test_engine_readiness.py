@@ -0,0 +1,94 @@
+import os
+import time
+
+os.environ["ENGINE_WARMUP"] = "lazy"
+os.environ.setdefault("WEATHER_PROVIDER", "synthetic")
+
+import app as app_module
+from app import app
+from baseline import engine as engine_module
+from baseline.engine import LazyEngine, engine
+
+
+client = app.test_client()
+
+
+def wait_until(condition, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+# =====================================
+# LAZY MODE
+# =====================================
+
+# Alive immediately, not ready until the engine is loaded
+assert client.get("/healthz").status_code == 200
+assert client.get("/readyz").status_code == 503
+assert not engine.loaded
+
+home = client.get("/").get_json()
+assert home["engine_status"]["loaded"] is False
+assert "model" not in home
+
+# The first request that needs the engine loads it and makes it ready
+response = client.post("/risk-analysis", json={"region": "chennai", "crop": "rice"})
+assert response.status_code == 200, response.get_json()
+
+ready = client.get("/readyz")
+assert ready.status_code == 200, ready.get_json()
+
+status = ready.get_json()
+assert status["loaded"] and status["ready"]
+
+print("Lazy mode ready after the first request, load (s):", status["load_seconds"])
+
+engine.warm_up()
+
+print("Model:", client.get("/").get_json()["model"])
+
+
+# =====================================
+# RECOVERY AFTER A FAILED WARM-UP
+# =====================================
+
+failing = LazyEngine(module=".missing_engine_module", warmup="background")
+app_module.engine = failing
+
+try:
+    assert failing.start_warm_up()
+    assert wait_until(lambda: failing.error is not None and not failing.status()["warming"])
+
+    status = client.get("/readyz")
+    assert status.status_code == 503
+    assert "missing_engine_module" in status.get_json()["error"]
+
+    # The module becomes importable (e.g. a volume finished mounting)
+    failing.module = ".recommendation_service"
+
+    # Within the retry interval the probe does not start another attempt
+    assert not failing.retry_warm_up()
+    assert client.get("/readyz").status_code == 503
+
+    engine_module.WARMUP_RETRY_SECONDS = 0
+
+    assert client.get("/readyz").status_code in (200, 503)
+    assert wait_until(lambda: failing.ready)
+
+    ready = client.get("/readyz")
+    assert ready.status_code == 200, ready.get_json()
+    assert ready.get_json()["error"] is None
+
+    # Nothing to retry once ready
+    assert not failing.start_warm_up()
+    assert not failing.retry_warm_up()
+finally:
+    app_module.engine = engine
+
+print("Failed warm-up retried from /readyz, warm-up (s):", ready.get_json()["warmup_seconds"])
+
+print("Engine readiness checks passed")
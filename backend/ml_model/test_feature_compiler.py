@@ -0,0 +1,58 @@
+import math
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from feature_engineering import add_features
+from baseline.feature_compiler import RAW_FEATURES, FeatureCompiler, raw_features
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "..", "data", "raw", "crop_recommendation_noisy.csv")
+
+feature_order = joblib.load(os.path.join(BASE_DIR, "model_features.pkl"))
+compiler = FeatureCompiler(feature_order)
+
+
+# Batch: NumPy compiler vs the DataFrame path used for analysis
+data = pd.read_csv(DATA_PATH).dropna()
+
+compiled = compiler.transform(data[list(RAW_FEATURES)].to_numpy())
+expected = add_features(data)[feature_order].to_numpy(dtype=np.float64)
+
+assert compiled.shape == (len(data), len(feature_order))
+assert np.array_equal(compiled, expected), "Compiled features differ from add_features"
+
+
+# Single row from soil / weather dicts, formulas written out by hand
+soil = {"N": 90, "P": 42, "K": 43, "ph": 6.5}
+weather = {
+    "weekly_avg_temperature": 20.5,
+    "weekly_avg_humidity": 82,
+    "estimated_monthly_rainfall": 202
+}
+
+row = dict(zip(feature_order, compiler.transform(raw_features(soil, weather))[0]))
+
+assert row["temperature_squared"] == 20.5 ** 2
+assert row["rainfall_log"] == math.log(203)
+assert row["nutrient_total"] == 175
+assert row["np_ratio"] == 90 / 43
+assert row["NPK_ratio"] == 133 / 44
+assert row["nutrient_balance"] == 48 + 1 + 47
+assert row["climate_index"] == (20.5 * 82) / 203
+
+
+# Unknown feature names are rejected up front
+try:
+    FeatureCompiler(list(feature_order) + ["soil_moisture"])
+except ValueError:
+    pass
+else:
+    raise AssertionError("Unknown feature accepted")
+
+print("Rows compiled:", len(compiled))
+print("Feature order:", feature_order)
+print("Feature compiler matches add_features")
@@ -0,0 +1,96 @@
+import os
+import time
+import sqlite3
+import tempfile
+
+from baseline.forecast_store import ForecastStore
+
+
+path = os.path.join(tempfile.mkdtemp(), "weather_store.sqlite3")
+store = ForecastStore(path, retention_days=1)
+
+now = time.time()
+day = 86400
+
+raw = {"location": {"name": "chennai"}, "forecast": {"forecastday": []}}
+features = {"weekly_avg_temperature": 31.2, "estimated_monthly_rainfall": 118.0}
+
+
+# =====================================
+# ROUND TRIP
+# =====================================
+
+assert store.latest("chennai") is None
+
+store.save("chennai", raw, features, now - 60)
+store.save("chennai", raw, dict(features, weekly_avg_temperature=30.0), now)
+
+assert store.latest("chennai") == (dict(features, weekly_avg_temperature=30.0), now)
+assert [fetched_at for fetched_at, _ in store.history("chennai")] == [now, now - 60]
+assert store.latest("delhi") is None
+
+connection = sqlite3.connect(path)
+stored_raw = connection.execute("SELECT raw_json FROM forecasts LIMIT 1").fetchone()[0]
+journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+connection.close()
+
+assert stored_raw == '{"location": {"name": "chennai"}, "forecast": {"forecastday": []}}'
+assert journal_mode == "wal"
+
+stats = store.stats()
+assert (stats["writes"], stats["reads"], stats["read_hits"], stats["errors"]) == (2, 3, 1, 0)
+
+print("Raw payload and features round-trip; newest row wins")
+
+
+# =====================================
+# RETENTION
+# =====================================
+
+path = os.path.join(tempfile.mkdtemp(), "weather_store.sqlite3")
+store = ForecastStore(path, retention_days=1)
+
+# First write runs a cleanup pass; nothing is old enough yet
+store.save("delhi", raw, features, now - 3 * day)
+store.save("madurai", raw, features, now - 3 * day + 60)
+
+# Within the cleanup interval, old rows are left alone
+assert store.latest("delhi") is not None
+
+# An hour later the next write prunes everything past retention
+store.save("chennai", raw, features, now)
+
+assert store.latest("delhi") is None
+assert store.latest("madurai") is None
+assert store.latest("chennai") == (features, now)
+
+print("Rows older than the retention window pruned on the next cleanup pass")
+
+
+# =====================================
+# READS DURING AN OPEN WRITE (WAL)
+# =====================================
+
+writer = sqlite3.connect(path, timeout=0)
+writer.execute("BEGIN IMMEDIATE")
+writer.execute(
+    "INSERT INTO forecasts VALUES (?, ?, ?, ?)",
+    ("chennai", now + 60, "{}", '{"uncommitted": true}')
+)
+
+start = time.perf_counter()
+latest = store.latest("chennai")
+elapsed = time.perf_counter() - start
+
+# The reader sees the last committed row and is not blocked
+assert latest == (features, now)
+assert elapsed < 1.0, elapsed
+
+writer.commit()
+writer.close()
+
+assert store.latest("chennai") == ({"uncommitted": True}, now + 60)
+
+print(f"Second connection read during an open write in {elapsed * 1000:.1f} ms")
+
+print("Forecast store checks passed")
@@ -0,0 +1,184 @@
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from baseline.inference_batcher import MicroBatcher
+
+
+def doubled(rows):
+    return rows * 2
+
+
+# =====================================
+# COALESCING AND STATS
+# =====================================
+
+calls = []
+release = threading.Event()
+
+
+def recording_predict(rows):
+    calls.append(len(rows))
+
+    # Hold the first batch so the next rows queue up behind it
+    if len(calls) == 1:
+        release.wait(2)
+
+    return rows * 2
+
+
+batcher = MicroBatcher(recording_predict, max_batch_size=8, max_wait_ms=50)
+
+futures = [batcher.submit(np.array([0.0, 0.5]))]
+
+while not calls:
+    time.sleep(0.001)
+
+futures += [batcher.submit(np.array([i, i + 0.5])) for i in range(1, 8)]
+release.set()
+
+for i, future in enumerate(futures):
+    assert np.array_equal(future.result(timeout=2), [2 * i, 2 * i + 1]), i
+
+assert calls == [1, 7], f"rows queued behind a running batch should share one call, got {calls}"
+
+stats = batcher.stats()
+assert stats["batches"] == 2 and stats["rows"] == 8
+assert stats["mean_batch_size"] == 4.0
+assert stats["batch_size_histogram"] == {"<=1": 1, "<=8": 1}
+
+# After a multi-row batch, staggered arrivals are still coalesced
+with ThreadPoolExecutor(max_workers=3) as pool:
+    staggered = [
+        pool.submit(lambda i: (time.sleep(0.01 * i), batcher.predict(np.array([float(i)])))[1], i)
+        for i in range(3)
+    ]
+    assert [future.result()[0] for future in staggered] == [0.0, 2.0, 4.0]
+
+assert calls[-1] == 3, calls
+
+print("Queued and staggered rows coalesced:", batcher.stats()["batch_size_histogram"])
+
+
+# =====================================
+# IDLE REQUESTS DO NOT WAIT
+# =====================================
+
+batcher = MicroBatcher(doubled, max_batch_size=8, max_wait_ms=500)
+
+for _ in range(3):
+    start = time.perf_counter()
+    assert batcher.predict(np.array([1.0]))[0] == 2.0
+    assert time.perf_counter() - start < 0.1, "a lone row waited for the batch window"
+
+print("Lone requests skip the 500 ms batching window")
+
+
+# =====================================
+# ERRORS REACH EVERY WAITER
+# =====================================
+
+def failing_predict(rows):
+    raise ValueError("model exploded")
+
+
+batcher = MicroBatcher(failing_predict, max_batch_size=4, max_wait_ms=50)
+futures = [batcher.submit(np.array([float(i)])) for i in range(4)]
+
+for future in futures:
+    try:
+        future.result(timeout=2)
+        raise AssertionError("predict_fn error was swallowed")
+    except ValueError as e:
+        assert str(e) == "model exploded"
+
+print("predict_fn error delivered to all 4 waiters")
+
+
+# =====================================
+# SHORT OUTPUT, CANCELLED CALLERS, DEAD WORKER
+# =====================================
+
+def short_predict(rows):
+    return rows[:-1]
+
+
+# One batch of three rows, run directly so the grouping is fixed
+batcher = MicroBatcher(short_predict, max_batch_size=3, max_wait_ms=50)
+futures = [Future() for _ in range(3)]
+
+batcher._run_batch([(np.array([float(i)]), future) for i, future in enumerate(futures)])
+
+assert futures[0].result(timeout=2)[0] == 0.0
+assert futures[1].result(timeout=2)[0] == 1.0
+
+try:
+    futures[2].result(timeout=2)
+    raise AssertionError("unmatched future should fail")
+except RuntimeError as e:
+    assert "returned 2 rows for a batch of 3" in str(e)
+
+gate = threading.Event()
+
+
+def gated_predict(rows):
+    gate.wait(2)
+    return rows
+
+
+batcher = MicroBatcher(gated_predict, max_batch_size=2, max_wait_ms=1)
+
+first = batcher.submit(np.array([1.0]))
+time.sleep(0.05)
+
+# Queued behind the running batch; times out and is cancelled
+try:
+    batcher.predict(np.array([2.0]), timeout=0.05)
+    raise AssertionError("predict should time out")
+except TimeoutError:
+    pass
+
+# An explicit zero does not fall back to the 10 s default
+start = time.perf_counter()
+
+try:
+    batcher.predict(np.array([2.5]), timeout=0)
+    raise AssertionError("predict should time out")
+except TimeoutError:
+    assert time.perf_counter() - start < 0.5
+
+gate.set()
+assert first.result(timeout=2)[0] == 1.0
+assert batcher.predict(np.array([3.0]), timeout=2)[0] == 3.0
+
+print("Short output failed the unmatched row; cancelled caller did not stop the worker")
+
+
+def exiting_predict(rows):
+    raise SystemExit("worker hit SystemExit")
+
+
+batcher = MicroBatcher(exiting_predict, max_batch_size=1, max_wait_ms=1)
+
+try:
+    batcher.predict(np.array([1.0]), timeout=2)
+    raise AssertionError("SystemExit should reach the caller")
+except SystemExit:
+    pass
+
+batcher.predict_fn = doubled
+assert batcher.predict(np.array([4.0]), timeout=2)[0] == 8.0
+
+# A worker that died anyway is replaced on the next submit
+dead = threading.Thread(target=lambda: None)
+dead.start()
+dead.join()
+batcher._worker = dead
+
+assert batcher.predict(np.array([5.0]), timeout=2)[0] == 10.0
+
+print("Worker survives BaseException and is restarted when dead")
+
+print("Inference batcher checks passed")
@@ -0,0 +1,164 @@
+import os
+import time
+import tempfile
+import threading
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+from baseline.feature_compiler import RAW_FEATURES
+from baseline import model_bundle
+from baseline.model_bundle import BundleWatcher, file_sha256, load_bundle, write_bundle
+
+
+warnings.simplefilter("ignore", UserWarning)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "..", "data", "raw", "crop_recommendation_noisy.csv")
+
+model = joblib.load(os.path.join(BASE_DIR, "crop_model.pkl"))
+scaler = joblib.load(os.path.join(BASE_DIR, "scaler.pkl"))
+feature_order = joblib.load(os.path.join(BASE_DIR, "model_features.pkl"))
+data_hash = file_sha256(DATA_PATH)
+
+data = pd.read_csv(DATA_PATH).dropna()
+raw = data[list(RAW_FEATURES)].to_numpy(dtype=np.float64)
+
+tmp_dir = tempfile.TemporaryDirectory()
+path = os.path.join(tmp_dir.name, "crop_model.bundle.npz")
+
+
+# Bundle predictions on raw rows match the sklearn pipeline
+version = write_bundle(path, model, scaler, feature_order, data_hash, {"accuracy": 0.94})
+bundle = load_bundle(path)
+
+features = bundle.compiler.transform(raw)
+expected = model.predict_proba(scaler.transform(pd.DataFrame(features, columns=feature_order)))
+
+assert bundle.version == version
+assert bundle.metadata["data_sha256"] == data_hash
+assert list(bundle.classes_) == list(model.classes_)
+assert np.abs(bundle.predict_proba(raw) - expected).max() == 0.0
+assert isinstance(bundle.forest.feature, np.memmap)
+assert bundle.sklearn_model() is None, "Bundle without a source model has no fallback"
+
+
+# Large batches go to the source sklearn forest while its pickle matches
+source_path = os.path.join(tmp_dir.name, "crop_model_source.pkl")
+source_bundle_path = os.path.join(tmp_dir.name, "crop_model_source.bundle.npz")
+
+source_model = RandomForestClassifier(n_estimators=10, random_state=0)
+source_model.fit(scaler.transform(pd.DataFrame(features, columns=feature_order)), data["label"])
+joblib.dump(source_model, source_path)
+
+write_bundle(source_bundle_path, source_model, scaler, feature_order, data_hash, sklearn_path=source_path)
+
+flat_rows = []
+
+
+def counting(forest):
+    predict_proba = forest.predict_proba
+
+    def wrapper(X):
+        flat_rows.append(len(X))
+        return predict_proba(X)
+
+    forest.predict_proba = wrapper
+
+
+source_bundle = load_bundle(source_bundle_path)
+counting(source_bundle.forest)
+
+large = raw[:model_bundle.FLAT_FOREST_MAX_ROWS + 1]
+small = raw[:model_bundle.FLAT_FOREST_MAX_ROWS]
+
+source_expected = source_model.predict_proba(
+    scaler.transform(pd.DataFrame(source_bundle.compiler.transform(large), columns=feature_order))
+)
+
+assert np.abs(source_bundle.predict_proba(large) - source_expected).max() == 0.0
+assert np.abs(source_bundle.predict_proba(small) - source_expected[:-1]).max() == 0.0
+assert flat_rows == [len(small)], flat_rows
+assert source_bundle.info()["sklearn_fallback"]
+
+# A pickle from another training run is never paired with this bundle
+other_model = RandomForestClassifier(n_estimators=3, random_state=1)
+other_model.fit(scaler.transform(pd.DataFrame(features, columns=feature_order)), data["label"])
+joblib.dump(other_model, source_path)
+
+stale_bundle = load_bundle(source_bundle_path)
+counting(stale_bundle.forest)
+flat_rows.clear()
+
+assert stale_bundle.sklearn_model() is None
+assert np.abs(stale_bundle.predict_proba(large) - source_expected).max() == 0.0
+assert flat_rows == [len(large)], flat_rows
+assert not stale_bundle.info()["sklearn_fallback"]
+
+os.remove(source_path)
+assert load_bundle(source_bundle_path).sklearn_model() is None
+
+print(f"Batches over {model_bundle.FLAT_FOREST_MAX_ROWS} rows use the matching sklearn forest only")
+
+
+# Hot swap while readers keep predicting
+active = {"bundle": bundle}
+errors = []
+stop = threading.Event()
+
+
+def reader():
+    while not stop.is_set():
+        current = active["bundle"]
+        try:
+            probabilities = current.predict_proba(raw[:8])
+            assert probabilities.shape == (8, len(current.classes_))
+        except Exception as e:
+            errors.append(e)
+
+
+watcher = BundleWatcher(
+    path, load_bundle, lambda new: active.update(bundle=new), interval=0
+)
+
+readers = [threading.Thread(target=reader) for _ in range(4)]
+for thread in readers:
+    thread.start()
+
+small_model = RandomForestClassifier(n_estimators=10, random_state=0)
+small_model.fit(scaler.transform(pd.DataFrame(features, columns=feature_order)), data["label"])
+
+time.sleep(1.1)  # versions have one-second resolution
+write_bundle(path, small_model, scaler, feature_order, data_hash, {"accuracy": 0.9})
+
+assert watcher.check(), "Replaced bundle was not picked up"
+time.sleep(0.2)
+
+stop.set()
+for thread in readers:
+    thread.join()
+
+assert not errors, errors[:3]
+assert len(active["bundle"].forest.roots) == 10
+assert active["bundle"].version != version
+assert not watcher.check(), "Unchanged bundle reloaded"
+
+
+# A broken bundle is rejected and the current one kept
+with open(path + ".tmp", "wb") as f:
+    f.write(b"not a bundle")
+os.replace(path + ".tmp", path)
+
+current = active["bundle"]
+assert not watcher.check()
+assert active["bundle"] is current
+assert watcher.failures == 1
+
+tmp_dir.cleanup()
+
+print("Bundle version:", version)
+print("Swaps:", watcher.swaps, "Failures:", watcher.failures)
+print("Model bundle load, parity and hot swap OK")
@@ -0,0 +1,123 @@
+import numpy as np
+
+from baseline import monte_carlo_service
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import (
+    default_weather_std,
+    expected_viability,
+    monte_carlo_weather_viability,
+    monte_carlo_weather_viability_batch
+)
+
+
+crops = sorted(CROP_PROFILES)
+
+
+def seed(value):
+    monte_carlo_service._rng = np.random.default_rng(value)
+
+
+# =====================================
+# SAME DRAWS, SAME RESULT PER CROP
+# =====================================
+
+for rainfall, temperature in [(150, 28), (60, 20), (600, 24)]:
+    for sampler in ("random", "antithetic", "latin_hypercube"):
+        seed(3)
+        batch = monte_carlo_weather_viability_batch(
+            crops + ["not-a-crop"], rainfall, temperature,
+            simulations=2000, sampler=sampler
+        )
+
+        for crop in crops:
+            # Replay the draws the batch shared
+            seed(3)
+            single = monte_carlo_weather_viability(
+                crop, rainfall, temperature, simulations=2000, sampler=sampler
+            )
+
+            assert batch[crop] == {**single, "crop": crop}, (crop, sampler, batch[crop], single)
+
+        assert batch["not-a-crop"]["probability"] == 0.0
+
+print(f"Batch results equal single calls on the same draws for {len(crops)} crops")
+
+
+# =====================================
+# RANKING STABILITY
+# =====================================
+
+RUNS = 200
+SIMULATIONS = 500
+
+
+def rankings(rainfall, temperature):
+    """
+    Probabilities from RUNS shared-draw batches and RUNS sets of
+    independent single-crop calls, plus the quadrature reference.
+    """
+
+    rainfall_std, temperature_std = default_weather_std(rainfall)
+
+    reference = np.array([
+        expected_viability(
+            CROP_PROFILES[crop], rainfall, rainfall_std, temperature, temperature_std,
+            mode="quadrature"
+        )
+        for crop in crops
+    ])
+
+    shared, independent = [], []
+
+    for _ in range(RUNS):
+        batch = monte_carlo_weather_viability_batch(
+            crops, rainfall, temperature, simulations=SIMULATIONS
+        )
+        shared.append([batch[crop]["probability"] for crop in crops])
+        independent.append([
+            monte_carlo_weather_viability(
+                crop, rainfall, temperature, simulations=SIMULATIONS
+            )["probability"]
+            for crop in crops
+        ])
+
+    return reference, np.array(shared), np.array(independent)
+
+
+def top_3_agreement(reference, runs):
+    expected = set(np.argsort(-reference)[:3])
+    return np.mean([set(np.argsort(-row, kind="stable")[:3]) == expected for row in runs])
+
+
+def close_pair_flips(reference, runs):
+    """
+    Share of runs ordering two crops within 0.03 of each other
+    differently from the reference.
+    """
+
+    gaps = reference[:, None] - reference[None, :]
+    close = (np.abs(gaps) < 0.03) & (np.abs(gaps) > 0.002)
+
+    estimated = runs[:, :, None] - runs[:, None, :]
+
+    return np.mean((np.sign(estimated) != np.sign(gaps))[:, close])
+
+
+seed(5)
+
+reference, shared, independent = rankings(150, 28)
+shared_top, independent_top = top_3_agreement(reference, shared), top_3_agreement(reference, independent)
+
+assert shared_top >= 0.97, shared_top
+assert shared_top >= independent_top + 0.1, (shared_top, independent_top)
+
+print(f"150 mm / 28 C, top 3 matches the reference: shared draws {shared_top:.0%}, independent {independent_top:.0%}")
+
+reference, shared, independent = rankings(100, 25)
+shared_flips, independent_flips = close_pair_flips(reference, shared), close_pair_flips(reference, independent)
+
+assert shared_flips < 0.75 * independent_flips, (shared_flips, independent_flips)
+
+print(f"100 mm / 25 C, close pairs misordered: shared draws {shared_flips:.1%}, independent {independent_flips:.1%}")
+
+print("Monte Carlo batch checks passed")
@@ -0,0 +1,135 @@
+import math
+import random
+
+import numpy as np
+
+from baseline import monte_carlo_service
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import (
+    classify_viability,
+    combined_suitability,
+    default_weather_std,
+    gaussian_suitability,
+    monte_carlo_weather_viability
+)
+
+
+def loop_score(rain, temp, profile):
+    """
+    Reference: one sample scored the way the original random.gauss
+    loop did it.
+    """
+
+    rain_score = gaussian_suitability(rain, profile["rainfall_min"], profile["rainfall_max"])
+    temp_score = gaussian_suitability(temp, profile["temp_min"], profile["temp_max"])
+
+    combined_score = (rain_score * 0.6) + (temp_score * 0.4)
+
+    if combined_score < 0.4:
+        combined_score *= 0.7
+
+    return combined_score
+
+
+def loop_viability(profile, rain_mean, rain_std, temp_mean, temp_std, simulations):
+    """
+    Reference: the original per-sample loop, returning the mean score
+    and its standard error.
+    """
+
+    scores = []
+
+    for _ in range(simulations):
+        rain = max(0, random.gauss(rain_mean, rain_std))
+        temp = random.gauss(temp_mean, temp_std)
+        scores.append(loop_score(rain, temp, profile))
+
+    return np.mean(scores), np.std(scores) / math.sqrt(simulations)
+
+
+WEATHER_CASES = [(150, 28), (60, 20), (8, 31), (600, 24)]
+
+random.seed(0)
+monte_carlo_service._rng = np.random.default_rng(0)
+
+
+# =====================================
+# SAME DRAWS, SAME SCORES
+# =====================================
+
+rng = np.random.default_rng(1)
+
+for crop, profile in CROP_PROFILES.items():
+    rain = np.maximum(rng.normal(150, 60, 400), 0.0)
+    temp = rng.normal(26, 6, 400)
+
+    vectorized = combined_suitability(rain, temp, profile)
+    looped = [loop_score(r, t, profile) for r, t in zip(rain.tolist(), temp.tolist())]
+
+    assert np.allclose(vectorized, looped, rtol=0, atol=1e-12), crop
+
+print(f"Vectorized scores match the loop sample for sample on {len(CROP_PROFILES)} crops")
+
+
+# =====================================
+# ESTIMATES AGREE WITHIN SAMPLING ERROR
+# =====================================
+
+SIMULATIONS = 20000
+
+worst = 0.0
+
+for rainfall, temperature in WEATHER_CASES:
+    rainfall_std, temperature_std = default_weather_std(rainfall)
+
+    for crop, profile in CROP_PROFILES.items():
+        looped, standard_error = loop_viability(
+            profile, rainfall, rainfall_std, temperature, temperature_std, SIMULATIONS
+        )
+
+        vectorized = monte_carlo_weather_viability(
+            crop, rainfall, temperature, simulations=SIMULATIONS
+        )["probability"]
+
+        # Two independent estimates, plus rounding to 3 places
+        tolerance = 4 * math.sqrt(2) * standard_error + 0.0005
+        error = abs(vectorized - looped)
+        worst = max(worst, error / tolerance)
+
+        assert error <= tolerance, (crop, rainfall, temperature, vectorized, looped)
+
+print(f"Vectorized vs loop estimates within tolerance (worst {worst:.0%} of it)")
+
+
+# =====================================
+# RESULT SCHEMA AND RISK BANDS
+# =====================================
+
+for probability, risk_level in [
+    (0.0, "High"), (0.449, "High"), (0.45, "Moderate"),
+    (0.699, "Moderate"), (0.70, "Low"), (1.0, "Low")
+]:
+    assert classify_viability(probability) == risk_level, probability
+
+for rainfall, temperature in WEATHER_CASES:
+    for crop in CROP_PROFILES:
+        result = monte_carlo_weather_viability(crop.title(), rainfall, temperature, simulations=500)
+
+        assert set(result) == {"crop", "probability", "risk_level", "simulations"}, result
+        assert result["crop"] == crop.title()
+        assert result["simulations"] == 500
+        assert 0.0 <= result["probability"] <= 1.0
+        assert result["probability"] == round(result["probability"], 3)
+        assert result["risk_level"] == classify_viability(result["probability"])
+
+for crop, rainfall in [("not-a-crop", 150), ("rice", 0), ("rice", -20)]:
+    assert monte_carlo_weather_viability(crop, rainfall, 28, simulations=500) == {
+        "crop": crop,
+        "probability": 0.0,
+        "risk_level": "High",
+        "simulations": 500
+    }
+
+print("Result schema and risk bands checked")
+
+print("Vectorized Monte Carlo checks passed")
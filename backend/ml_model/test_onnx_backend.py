@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from feature_engineering import add_features
+from baseline.onnx_backend import OnnxForest, export_onnx
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "..", "data", "raw", "crop_recommendation_noisy.csv")
+
+model = joblib.load(os.path.join(BASE_DIR, "crop_model.pkl"))
+scaler = joblib.load(os.path.join(BASE_DIR, "scaler.pkl"))
+feature_order = joblib.load(os.path.join(BASE_DIR, "model_features.pkl"))
+
+# Dataset rows plus random rows around them
+data = add_features(pd.read_csv(DATA_PATH).dropna())[feature_order]
+rng = np.random.default_rng(7)
+
+X = np.vstack([
+    data.to_numpy(dtype=np.float64),
+    rng.normal(data.mean(), data.std(), size=(2000, len(feature_order)))
+])
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "crop_model.onnx")
+    export_onnx(model, scaler, path)
+    onnx_model = OnnxForest(path)
+
+    onnx_proba = onnx_model.predict_proba(X)
+
+expected = model.predict_proba(scaler.transform(pd.DataFrame(X, columns=feature_order)))
+
+max_error = float(np.abs(onnx_proba - expected).max())
+labels_match = np.array_equal(onnx_proba.argmax(axis=1), expected.argmax(axis=1))
+
+assert list(onnx_model.classes_) == list(model.classes_)
+assert max_error <= 1e-4, f"ONNX probabilities differ by {max_error}"
+assert labels_match, "ONNX predicted labels differ from sklearn"
+
+print("Rows checked:", len(X))
+print("Max probability difference:", max_error)
+print("Labels match:", labels_match)
@@ -0,0 +1,107 @@
+import os
+
+os.environ.setdefault("WEATHER_PROVIDER", "synthetic")
+os.environ.setdefault("MODEL_RELOAD_INTERVAL", "0")
+os.environ.setdefault("RANKING_MODE", "full")
+
+from baseline import recommendation_service as service
+from baseline.model_bundle import load_bundle
+
+
+# Weather the service sees, changed between calls by the test
+weather = {
+    "current_temperature": 26.0,
+    "weekly_avg_temperature": 26.0,
+    "weekly_max_temperature": 30.0,
+    "weekly_min_temperature": 22.0,
+    "weekly_avg_humidity": 80.0,
+    "estimated_monthly_rainfall": 210.0
+}
+
+service.get_weather = lambda region: dict(weather)
+service.recommendation_cache.clear()
+
+
+def cache_status(region="chennai", include=()):
+    return service.recommend_crop(region, include=include)["cache"]
+
+
+# =====================================
+# REPEAT CALLS AND WEATHER BUCKETS
+# =====================================
+
+assert cache_status() == "miss"
+assert cache_status() == "hit"
+assert cache_status(" Chennai ") == "hit"
+
+# 26.2 and 26.0 share the 0.5 °C bucket; 26.3 rounds into the next one
+weather["weekly_avg_temperature"] = 26.2
+assert cache_status() == "hit"
+
+weather["weekly_avg_temperature"] = 26.3
+assert cache_status() == "miss"
+assert cache_status() == "hit"
+
+weather["estimated_monthly_rainfall"] = 218.0
+assert cache_status() == "miss"
+
+key = service.recommendation_cache_key("chennai", weather, month=1)
+assert key != service.recommendation_cache_key("chennai", weather, month=7)
+
+print("Repeat calls hit; crossing a weather bucket boundary misses")
+
+
+# =====================================
+# BUNDLE SWAP
+# =====================================
+
+original = service.active_bundle
+
+replacement = load_bundle(original.path)
+replacement.version = f"{original.version}-retrained"
+
+before = service.recommendation_cache_key("chennai", weather, month=1)
+
+service.swap_bundle(replacement)
+
+try:
+    assert service.recommendation_cache_key("chennai", weather, month=1) != before
+    assert service.recommendation_cache.stats()["entries"] == 0
+    assert cache_status() == "miss"
+    assert cache_status() == "hit"
+finally:
+    service.swap_bundle(original)
+
+assert cache_status() == "miss"
+
+print("New bundle version invalidates cached results")
+
+
+# =====================================
+# NAMED CROPS IN THE KEY
+# =====================================
+
+# Full ranking scores every crop, so named crops share the entry
+assert service.recommendation_cache_key("chennai", weather, include=("apple",)) == \
+    service.recommendation_cache_key("chennai", weather)
+assert cache_status(include=["Apple"]) == "hit"
+
+service.RANKING_MODE = "two_stage"
+service.recommendation_cache.clear()
+
+try:
+    assert service.recommendation_cache_key("chennai", weather, include=("apple",)) != \
+        service.recommendation_cache_key("chennai", weather)
+
+    assert cache_status() == "miss"
+    assert cache_status(include=["apple"]) == "miss"
+    assert cache_status(include=[" Apple", "apple"]) == "hit"
+
+    result = service.recommend_crop("chennai", include=["apple"])
+    assert "apple" in [item["crop"] for item in result["all_scores"]]
+finally:
+    service.RANKING_MODE = "full"
+
+print("Two-stage ranking keys results by the crops that must be scored")
+
+print("Recommendation cache checks passed")
@@ -0,0 +1,82 @@
+import os
+import time
+import shutil
+import tempfile
+
+import pandas as pd
+
+from baseline.reference_data import DATA_DIR, ReferenceDataStore
+
+
+TABLES = sorted(
+    name[:-4] for name in os.listdir(DATA_DIR) if name.endswith(".csv")
+)
+
+work_dir = tempfile.mkdtemp()
+cache_dir = os.path.join(work_dir, "cache")
+
+
+# =====================================
+# BINARY CACHE PARITY
+# =====================================
+
+cold = ReferenceDataStore(cache_dir=cache_dir, check_interval=0)
+
+start = time.perf_counter()
+for name in TABLES:
+    cold.table(name)
+cold_ms = (time.perf_counter() - start) * 1000
+
+warm = ReferenceDataStore(cache_dir=cache_dir, check_interval=0)
+
+start = time.perf_counter()
+for name in TABLES:
+    warm.table(name)
+warm_ms = (time.perf_counter() - start) * 1000
+
+assert cold.parses == len(TABLES) and cold.cache_loads == 0
+assert warm.parses == 0 and warm.cache_loads == len(TABLES)
+
+for name in TABLES:
+    pd.testing.assert_frame_equal(warm.table(name), pd.read_csv(cold.path(name)))
+    assert warm.table(name) is warm.table(name), name
+
+print(f"{len(TABLES)} tables: parsed in {cold_ms:.1f} ms, from cache in {warm_ms:.1f} ms")
+
+
+# =====================================
+# HOT RELOAD
+# =====================================
+
+data_dir = os.path.join(work_dir, "raw")
+os.makedirs(data_dir)
+shutil.copy(os.path.join(DATA_DIR, "soil_nutrients.csv"), data_dir)
+
+store = ReferenceDataStore(data_dir=data_dir, cache_dir=cache_dir, check_interval=0)
+
+builds = []
+
+
+def nutrient_index(df):
+    builds.append(1)
+    return dict(zip(df["soil_type"], df["N"]))
+
+
+assert store.view("n", nutrient_index, "soil_nutrients")["Alluvial"] == 90
+assert store.view("n", nutrient_index, "soil_nutrients")["Alluvial"] == 90
+assert len(builds) == 1
+
+path = store.path("soil_nutrients")
+edited = pd.read_csv(path)
+edited.loc[edited["soil_type"] == "Alluvial", "N"] = 95
+edited.to_csv(path, index=False)
+os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+
+assert store.view("n", nutrient_index, "soil_nutrients")["Alluvial"] == 95
+assert len(builds) == 2 and store.reloads == 1
+
+print("Edited CSV reloaded without restart, view rebuilt once")
+
+shutil.rmtree(work_dir)
+
+print("Reference data checks passed")
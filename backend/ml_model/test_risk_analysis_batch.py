@@ -0,0 +1,105 @@
+import os
+
+os.environ.setdefault("WEATHER_PROVIDER", "synthetic")
+os.environ.setdefault("ENGINE_WARMUP", "lazy")
+os.environ.setdefault("MODEL_RELOAD_INTERVAL", "0")
+
+from app import MAX_BATCH_ITEMS, app, engine
+
+
+client = app.test_client()
+
+service = engine.service
+
+
+# =====================================
+# RESPONSE SHAPE, ONE FAILING ITEM
+# =====================================
+
+get_weather_batch = service.get_weather_batch
+
+
+def weather_with_outage(regions):
+    """
+    Synthetic weather, except "atlantis" fails like a provider error.
+    """
+
+    results = get_weather_batch([region for region in regions if region != "atlantis"])
+
+    if "atlantis" in regions:
+        results["atlantis"] = RuntimeError("weather provider unavailable")
+
+    return results
+
+
+service.get_weather_batch = weather_with_outage
+
+try:
+    response = client.post("/risk-analysis/batch", json={
+        "items": [
+            {"region": "Chennai", "crop": "Rice"},
+            {"region": "atlantis", "crop": "rice"},
+            {"region": "delhi"}
+        ]
+    })
+finally:
+    service.get_weather_batch = get_weather_batch
+
+assert response.status_code == 200, response.get_json()
+
+results = response.get_json()["results"]
+assert [item["region"] for item in results] == ["chennai", "atlantis", "delhi"]
+
+chennai, atlantis, delhi = results
+
+for item in (chennai, delhi):
+    assert "error" not in item
+    assert set(item) >= {
+        "weather", "selected_crop", "model_recommendation",
+        "top_3_recommendations", "worst_recommendation", "cache"
+    }
+    assert len(item["top_3_recommendations"]) == 3
+
+assert chennai["selected_crop"]["crop"] == "rice"
+assert delhi["selected_crop"]["crop"] == ""
+assert atlantis == {
+    "region": "atlantis",
+    "crop": "rice",
+    "error": "weather provider unavailable"
+}
+
+print("Batch of 3: 2 results, 1 per-item error")
+
+
+# =====================================
+# VALIDATION
+# =====================================
+
+def rejected(items):
+    response = client.post("/risk-analysis/batch", json={"items": items})
+    assert response.status_code == 400, response.status_code
+    return response.get_json()["error"]
+
+
+assert "items[1].region" in rejected([{"region": "chennai"}, {"region": 5}])
+assert "items[0].crop" in rejected([{"region": "chennai", "crop": None}])
+assert "items[0].region" in rejected([{"crop": "rice"}])
+assert "items" in rejected([])
+
+# Valid JSON that is not an object
+for body in ([{"region": "chennai"}], "chennai", 5, True):
+    response = client.post("/risk-analysis/batch", json=body)
+    assert response.status_code == 400, (body, response.status_code)
+    assert response.get_json() == {"error": "JSON body must be an object"}
+
+assert "At most" in rejected([{"region": "chennai"}] * (MAX_BATCH_ITEMS + 1))
+
+response = client.post("/risk-analysis/batch", json={
+    "items": [{"region": "chennai"}] * MAX_BATCH_ITEMS
+})
+assert response.status_code == 200
+assert len(response.get_json()["results"]) == MAX_BATCH_ITEMS
+
+print(f"Non-object bodies and non-string fields rejected with 400, limit of {MAX_BATCH_ITEMS} items enforced")
+
+print("Batch endpoint checks passed")
@@ -0,0 +1,93 @@
+import time
+
+import pandas as pd
+
+from baseline.reference_data import reference_data
+from baseline.soil_service import (
+    SOIL_NUTRIENTS_COLUMNS,
+    SOIL_TYPES_COLUMNS,
+    build_soil_index,
+    get_soil_data,
+    normalize,
+    prepare_table
+)
+
+
+soil_types_df = prepare_table(
+    reference_data.table("soil_types"), "soil_types", SOIL_TYPES_COLUMNS
+)
+soil_nutrients_df = prepare_table(
+    reference_data.table("soil_nutrients"), "soil_nutrients", SOIL_NUTRIENTS_COLUMNS
+)
+
+
+def pandas_lookup(region):
+    """
+    Reference: the per-request pandas filtering the index replaced.
+    """
+
+    rows = soil_types_df[soil_types_df["region"].str.lower() == normalize(region)]
+    row = rows.iloc[0]
+
+    base = None
+    for base_type in soil_nutrients_df["soil_type"].unique():
+        if normalize(base_type) in normalize(row["soil_type"]):
+            base = base_type
+            break
+
+    nutrients = soil_nutrients_df[
+        soil_nutrients_df["soil_type"].str.lower() == normalize(base)
+    ].iloc[0]
+
+    return {
+        "region": row["region"],
+        "soil_type": row["soil_type"],
+        "base_soil_type": base,
+        "N": float(nutrients["n"]),
+        "P": float(nutrients["p"]),
+        "K": float(nutrients["k"]),
+        "ph": float(row["ph"])
+    }
+
+
+# =====================================
+# PARITY
+# =====================================
+
+for region in soil_types_df["region"]:
+    assert get_soil_data(region) == pandas_lookup(region), region
+    assert get_soil_data(f"  {region.upper()} ") == pandas_lookup(region), region
+
+print(f"Indexed lookup matches pandas filtering for {len(soil_types_df)} regions")
+
+fallback = get_soil_data("atlantis")
+assert fallback["region"] == "atlantis" and fallback["base_soil_type"] == "Loam"
+
+
+# =====================================
+# DISTRICT-SCALE INDEX
+# =====================================
+
+DISTRICTS = 50_000
+
+districts = pd.DataFrame({
+    "region": [f"District {i}" for i in range(DISTRICTS)],
+    "soil_type": [soil_types_df["soil_type"].iloc[i % len(soil_types_df)] for i in range(DISTRICTS)],
+    "ph": [5.5 + (i % 30) / 10 for i in range(DISTRICTS)]
+})
+
+start = time.perf_counter()
+index = build_soil_index(districts, soil_nutrients_df)
+build_ms = (time.perf_counter() - start) * 1000
+
+assert len(index) == DISTRICTS
+assert index["district 12345"]["ph"] == 5.5 + (12345 % 30) / 10
+
+start = time.perf_counter()
+for i in range(DISTRICTS):
+    index[normalize(f"District {i}")]
+lookup_us = (time.perf_counter() - start) * 1e6 / DISTRICTS
+
+print(f"{DISTRICTS} regions: index built in {build_ms:.0f} ms, {lookup_us:.2f} µs per lookup")
+
+print("Soil index checks passed")
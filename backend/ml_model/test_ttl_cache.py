@@ -0,0 +1,166 @@
+import os
+import threading
+
+os.environ.setdefault("WEATHER_PROVIDER", "synthetic")
+
+from baseline import ttl_cache
+from baseline import weather_service
+from baseline.ttl_cache import TTLCache
+from baseline.weather_providers import SyntheticWeatherProvider
+
+
+class FakeClock:
+    """
+    Stands in for the time module so ages move only when advanced.
+    """
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def wait_until(condition, timeout=5.0):
+    pause = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return True
+        pause.wait(0.01)
+    return condition()
+
+
+clock = FakeClock()
+
+ttl_cache.time = clock
+weather_service.time = clock
+
+
+# =====================================
+# LRU EVICTION
+# =====================================
+
+cache = TTLCache(ttl=60, max_stale=300, max_entries=3)
+
+for key in ("a", "b", "c"):
+    cache.store(key, key.upper())
+
+# Touch "a" so "b" becomes least recently used
+assert cache.lookup("a") == ("A", 0.0)
+
+cache.store("d", "D")
+
+assert cache.lookup("b") is None
+assert [cache.lookup(key)[0] for key in ("a", "c", "d")] == ["A", "C", "D"]
+assert cache.stats()["entries"] == 3
+
+print("Least recently used entry evicted at max_entries")
+
+
+# =====================================
+# TTL AND MAX STALE
+# =====================================
+
+cache = TTLCache(ttl=60, max_stale=300, max_entries=8)
+cache.store("chennai", "old")
+
+clock.advance(30)
+assert cache.lookup("chennai") == ("old", 30.0)
+
+clock.advance(100)
+assert cache.lookup("chennai") == ("old", 130.0)
+
+clock.advance(200)
+assert cache.lookup("chennai") is None
+assert cache.stats()["entries"] == 0
+
+stats = cache.stats()
+assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 1)
+assert stats["hit_rate"] == round(2 / 3, 4)
+
+assert cache.start_refresh("chennai")
+assert not cache.start_refresh("chennai")
+cache.finish_refresh("chennai", failed=True)
+assert cache.start_refresh("chennai")
+assert cache.stats()["refresh_errors"] == 1
+
+print("Fresh, stale and expired reads counted:", {
+    key: stats[key] for key in ("hits", "stale_hits", "misses")
+})
+
+
+# =====================================
+# STALE-WHILE-REVALIDATE IN get_weather
+# =====================================
+
+class CountingProvider(SyntheticWeatherProvider):
+    """
+    Synthetic forecasts that change on every call; calls after the
+    first block until released.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.release = threading.Event()
+        self.refreshed = threading.Event()
+
+    def forecast(self, region):
+        self.calls += 1
+
+        if self.calls > 1:
+            self.release.wait(5)
+
+        self.seed = self.calls
+        payload = super().forecast(region)
+
+        if self.calls > 1:
+            self.refreshed.set()
+
+        return payload
+
+
+provider = CountingProvider()
+weather_service.set_weather_provider(provider)
+
+weather_cache = weather_service.weather_cache
+weather_cache.ttl, weather_cache.max_stale = 60, 300
+
+misses = weather_cache.misses
+stale_hits = weather_cache.stale_hits
+
+first = weather_service.get_weather("Chennai")
+assert provider.calls == 1
+assert weather_cache.misses == misses + 1
+
+clock.advance(120)
+
+# Every stale read returns the old value without waiting for the API
+stale_reads = [weather_service.get_weather("chennai") for _ in range(5)]
+
+assert all(read == first for read in stale_reads)
+assert weather_cache.stale_hits == stale_hits + 5
+assert wait_until(lambda: provider.calls >= 2)
+assert provider.calls == 2, f"expected one background refresh, got {provider.calls - 1}"
+
+provider.release.set()
+assert provider.refreshed.wait(5)
+
+# finish_refresh runs right after the store
+assert wait_until(lambda: "chennai" not in weather_cache._refreshing)
+
+hits = weather_cache.hits
+refreshed = weather_service.get_weather("chennai")
+
+assert refreshed != first
+assert weather_cache.hits == hits + 1
+assert provider.calls == 2
+
+print("5 stale reads served the old forecast during a single background refresh")
+
+weather_service.set_weather_provider(SyntheticWeatherProvider())
+
+print("TTL cache checks passed")
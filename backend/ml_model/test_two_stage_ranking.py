@@ -0,0 +1,54 @@
+import numpy as np
+
+from baseline import recommendation_service as service
+from baseline.feature_compiler import raw_features
+
+
+soil = {"N": 85.0, "P": 45.0, "K": 40.0, "ph": 6.4}
+weather = {
+    "weekly_avg_temperature": 26.0,
+    "weekly_avg_humidity": 80.0,
+    "estimated_monthly_rainfall": 210.0
+}
+
+crop_classes, probabilities = service.predict_raw([raw_features(soil, weather)])[0]
+
+full = service.score_recommendation(
+    "chennai", soil, weather, probabilities, crop_classes, ranking="full"
+)
+two_stage = service.score_recommendation(
+    "chennai", soil, weather, probabilities, crop_classes,
+    include=["apple"], ranking="two_stage", top_k=4
+)
+
+
+# =====================================
+# CANDIDATES
+# =====================================
+
+evaluated = [item["crop"] for item in two_stage["all_scores"]]
+
+assert "ranking" not in full and len(full["all_scores"]) == len(crop_classes)
+assert "apple" in evaluated, "named crops must always be scored"
+assert len(evaluated) <= 4 + service.TWO_STAGE_BOTTOM_K + 1
+assert two_stage["ranking"]["evaluated"] + two_stage["ranking"]["screened_out"] == len(crop_classes)
+
+assert [item["crop"] for item in two_stage["top_3"]] == [item["crop"] for item in full["top_3"]]
+
+print("Two-stage top 3:", [item["crop"] for item in two_stage["top_3"]], "from", len(evaluated), "scored crops")
+
+
+# =====================================
+# CANDIDATE SELECTION
+# =====================================
+
+table = service.crop_table(crop_classes)
+prescores = np.arange(len(table), dtype=float)
+
+rows = service.two_stage_candidates(prescores, table, 3, include=["mango", "unknown"])
+
+assert rows.tolist() == sorted(
+    {len(table) - 1, len(table) - 2, len(table) - 3, 0, 1, table.index["mango"]}
+)
+
+print("Two-stage ranking checks passed")
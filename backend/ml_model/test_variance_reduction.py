@@ -0,0 +1,111 @@
+import numpy as np
+from scipy.special import ndtr
+
+from baseline import monte_carlo_service
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import (
+    SAMPLERS,
+    default_weather_std,
+    estimate_viability,
+    expected_viability,
+    monte_carlo_weather_viability,
+    monte_carlo_weather_viability_batch,
+    standard_normal_draws
+)
+
+
+SIMULATIONS = 512
+REPEATS = 400
+
+# Quadrature is within 0.001 of a 1M-sample reference (test_viability_modes)
+REFERENCE_ERROR = 0.001
+
+CASES = [
+    ("rice", 150, 28),
+    ("maize", 60, 20),
+    ("apple", 120, 20),
+    ("banana", 200, 30)
+]
+
+monte_carlo_service._rng = np.random.default_rng(17)
+
+
+# =====================================
+# DRAWS
+# =====================================
+
+for sampler in SAMPLERS:
+    for simulations in (1, 7, 512):
+        draws = standard_normal_draws(simulations, sampler)
+        assert draws.shape == (2, simulations), (sampler, draws.shape)
+        assert np.isfinite(draws).all(), sampler
+
+antithetic = standard_normal_draws(8, "antithetic")
+assert np.array_equal(antithetic[:, 4:], -antithetic[:, :4])
+
+# One draw per probability stratum in each dimension
+strata = np.sort(np.floor(ndtr(standard_normal_draws(64, "latin_hypercube")) * 64), axis=1)
+assert (strata == np.arange(64)).all()
+
+print("Every sampler returns (2, n) standard normal draws")
+
+
+# =====================================
+# VARIANCE AND BIAS ACROSS SEEDS
+# =====================================
+
+for crop, rainfall, temperature in CASES:
+    profile = CROP_PROFILES[crop]
+    rainfall_std, temperature_std = default_weather_std(rainfall)
+    weather = (rainfall, rainfall_std, temperature, temperature_std)
+
+    expected = expected_viability(profile, *weather, mode="quadrature")
+
+    variances = {}
+
+    for sampler in SAMPLERS:
+        for control_variate in (False, True):
+            estimates = np.array([
+                estimate_viability(
+                    profile, *weather, SIMULATIONS,
+                    sampler=sampler, control_variate=control_variate
+                )
+                for _ in range(REPEATS)
+            ])
+
+            label = f"{sampler}+cv" if control_variate else sampler
+            variances[label] = estimates.var(ddof=1)
+
+            standard_error = np.sqrt(variances[label] / REPEATS)
+            bias = estimates.mean() - expected
+
+            assert abs(bias) <= 4 * standard_error + REFERENCE_ERROR, (crop, label, bias)
+
+    for label, variance in variances.items():
+        if label != "random":
+            assert variance < variances["random"], (crop, label, variance, variances["random"])
+
+    print(f"{crop} {rainfall} mm / {temperature} C, variance vs random: " + ", ".join(
+        f"{label} {variances[label] / variances['random']:.3f}"
+        for label in variances if label != "random"
+    ))
+
+
+# =====================================
+# UNKNOWN SAMPLER
+# =====================================
+
+for call in (
+    lambda: standard_normal_draws(100, "halton"),
+    lambda: monte_carlo_weather_viability("rice", 150, 28, sampler="halton"),
+    lambda: monte_carlo_weather_viability_batch(["rice"], 150, 28, sampler="halton")
+):
+    try:
+        call()
+        raise AssertionError("unknown sampler accepted")
+    except ValueError as e:
+        assert "Unsupported sampler: halton" in str(e)
+
+print("Unknown sampler rejected")
+
+print("Variance reduction checks passed")
@@ -0,0 +1,30 @@
+import numpy as np
+
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import monte_carlo_weather_viability
+from baseline.viability_grid import GRID_ERROR_BOUND, viability_grid_batch
+
+
+# Grid lookup vs direct quadrature at random off-grid weather
+rng = np.random.default_rng(7)
+
+crops = list(CROP_PROFILES)
+worst = 0.0
+
+for rainfall, temperature in zip(
+    rng.uniform(1, 1000, 50),
+    rng.uniform(0, 45, 50)
+):
+    grid_results = viability_grid_batch(crops, rainfall, temperature)
+
+    for crop in crops:
+        exact = monte_carlo_weather_viability(
+            crop, rainfall, temperature, mode="quadrature"
+        )["probability"]
+
+        error = abs(grid_results[crop]["probability"] - exact)
+        worst = max(worst, error)
+
+assert worst <= GRID_ERROR_BOUND, f"Grid error {worst} exceeds {GRID_ERROR_BOUND}"
+
+print("Max grid interpolation error:", round(worst, 4))
@@ -0,0 +1,43 @@
+from baseline.crop_profiles import CROP_PROFILES
+from baseline.monte_carlo_service import monte_carlo_weather_viability
+
+
+# Sampling-free modes vs a 1M-sample Monte Carlo reference
+REFERENCE_SIMULATIONS = 1_000_000
+
+TOLERANCE = {
+    "quadrature": 0.005,
+    "analytic": 0.035
+}
+
+WEATHER_CASES = [
+    (150, 28),
+    (60, 20),
+    (8, 31),
+    (600, 24)
+]
+
+worst = {mode: 0.0 for mode in TOLERANCE}
+
+for rainfall, temperature in WEATHER_CASES:
+    for crop in CROP_PROFILES:
+
+        reference = monte_carlo_weather_viability(
+            crop, rainfall, temperature,
+            simulations=REFERENCE_SIMULATIONS
+        )["probability"]
+
+        for mode in TOLERANCE:
+            estimate = monte_carlo_weather_viability(
+                crop, rainfall, temperature, mode=mode
+            )["probability"]
+
+            error = abs(estimate - reference)
+            worst[mode] = max(worst[mode], error)
+
+            assert error <= TOLERANCE[mode], (
+                f"{mode} {crop} rain={rainfall} temp={temperature}: "
+                f"{estimate} vs {reference}"
+            )
+
+print("Max absolute error vs 1M-sample reference:", worst)
@@ -0,0 +1,101 @@
+import os
+import time
+import threading
+
+os.environ.setdefault("WEATHER_PROVIDER", "synthetic")
+
+from baseline import weather_service
+from baseline.weather_providers import SyntheticWeatherProvider
+
+
+class SlowProvider(SyntheticWeatherProvider):
+    """
+    Synthetic forecasts with a fixed latency per call, recording how
+    many calls overlap.
+    """
+
+    def __init__(self, latency=0.05, slow_regions=(), slow_latency=1.0):
+        super().__init__()
+        self.latency = latency
+        self.slow_regions = set(slow_regions)
+        self.slow_latency = slow_latency
+
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def forecast(self, region):
+
+        with self._lock:
+            self.calls.append(region)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            time.sleep(self.slow_latency if region in self.slow_regions else self.latency)
+            return super().forecast(region)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+regions = [f"region-{i}" for i in range(12)]
+
+
+# =====================================
+# CONCURRENCY CAP
+# =====================================
+
+provider = SlowProvider()
+weather_service.set_weather_provider(provider)
+
+start = time.perf_counter()
+results = weather_service.get_weather_batch(regions, concurrency=3)
+elapsed = time.perf_counter() - start
+
+assert list(results) == regions
+assert all(isinstance(value, dict) for value in results.values())
+assert provider.max_in_flight == 3, provider.max_in_flight
+assert elapsed >= 4 * provider.latency, elapsed
+
+print(f"12 regions, concurrency 3: at most {provider.max_in_flight} in flight, {elapsed * 1000:.0f} ms")
+
+
+# =====================================
+# PER-REGION TIMEOUT
+# =====================================
+
+provider = SlowProvider(slow_regions={"region-5"})
+weather_service.set_weather_provider(provider)
+
+results = weather_service.get_weather_batch(regions, concurrency=12, deadline=0.3)
+
+assert isinstance(results["region-5"], TimeoutError), results["region-5"]
+
+for region in regions:
+    if region != "region-5":
+        assert isinstance(results[region], dict), (region, results[region])
+
+print("Timed-out region returned as its own error; the other 11 succeeded")
+
+
+# =====================================
+# DUPLICATE REGIONS
+# =====================================
+
+provider = SlowProvider()
+weather_service.set_weather_provider(provider)
+
+results = weather_service.get_weather_batch(
+    ["Chennai", "chennai ", "CHENNAI", "delhi", "Delhi"]
+)
+
+assert list(results) == ["chennai", "delhi"]
+assert sorted(provider.calls) == ["chennai", "delhi"]
+
+print("5 requested regions, 2 distinct, 2 provider calls")
+
+weather_service.set_weather_provider(SyntheticWeatherProvider())
+
+print("Weather batch checks passed")
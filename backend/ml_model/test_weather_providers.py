@@ -0,0 +1,69 @@
+import os
+import json
+import tempfile
+
+from baseline.weather_providers import (
+    ReplayWeatherProvider,
+    SyntheticWeatherProvider,
+    _fixture_path
+)
+from baseline.weather_service import derive_weather_features
+
+
+# Synthetic forecasts are reproducible per seed and region
+first = SyntheticWeatherProvider(seed=7).forecast("chennai")
+second = SyntheticWeatherProvider(seed=7).forecast("chennai")
+other = SyntheticWeatherProvider(seed=8).forecast("chennai")
+
+assert first == second
+assert first != other
+
+# Replay returns exactly what was recorded
+fixtures_dir = tempfile.mkdtemp()
+
+with open(os.path.join(fixtures_dir, "chennai.json"), "w") as f:
+    json.dump(first, f)
+
+replayed = ReplayWeatherProvider(fixtures_dir).forecast("chennai")
+
+assert replayed == first
+
+# Regions are reduced to a slug, so a traversal stays in the directory
+for region in ("../../escaped", "..", "/etc/passwd", "Tamil Nadu\\..\\x"):
+    path = _fixture_path(fixtures_dir, region)
+
+    assert os.path.dirname(os.path.abspath(path)) == os.path.abspath(fixtures_dir), path
+
+outside_dir = tempfile.mkdtemp()
+
+with open(os.path.join(outside_dir, "chennai.json"), "w") as f:
+    json.dump(other, f)
+
+
+def replay_rejected(region):
+    try:
+        ReplayWeatherProvider(fixtures_dir).forecast(region)
+    except ValueError as e:
+        return str(e)
+    else:
+        raise AssertionError(f"replay of {region!r} did not raise")
+
+
+# Relative and absolute paths into another directory
+assert "No recorded forecast" in replay_rejected("../chennai")
+assert "No recorded forecast" in replay_rejected(os.path.join(outside_dir, "chennai"))
+
+# A fixture symlinked to a file outside the directory
+os.symlink(os.path.join(outside_dir, "chennai.json"), os.path.join(fixtures_dir, "madurai.json"))
+
+assert "resolves outside" in replay_rejected("madurai")
+
+try:
+    _fixture_path(fixtures_dir, "Madurai")
+    raise AssertionError("symlinked fixture path accepted")
+except ValueError:
+    pass
+
+print("Traversal, absolute and symlinked regions stay in the fixtures directory")
+
+print(derive_weather_features("chennai", replayed))
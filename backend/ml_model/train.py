@@ -1,4 +1,6 @@
 import os
+import json
+import importlib.util
 import pandas as pd
 import joblib
 
@@ -7,7 +9,22 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report
 from sklearn.preprocessing import StandardScaler
 
-from feature_engineering import add_features
+from baseline.feature_compiler import (
+    DEFAULT_FEATURE_ORDER,
+    RAW_FEATURES,
+    FeatureCompiler
+)
+from baseline.flat_forest import FlatForest
+from baseline.model_bundle import file_sha256, write_bundle
+from baseline.model_tiers import (
+    MODEL_TIERS,
+    TIERS_REPORT_NAME,
+    bundle_path,
+    loaded_rss_mb,
+    model_path,
+    single_row_latency_ms
+)
+from baseline.onnx_backend import OnnxForest, build_onnx
 
 
 # =====================================
@@ -26,9 +43,21 @@ DATA_PATH = os.path.join(
     "crop_recommendation_noisy.csv"
 )
 
-MODEL_PATH = os.path.join(BASE_DIR, "crop_model.pkl")
+MODEL_PATH = model_path(BASE_DIR, "full")
 FEATURES_PATH = os.path.join(BASE_DIR, "model_features.pkl")
 SCALER_PATH = os.path.join(BASE_DIR, "scaler.pkl")
+TIERS_REPORT_PATH = os.path.join(BASE_DIR, TIERS_REPORT_NAME)
+
+# Comma-separated subset of MODEL_TIERS to build (default: all).
+# "full" is always built since its model is trained below anyway.
+TRAIN_MODEL_TIERS = [
+    tier.strip()
+    for tier in os.getenv("TRAIN_MODEL_TIERS", ",".join(MODEL_TIERS)).split(",")
+    if tier.strip()
+]
+
+if "full" not in TRAIN_MODEL_TIERS:
+    TRAIN_MODEL_TIERS.insert(0, "full")
 
 
 # =====================================
@@ -46,6 +75,9 @@ print(f"\nLoading dataset from: {DATA_PATH}")
 
 data = pd.read_csv(DATA_PATH)
 
+# Recorded in each model bundle
+DATA_SHA256 = file_sha256(DATA_PATH)
+
 
 # =====================================
 # Validate Columns
@@ -98,14 +130,20 @@ print("\nTotal Crop Classes:", len(unique_crops))
 # =====================================
 
 print("\nApplying feature engineering...")
-data = add_features(data)
+
+# Same compiler serving uses, so the formulas cannot drift apart
+feature_compiler = FeatureCompiler(DEFAULT_FEATURE_ORDER)
 
 
 # =====================================
 # Split Features and Labels
 # =====================================
 
-X = data.drop("label", axis=1)
+X = pd.DataFrame(
+    feature_compiler.transform(data[list(RAW_FEATURES)].to_numpy()),
+    columns=feature_compiler.feature_order,
+    index=data.index
+)
 y = data["label"]
 
 print("\nFinal Features Used:")
@@ -146,17 +184,21 @@ X_test_scaled = pd.DataFrame(
 # Train RandomForest
 # =====================================
 
+def build_forest(n_estimators, max_depth):
+    return RandomForestClassifier(
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        class_weight="balanced",
+        random_state=42,
+        n_jobs=-1
+    )
+
+
 print("\nTraining RandomForest...")
 
-model = RandomForestClassifier(
-    n_estimators=500,
-    max_depth=None,
-    min_samples_split=2,
-    min_samples_leaf=1,
-    class_weight="balanced",
-    random_state=42,
-    n_jobs=-1
-)
+model = build_forest(**MODEL_TIERS["full"])
 
 model.fit(X_train_scaled, y_train)
 
@@ -196,6 +238,8 @@ for feature, importance in importance_pairs:
 # Save Model
 # =====================================
 
+# Separate artifacts for analysis scripts; serving reads the bundles
+# written per tier below
 joblib.dump(model, MODEL_PATH)
 joblib.dump(list(X.columns), FEATURES_PATH)
 joblib.dump(scaler, SCALER_PATH)
@@ -214,4 +258,88 @@ loaded_model = joblib.load(MODEL_PATH)
 print("\nFinal Model Classes:")
 print(loaded_model.classes_)
 
+
+# =====================================
+# Model Tiers
+# =====================================
+
+print("\n=====================================")
+print("MODEL TIERS")
+print("=====================================")
+
+latency_rows = X_test_scaled.to_numpy()
+unscaled_latency_rows = X_test.to_numpy(dtype=float)
+tier_report = {}
+
+# ONNX export is skipped when skl2onnx / onnxruntime are not installed
+ONNX_EXPORT = all(
+    importlib.util.find_spec(package) is not None
+    for package in ("skl2onnx", "onnxruntime")
+)
+
+if not ONNX_EXPORT:
+    print("skl2onnx / onnxruntime not installed, skipping ONNX export")
+
+for tier in TRAIN_MODEL_TIERS:
+    params = MODEL_TIERS[tier]
+
+    if tier == "full":
+        tier_model = model
+    else:
+        tier_model = build_forest(**params)
+        tier_model.fit(X_train_scaled, y_train)
+        joblib.dump(tier_model, model_path(BASE_DIR, tier))
+
+    tier_flat = FlatForest.from_sklearn(tier_model)
+
+    tier_path = model_path(BASE_DIR, tier)
+
+    tier_report[tier] = {
+        **params,
+        "accuracy": round(accuracy_score(y_test, tier_model.predict(X_test_scaled)), 4),
+        "sklearn_row_latency_ms": round(
+            single_row_latency_ms(tier_model.predict_proba, latency_rows), 3
+        ),
+        "flat_row_latency_ms": round(
+            single_row_latency_ms(tier_flat.predict_proba, latency_rows), 3
+        ),
+        "node_count": int(len(tier_flat.feature)),
+        "pickle_mb": round(os.path.getsize(tier_path) / 1e6, 2),
+        "rss_after_load_mb": round(loaded_rss_mb(tier_path), 1)
+    }
+
+    onnx_bytes = None
+
+    if ONNX_EXPORT:
+        onnx_bytes = build_onnx(tier_model, scaler)
+        tier_onnx = OnnxForest(onnx_bytes)
+
+        tier_report[tier]["onnx_row_latency_ms"] = round(
+            single_row_latency_ms(tier_onnx.predict_proba, unscaled_latency_rows), 3
+        )
+
+    # Everything serving needs in one file, replaced atomically
+    tier_report[tier]["bundle_version"] = write_bundle(
+        bundle_path(BASE_DIR, tier),
+        tier_model,
+        scaler,
+        feature_compiler.feature_order,
+        data_hash=DATA_SHA256,
+        metrics=dict(tier_report[tier], tier=tier),
+        onnx_bytes=onnx_bytes,
+        sklearn_path=tier_path
+    )
+
+    print(f"\n{tier}:")
+    for key, value in tier_report[tier].items():
+        print(f"  {key}: {value}")
+
+    print(f"  bundle: {bundle_path(BASE_DIR, tier)}")
+
+with open(TIERS_REPORT_PATH, "w") as f:
+    json.dump(tier_report, f, indent=2)
+
+print("\nTier report path:", TIERS_REPORT_PATH)
+print("Serve a tier with MODEL_TIER=<name> (default: full)")
+
 print("\nTraining Complete Successfully.")
@@ -1,16 +1,24 @@
-import os
-import pandas as pd
+from baseline.reference_data import reference_data
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-SPOILAGE_PATH = os.path.join(BASE_DIR, "data", "raw", "crop_spoilage.csv")
+SPOILAGE_TABLE = "crop_spoilage"
 
-spoilage = pd.read_csv(SPOILAGE_PATH)
 
-if "crop_name" not in spoilage.columns:
-    raise ValueError("crop_spoilage.csv must contain 'crop_name' column")
+def spoilage_table():
+
+    spoilage = reference_data.table(SPOILAGE_TABLE)
+
+    if "crop_name" not in spoilage.columns:
+        raise ValueError("crop_spoilage.csv must contain 'crop_name' column")
+
+    return spoilage
+
+
+spoilage_table()
 
 
 def check_transport_risk(crop_name, distance_km, weather_severity):
+    spoilage = spoilage_table()
+
     crop_row = spoilage[spoilage["crop_name"] == crop_name]
 
     if crop_row.empty: